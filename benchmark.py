@@ -0,0 +1,187 @@
+import argparse
+import os
+import pickle
+import re
+import gc
+import struct
+import timeit
+import tracemalloc
+from catcodec.StructDecoder import StructDecoderFactory
+from catcodec.StructEncoder import StructEncoderFactory
+from catcodec.StructView import StructViewFactory
+from catparser.CatsParser import CatsParser
+from catparser.TypeDescriptors import descriptor_to_dict
+from generators.cpp_builder.BuilderGenerator import BuilderGenerator
+
+IMPORT_REGEX = re.compile(r'^import "([\S ]+)"$')
+USER_TYPE_NAME_REGEX = re.compile(r'\b([A-Z][a-zA-Z0-9]*)\b')
+
+
+def find_schema_files(include_path, excluded_directories):
+    """Finds all schema files below the include path that are not in an excluded directory"""
+    schema_files = []
+    for root, directories, filenames in os.walk(include_path):
+        directories[:] = [directory for directory in directories if directory not in excluded_directories]
+        schema_files += [
+            os.path.relpath(os.path.join(root, filename), include_path) for filename in filenames if filename.endswith('.cats')
+        ]
+
+    return sorted(schema_files)
+
+
+def load_schema_lines(include_path, schema_files):
+    """Loads the import closure of all schema files as a single list of lines with all imports resolved"""
+    lines = []
+    loaded_files = set()
+
+    def load(filename):
+        if filename in loaded_files:
+            return
+
+        loaded_files.add(filename)
+        with open(os.path.join(include_path, filename)) as input_file:
+            for line in input_file.readlines():
+                match = IMPORT_REGEX.match(line.strip())
+                if match:
+                    load(match.group(1))
+                else:
+                    lines.append(line)
+
+        # make sure a composite type at the end of a file is closed before the next file is appended
+        lines.append('\n')
+
+    for schema_file in schema_files:
+        load(schema_file)
+
+    return lines
+
+
+def replicate_schema_lines(lines, copies):
+    """Replicates schema lines by prefixing all user type names in each copy"""
+    replicated_lines = list(lines)
+    for i in range(1, copies):
+        prefix = 'V{0}'.format(i)
+        replicated_lines += [line if line.lstrip().startswith('#') else USER_TYPE_NAME_REGEX.sub(prefix + r'\1', line) for line in lines]
+
+    return replicated_lines
+
+
+def parse_lines(lines, use_lexer):
+    """Parses all lines and returns the parsed type descriptors"""
+    parser = CatsParser(None, use_lexer)
+    for line in lines:
+        parser.process_line(line)
+
+    return parser.type_descriptors()
+
+
+def benchmark_parse(lines, repeat):
+    print('parsing {0} lines'.format(len(lines)))
+    for mode_name, use_lexer in [('regex', False), ('lexer', True)]:
+        elapsed = min(timeit.repeat(lambda use_lexer=use_lexer: parse_lines(lines, use_lexer), number=1, repeat=repeat))
+        print('{0:>8}: {1:8.2f} ms ({2:.2f} us/line)'.format(mode_name, elapsed * 1000, elapsed * 1000000 / len(lines)))
+
+
+def measure_retained_memory(create):
+    """Gets the number of bytes retained by the object returned by create"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        retained = create()  # pylint: disable=unused-variable
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def load_pickled_copies(lines, copies):
+    """Parses each copy of the replicated lines separately and loads all of them from pickles like the parse cache does"""
+    copy_size = len(lines) // copies
+    pickled_copies = [
+        pickle.dumps(list(parse_lines(lines[i * copy_size:(i + 1) * copy_size], True).items())) for i in range(copies)
+    ]
+    return lambda: [pickle.loads(pickled_copy) for pickled_copy in pickled_copies]
+
+
+def benchmark_memory(lines, copies):
+    print('retaining type descriptors of {0} lines'.format(len(lines)))
+    for mode_name, create in [
+            ('dict', lambda: descriptor_to_dict(parse_lines(lines, True))),
+            ('lexer', lambda: dict(parse_lines(lines, True))),
+            ('regex', lambda: dict(parse_lines(lines, False))),
+            ('pickle', load_pickled_copies(lines, copies))
+    ]:
+        size = measure_retained_memory(create)
+        print('{0:>8}: {1:8.2f} MB'.format(mode_name, size / 1024 / 1024))
+
+
+def benchmark_generate(type_descriptors, repeat):
+    generator = BuilderGenerator(type_descriptors, {'copyright': ''})
+    transaction_names = generator.transaction_names()
+    print('generating {0} transaction builders'.format(len(transaction_names)))
+
+    def generate_all():
+        for name in transaction_names:
+            for descriptor in generator.generate_transaction(name):
+                list(descriptor.code)
+
+    elapsed = min(timeit.repeat(generate_all, number=1, repeat=repeat))
+    print('{0:>8}: {1:8.2f} ms ({2:.2f} us/transaction)'.format(
+        'cpp', elapsed * 1000, elapsed * 1000000 / len(transaction_names)))
+
+
+def pack_transfer_transaction(message, mosaics):
+    """Packs a transfer transaction with the specified message and (mosaic id, amount) tuples"""
+    body = struct.pack('<64s32sHHQQ25sHB', b'', b'', 3, 0x4154, 0, 0, b'', len(message), len(mosaics)) + message
+    body += b''.join(struct.pack('<QQ', *mosaic) for mosaic in mosaics)
+    return struct.pack('<I', 4 + len(body)) + body
+
+
+def read_header(view):
+    """Reads the fields used to filter transactions from a view"""
+    return (view.type, view.fee, view.deadline)
+
+
+def benchmark_decode(type_descriptors, repeat, number=10000):
+    decoder = StructDecoderFactory(type_descriptors).create('TransferTransaction')
+    view_class = StructViewFactory(type_descriptors).create('TransferTransaction')
+    buffer = pack_transfer_transaction(b'benchmark message', [(i, i * 1000) for i in range(3)])
+    print('decoding {0} transfer transactions'.format(number))
+
+    for mode_name, decode in [('decode', lambda: decoder.decode(buffer)), ('view', lambda: read_header(view_class(buffer)))]:
+        elapsed = min(timeit.repeat(decode, number=number, repeat=repeat))
+        print('{0:>8}: {1:8.2f} ms ({2:.2f} us/transaction)'.format(mode_name, elapsed * 1000, elapsed * 1000000 / number))
+
+
+def benchmark_encode(type_descriptors, repeat, number=10000):
+    encoder = StructEncoderFactory(type_descriptors).create('TransferTransaction')
+    values = {
+        'signature': bytes(64), 'signer': bytes(32), 'version': 3, 'type': 0x4154, 'fee': 0, 'deadline': 0, 'recipient': bytes(25),
+        'message': b'benchmark message', 'mosaics': [{'mosaicId': i, 'amount': i * 1000} for i in range(3)]
+    }
+    print('encoding {0} transfer transactions'.format(number))
+
+    elapsed = min(timeit.repeat(lambda: encoder.encode(values), number=number, repeat=repeat))
+    print('{0:>8}: {1:8.2f} ms ({2:.2f} us/transaction)'.format('encode', elapsed * 1000, elapsed * 1000000 / number))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CATS parser benchmark')
+    parser.add_argument('-i', '--include', help='schema root directory', default='./schemas')
+    parser.add_argument('-n', '--copies', help='number of renamed copies of the schemas to parse', type=int, default=50)
+    parser.add_argument('-r', '--repeat', help='number of timed repetitions', type=int, default=5)
+    parser.add_argument('-x', '--exclude', help='schema directories to skip', nargs='*', default=['aggregate'])
+    args = parser.parse_args()
+
+    lines = load_schema_lines(args.include, find_schema_files(args.include, args.exclude))
+    replicated_lines = replicate_schema_lines(lines, args.copies)
+    benchmark_parse(replicated_lines, args.repeat)
+    benchmark_memory(replicated_lines, args.copies)
+    type_descriptors = parse_lines(lines, True)
+    benchmark_generate(type_descriptors, args.repeat)
+    benchmark_decode(type_descriptors, args.repeat)
+    benchmark_encode(type_descriptors, args.repeat)
+
+
+if '__main__' == __name__:
+    main()
@@ -0,0 +1,2 @@
+class CodecException(Exception):
+    """Exception raised when an entity cannot be encoded or decoded"""
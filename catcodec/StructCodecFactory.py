@@ -0,0 +1,55 @@
+# pylint: disable=too-few-public-methods
+from collections import namedtuple
+from catparser.LayoutResolver import LayoutResolver
+from .codecutils import field_format, group_fields
+
+# step classes of a codec, each one processing one kind of field group or field
+StepTypes = namedtuple('StepTypes', ['run', 'union', 'conditional', 'bytes', 'struct', 'scalar_array', 'struct_array'])
+
+
+class StructCodecFactory:
+    """Base for factories of struct codecs built from precompiled steps, each codec is created at most once"""
+    def __init__(self, type_descriptors, codec_type, step_types):
+        self.layout_resolver = LayoutResolver(type_descriptors)
+        self.codec_type = codec_type
+        self.step_types = step_types
+        self.codecs = {}
+
+    def create(self, type_name):
+        """Gets the codec for a struct"""
+        codec = self.codecs.get(type_name)
+        if not codec:
+            layout = self.layout_resolver.resolve(type_name)
+            codec = self.codec_type(layout, [self._create_group_step(kind, fields) for kind, fields in group_fields(layout.fields)])
+            self.codecs[type_name] = codec
+
+        return codec
+
+    def _create_group_step(self, kind, fields):
+        if 'run' == kind:
+            return self.step_types.run(fields)
+
+        if 'union' == kind:
+            steps_by_condition_value = {field.condition_value: self._create_step(field) for field in fields}
+            return self.step_types.union(fields[0].condition, steps_by_condition_value, fields[0].size)
+
+        if 'conditional' == kind:
+            condition_steps = tuple((field.condition_value, self._create_step(field)) for field in fields)
+            return self.step_types.conditional(fields[0].condition, condition_steps)
+
+        return self._create_step(fields[0])
+
+    def _create_step(self, field):
+        if field_format(field):
+            return self.step_types.run([field])
+
+        if 'struct' == field.kind:
+            return self.step_types.struct(field.name, self.create(field.type_name))
+
+        if 'bytes' == field.kind:
+            return self.step_types.bytes(field.name, field.count)
+
+        if 'struct' == field.element.kind:
+            return self.step_types.struct_array(field.name, field.count, self.create(field.element.type_name))
+
+        return self.step_types.scalar_array(field.name, field.count, field.element)
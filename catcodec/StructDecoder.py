@@ -0,0 +1,143 @@
+# pylint: disable=too-few-public-methods
+import struct
+from .CodecException import CodecException
+from .StructCodecFactory import StepTypes, StructCodecFactory
+from .codecutils import BYTE_ORDER, field_format, resolve_count
+
+
+def _require_end_offset(buffer, offset, size):
+    end_offset = offset + size
+    if end_offset > len(buffer):
+        raise CodecException('unable to read {0} bytes at offset {1} from buffer of {2} bytes'.format(size, offset, len(buffer)))
+
+    return end_offset
+
+
+class RunStep:
+    """Unpacks a run of consecutive scalar fields with a single precompiled format"""
+    def __init__(self, fields):
+        self.names = tuple(field.name for field in fields)
+        self.packer = struct.Struct(BYTE_ORDER + ''.join(field_format(field) for field in fields))
+
+    def decode(self, buffer, offset, values):
+        """Decodes the fields at offset into values and returns the offset following them"""
+        values.update(zip(self.names, self.packer.unpack_from(buffer, offset)))
+        return offset + self.packer.size
+
+
+class BytesStep:
+    """Copies a binary field with a data dependent size"""
+    def __init__(self, name, count):
+        self.name = name
+        self.count = count
+
+    def decode(self, buffer, offset, values):
+        """Decodes the field at offset into values and returns the offset following it"""
+        end_offset = _require_end_offset(buffer, offset, resolve_count(self.count, values))
+        values[self.name] = bytes(buffer[offset:end_offset])
+        return end_offset
+
+
+class StructStep:
+    """Decodes a non-inline struct field"""
+    def __init__(self, name, decoder):
+        self.name = name
+        self.decoder = decoder
+
+    def decode(self, buffer, offset, values):
+        """Decodes the field at offset into values and returns the offset following it"""
+        values[self.name], offset = self.decoder.decode_from(buffer, offset)
+        return offset
+
+
+class ScalarArrayStep:
+    """Unpacks an array of scalars with a single precompiled element format"""
+    def __init__(self, name, count, element):
+        self.name = name
+        self.count = count
+        self.packer = struct.Struct(BYTE_ORDER + field_format(element))
+
+    def decode(self, buffer, offset, values):
+        """Decodes the array at offset into values and returns the offset following it"""
+        end_offset = _require_end_offset(buffer, offset, resolve_count(self.count, values) * self.packer.size)
+        values[self.name] = [element for (element,) in self.packer.iter_unpack(memoryview(buffer)[offset:end_offset])]
+        return end_offset
+
+
+class StructArrayStep:
+    """Decodes an array of structs"""
+    def __init__(self, name, count, decoder):
+        self.name = name
+        self.count = count
+        self.decoder = decoder
+
+    def decode(self, buffer, offset, values):
+        """Decodes the array at offset into values and returns the offset following it"""
+        elements = []
+        for _ in range(resolve_count(self.count, values)):
+            element, offset = self.decoder.decode_from(buffer, offset)
+            elements.append(element)
+
+        values[self.name] = elements
+        return offset
+
+
+class UnionStep:
+    """Decodes the alternative selected by the condition field from bytes shared by all alternatives"""
+    def __init__(self, condition, steps_by_condition_value, size):
+        self.condition = condition
+        self.steps_by_condition_value = steps_by_condition_value
+        self.size = size
+
+    def decode(self, buffer, offset, values):
+        """Decodes the selected field at offset into values and returns the offset following the union"""
+        step = self.steps_by_condition_value.get(values[self.condition])
+        if step:
+            step.decode(buffer, offset, values)
+
+        return offset + self.size
+
+
+class ConditionalStep:
+    """Decodes the fields that are present for the value of the condition field"""
+    def __init__(self, condition, condition_steps):
+        self.condition = condition
+        self.condition_steps = condition_steps
+
+    def decode(self, buffer, offset, values):
+        """Decodes the present fields at offset into values and returns the offset following them"""
+        condition_value = values[self.condition]
+        for step_condition_value, step in self.condition_steps:
+            if condition_value == step_condition_value:
+                offset = step.decode(buffer, offset, values)
+
+        return offset
+
+
+class StructDecoder:
+    """Decodes a struct into a dict with steps precompiled from its resolved layout"""
+    def __init__(self, layout, steps):
+        self.layout = layout
+        self.steps = tuple(steps)
+
+    def decode(self, buffer, offset=0):
+        """Decodes the struct at offset"""
+        return self.decode_from(buffer, offset)[0]
+
+    def decode_from(self, buffer, offset):
+        """Decodes the struct at offset and returns it along with the offset following it"""
+        values = {}
+        try:
+            for step in self.steps:
+                offset = step.decode(buffer, offset, values)
+        except struct.error as ex:
+            raise CodecException('unable to decode "{0}"'.format(self.layout.name), ex)
+
+        return (values, offset)
+
+
+class StructDecoderFactory(StructCodecFactory):
+    """Creates decoders from type descriptors, each decoder is created at most once"""
+    def __init__(self, type_descriptors):
+        step_types = StepTypes(RunStep, UnionStep, ConditionalStep, BytesStep, StructStep, ScalarArrayStep, StructArrayStep)
+        super().__init__(type_descriptors, StructDecoder, step_types)
@@ -0,0 +1,228 @@
+# pylint: disable=too-few-public-methods
+import struct
+from operator import itemgetter
+from .CodecException import CodecException
+from .StructCodecFactory import StepTypes, StructCodecFactory
+from .codecutils import BYTE_ORDER, field_format
+
+# leading field of size prefixed entities (e.g. transactions), which is derived from the encoded size
+ENTITY_SIZE_FIELD_NAME = 'size'
+
+
+def _require_end_offset(buffer, offset, size):
+    end_offset = offset + size
+    if end_offset > len(buffer):
+        raise CodecException('unable to write {0} bytes at offset {1} to buffer of {2} bytes'.format(size, offset, len(buffer)))
+
+    return end_offset
+
+
+def _require_count(name, count, elements):
+    if isinstance(count, int) and count != len(elements):
+        raise CodecException('"{0}" must have exactly {1} elements but has {2}'.format(name, count, len(elements)))
+
+
+class RunStep:
+    """Packs a run of consecutive scalar fields with a single precompiled format"""
+    def __init__(self, fields):
+        names = tuple(field.name for field in fields)
+        self.get_values = itemgetter(*names) if 1 < len(names) else lambda values: (values[names[0]],)
+        self.packer = struct.Struct(BYTE_ORDER + ''.join(field_format(field) for field in fields))
+
+        # fixed binary fields are padded or truncated by the packer, so their lengths are checked upfront
+        self.binary_counts = tuple((field.name, field.count) for field in fields if 'bytes' == field.kind)
+
+    def size(self, _):
+        """Gets the size of the fields"""
+        return self.packer.size
+
+    def encode(self, buffer, offset, values):
+        """Encodes the fields at offset and returns the offset following them"""
+        for name, count in self.binary_counts:
+            _require_count(name, count, values[name])
+
+        self.packer.pack_into(buffer, offset, *self.get_values(values))
+        return offset + self.packer.size
+
+
+class BytesStep:
+    """Copies a binary field with a data dependent size"""
+    def __init__(self, name, count):
+        # count field is derived from the length of the field
+        self.name = name
+        self.count = count
+
+    def size(self, values):
+        """Gets the size of the field"""
+        return len(values[self.name])
+
+    def encode(self, buffer, offset, values):
+        """Encodes the field at offset and returns the offset following it"""
+        value = values[self.name]
+        end_offset = _require_end_offset(buffer, offset, len(value))
+        buffer[offset:end_offset] = value
+        return end_offset
+
+
+class StructStep:
+    """Encodes a non-inline struct field"""
+    def __init__(self, name, encoder):
+        self.name = name
+        self.encoder = encoder
+
+    def size(self, values):
+        """Gets the size of the field"""
+        return self.encoder.size(values[self.name])
+
+    def encode(self, buffer, offset, values):
+        """Encodes the field at offset and returns the offset following it"""
+        return self.encoder.encode_into(buffer, offset, values[self.name])
+
+
+class ScalarArrayStep:
+    """Packs an array of scalars with a single precompiled element format"""
+    def __init__(self, name, count, element):
+        self.name = name
+        self.count = count
+        self.packer = struct.Struct(BYTE_ORDER + field_format(element))
+
+    def size(self, values):
+        """Gets the size of the array"""
+        return len(values[self.name]) * self.packer.size
+
+    def encode(self, buffer, offset, values):
+        """Encodes the array at offset and returns the offset following it"""
+        elements = values[self.name]
+        _require_count(self.name, self.count, elements)
+        for element in elements:
+            self.packer.pack_into(buffer, offset, element)
+            offset += self.packer.size
+
+        return offset
+
+
+class StructArrayStep:
+    """Encodes an array of structs"""
+    def __init__(self, name, count, encoder):
+        self.name = name
+        self.count = count
+        self.encoder = encoder
+
+    def size(self, values):
+        """Gets the size of the array"""
+        elements = values[self.name]
+        element_size = self.encoder.layout.size
+        return len(elements) * element_size if element_size is not None else sum(self.encoder.size(element) for element in elements)
+
+    def encode(self, buffer, offset, values):
+        """Encodes the array at offset and returns the offset following it"""
+        elements = values[self.name]
+        _require_count(self.name, self.count, elements)
+        for element in elements:
+            offset = self.encoder.encode_into(buffer, offset, element)
+
+        return offset
+
+
+class UnionStep:
+    """Encodes the alternative selected by the condition field into bytes shared by all alternatives"""
+    def __init__(self, condition, steps_by_condition_value, size):
+        self.condition = condition
+        self.steps_by_condition_value = steps_by_condition_value
+        self.union_size = size
+
+    def size(self, _):
+        """Gets the size of the union"""
+        return self.union_size
+
+    def encode(self, buffer, offset, values):
+        """Encodes the selected field at offset and returns the offset following the union"""
+        step = self.steps_by_condition_value.get(values[self.condition])
+        if step:
+            step.encode(buffer, offset, values)
+
+        return offset + self.union_size
+
+
+class ConditionalStep:
+    """Encodes the fields that are present for the value of the condition field"""
+    def __init__(self, condition, condition_steps):
+        self.condition = condition
+        self.condition_steps = condition_steps
+
+    def size(self, values):
+        """Gets the size of the present fields"""
+        condition_value = values[self.condition]
+        return sum(step.size(values) for step_condition_value, step in self.condition_steps if condition_value == step_condition_value)
+
+    def encode(self, buffer, offset, values):
+        """Encodes the present fields at offset and returns the offset following them"""
+        condition_value = values[self.condition]
+        for step_condition_value, step in self.condition_steps:
+            if condition_value == step_condition_value:
+                offset = step.encode(buffer, offset, values)
+
+        return offset
+
+
+class StructEncoder:
+    """Encodes a dict into a struct with steps precompiled from its resolved layout"""
+    def __init__(self, layout, steps):
+        self.layout = layout
+        self.steps = tuple(steps)
+
+        # size and count fields are derived from the encoded size and from the lengths of the arrays they describe
+        self.count_fields = tuple((field.count, field.name) for field in layout.fields if isinstance(field.count, str))
+        has_size_field = layout.fields and ENTITY_SIZE_FIELD_NAME == layout.fields[0].name
+        self.size_field_name = ENTITY_SIZE_FIELD_NAME if has_size_field else None
+
+    def size(self, values):
+        """Computes the exact encoded size of the struct"""
+        if self.layout.size is not None:
+            return self.layout.size
+
+        try:
+            return sum(step.size(values) for step in self.steps)
+        except KeyError as ex:
+            raise CodecException('unable to size "{0}"'.format(self.layout.name), ex)
+
+    def encode(self, values):
+        """Encodes the struct into a new buffer of its exact size"""
+        size = self.size(values)
+        buffer = bytearray(size)
+        self._encode(buffer, 0, values, size)
+        return buffer
+
+    def encode_into(self, buffer, offset, values):
+        """Encodes the struct at offset into an existing buffer and returns the offset following it"""
+        return self._encode(buffer, offset, values, None)
+
+    def _encode(self, buffer, offset, values, size):
+        try:
+            if self.count_fields or self.size_field_name:
+                values = self._derive(values, size)
+
+            for step in self.steps:
+                offset = step.encode(buffer, offset, values)
+        except (KeyError, struct.error) as ex:
+            raise CodecException('unable to encode "{0}"'.format(self.layout.name), ex)
+
+        return offset
+
+    def _derive(self, values, size):
+        derived_values = dict(values)
+        for count_name, name in self.count_fields:
+            if name in values:
+                derived_values[count_name] = len(values[name])
+
+        if self.size_field_name:
+            derived_values[self.size_field_name] = self.size(values) if size is None else size
+
+        return derived_values
+
+
+class StructEncoderFactory(StructCodecFactory):
+    """Creates encoders from type descriptors, each encoder is created at most once"""
+    def __init__(self, type_descriptors):
+        step_types = StepTypes(RunStep, UnionStep, ConditionalStep, BytesStep, StructStep, ScalarArrayStep, StructArrayStep)
+        super().__init__(type_descriptors, StructEncoder, step_types)
@@ -0,0 +1,197 @@
+# pylint: disable=too-few-public-methods, protected-access
+import struct
+from catparser.LayoutResolver import LayoutResolver
+from .CodecException import CodecException
+from .codecutils import BYTE_ORDER, field_format, group_fields
+
+# key of the offset following the viewed struct in measured offsets
+END_OFFSET_KEY = None
+
+
+def _count(view, count):
+    return count if isinstance(count, int) else getattr(view, count)
+
+
+def _slice(view, offset, size):
+    end_offset = offset + size
+    if end_offset > len(view._buffer):
+        raise CodecException('unable to view {0} bytes at offset {1} of buffer of {2} bytes'.format(size, offset, len(view._buffer)))
+
+    return view._buffer[offset:end_offset]
+
+
+class StructView:
+    """Base of lazy views over the bytes of a struct, fields are read on access and binary fields are never copied"""
+
+    # like namedtuple, all members start with an underscore so they cannot clash with field names
+    __slots__ = ('_buffer', '_offset', '_offsets')
+
+    # names of all fields
+    _fields = ()
+
+    # fixed size of the struct or None when its size depends on the data
+    _size = None
+
+    # relative offset of the first field with a data dependent offset and steps measuring all fields following it
+    _tail_offset = 0
+    _tail_steps = ()
+
+    def __init__(self, buffer, offset=0):
+        self._buffer = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+        self._offset = offset
+        self._offsets = None
+
+    def _measure(self):
+        """Gets the absolute offsets of all fields with data dependent offsets, measured at most once"""
+        if self._offsets is None:
+            # offsets are published before measuring, so a tail field can depend on the size or condition fields preceding it
+            offsets = self._offsets = {}
+            offset = self._offset + self._tail_offset
+            try:
+                for step in self._tail_steps:
+                    offset = step(self, offset, offsets)
+            except Exception:
+                # partial offsets must not be used by later accesses, which need to fail the same way
+                self._offsets = None
+                raise
+
+            offsets[END_OFFSET_KEY] = offset
+
+        return self._offsets
+
+    def _end_offset(self):
+        """Gets the absolute offset following the viewed struct"""
+        return self._offset + self._size if self._size is not None else self._measure()[END_OFFSET_KEY]
+
+
+class StructViewFactory:
+    """Creates view classes from type descriptors, each view class is created at most once"""
+    def __init__(self, type_descriptors):
+        self.layout_resolver = LayoutResolver(type_descriptors)
+        self.view_classes = {}
+
+    def create(self, type_name):
+        """Gets the view class of a struct"""
+        view_class = self.view_classes.get(type_name)
+        if not view_class:
+            layout = self.layout_resolver.resolve(type_name)
+            namespace = {
+                '__slots__': (),
+                '_fields': tuple(field.name for field in layout.fields),
+                '_size': layout.size,
+                '_tail_offset': layout.tail_offset,
+                '_tail_steps': tuple(self._create_tail_steps(layout))
+            }
+            namespace.update((field.name, property(self._create_getter(field))) for field in layout.fields)
+            view_class = type('{0}View'.format(type_name), (StructView,), namespace)
+            self.view_classes[type_name] = view_class
+
+        return view_class
+
+    def _create_tail_steps(self, layout):
+        if layout.size is not None:
+            return
+
+        for kind, fields in group_fields(layout.fields):
+            if fields[0].offset is None or fields[0].offset >= layout.tail_offset:
+                yield self._create_tail_step(kind, fields)
+
+    def _create_tail_step(self, kind, fields):
+        names = tuple(field.name for field in fields)
+        if 'union' == kind:
+            union_size = fields[0].size
+
+            def measure_union(_, offset, offsets):
+                for name in names:
+                    offsets[name] = offset
+
+                return offset + union_size
+
+            return measure_union
+
+        sizers = tuple(self._create_sizer(field) for field in fields)
+        if 'conditional' == kind:
+            condition = fields[0].condition
+            condition_values = tuple(field.condition_value for field in fields)
+
+            def measure_conditional(view, offset, offsets):
+                actual_condition_value = getattr(view, condition)
+                for name, sizer, condition_value in zip(names, sizers, condition_values):
+                    if actual_condition_value == condition_value:
+                        offsets[name] = offset
+                        offset += sizer(view, offset)
+
+                return offset
+
+            return measure_conditional
+
+        def measure(view, offset, offsets):
+            for name, sizer in zip(names, sizers):
+                offsets[name] = offset
+                offset += sizer(view, offset)
+
+            return offset
+
+        return measure
+
+    def _create_sizer(self, field):
+        if field.size is not None:
+            return lambda view, offset: field.size
+
+        if 'bytes' == field.kind:
+            return lambda view, offset: _count(view, field.count)
+
+        if 'struct' == field.kind:
+            view_class = self.create(field.type_name)
+            return lambda view, offset: view_class(view._buffer, offset)._end_offset() - offset
+
+        if field.element.size is not None:
+            return lambda view, offset: _count(view, field.count) * field.element.size
+
+        element_view_class = self.create(field.element.type_name)
+
+        def measure_elements(view, offset):
+            end_offset = offset
+            for _ in range(_count(view, field.count)):
+                end_offset = element_view_class(view._buffer, end_offset)._end_offset()
+
+            return end_offset - offset
+
+        return measure_elements
+
+    def _create_reader(self, field):
+        if 'integer' == field.kind:
+            packer = struct.Struct(BYTE_ORDER + field_format(field))
+
+            def read_integer(view, offset):
+                try:
+                    return packer.unpack_from(view._buffer, offset)[0]
+                except struct.error as ex:
+                    raise CodecException('unable to read "{0}"'.format(field.name), ex)
+
+            return read_integer
+
+        if 'struct' == field.kind:
+            view_class = self.create(field.type_name)
+            return lambda view, offset: view_class(view._buffer, offset)
+
+        # binary fields and arrays are viewed as raw bytes
+        sizer = self._create_sizer(field)
+        return lambda view, offset: _slice(view, offset, sizer(view, offset))
+
+    def _create_getter(self, field):
+        read = self._create_reader(field)
+        if field.offset is not None:
+            relative_offset = field.offset
+
+            def get(view):
+                return read(view, view._offset + relative_offset)
+        else:
+            def get(view):
+                return read(view, view._measure()[field.name])
+
+        if not field.condition:
+            return get
+
+        # absent conditional fields are viewed as None
+        return lambda view: get(view) if field.condition_value == getattr(view, field.condition) else None
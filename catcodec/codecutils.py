@@ -0,0 +1,56 @@
+from catparser.LayoutResolver import find_condition_group, is_union
+
+# all entities are little endian without any padding between fields
+BYTE_ORDER = '<'
+
+# struct formats of unsigned integers by byte width, signed integers use the lowercase formats
+INTEGER_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+def field_format(field):
+    """Gets the struct format of a fixed width integer or binary field or None if the field is not a scalar"""
+    if 'integer' == field.kind:
+        integer_format = INTEGER_FORMATS[field.size]
+        return integer_format if 'unsigned' == field.signedness else integer_format.lower()
+
+    if 'bytes' == field.kind and isinstance(field.count, int):
+        return '{0}s'.format(field.count)
+
+    return None
+
+
+def resolve_count(count, values):
+    """Gets the element count of an array, which is either fixed or stored in another field"""
+    return count if isinstance(count, int) else values[count]
+
+
+# kinds of field groups:
+# - run: consecutive unconditional scalar fields
+# - union: conditional fields sharing the same bytes
+# - conditional: conditional fields that are each present or absent
+# - field: single unconditional non-scalar field
+def group_fields(fields):
+    """Splits resolved fields into (kind, fields) groups that can each be processed by a single precompiled step"""
+    groups = []
+    run = []
+    index = 0
+    while index < len(fields):
+        group = find_condition_group(fields, index)
+        index += len(group)
+        if not group[0].condition and field_format(group[0]):
+            run.append(group[0])
+            continue
+
+        if run:
+            groups.append(('run', tuple(run)))
+            run = []
+
+        if group[0].condition:
+            groups.append(('union' if is_union(group) else 'conditional', tuple(group)))
+        else:
+            groups.append(('field', tuple(group)))
+
+    if run:
+        groups.append(('run', tuple(run)))
+
+    return groups
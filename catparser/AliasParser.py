@@ -1,4 +1,5 @@
 # pylint: disable=too-few-public-methods
+from .Lexer import TokenReader
 from .RegexParserFactory import RegexParserFactory
 from .parserutils import parse_builtin, require_user_type_name
 
@@ -9,16 +10,28 @@ class AliasParser:
         self.regex = regex
 
     def process_line(self, line):
-        match = self.regex.match(line)
+        return self.process_match(self.regex.match(line))
 
+    @staticmethod
+    def process_match(match):
         # aliases are only supported for builtin types
         return (
             require_user_type_name(match.group(1)),
             parse_builtin(match.group(2))
         )
 
+    @staticmethod
+    def process_tokens(tokens):
+        reader = TokenReader(tokens)
+        reader.require_text('using')
+        type_name = reader.require('type_name').text
+        reader.require_text('=')
+        builtin_token = reader.require('builtin', 'primitive')
+        reader.require_end()
+        return (type_name, dict(builtin_token.value))
+
 
 class AliasParserFactory(RegexParserFactory):
     """Factory for creating alias parsers"""
     def __init__(self):
-        super().__init__(r'using (\S+) = (\S+)', AliasParser)
+        super().__init__(r'using (\S+) = (\S+)', AliasParser, 'using')
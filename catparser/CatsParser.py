@@ -1,29 +1,86 @@
-from collections import OrderedDict
+# pylint: disable=too-many-instance-attributes
+import re
+from collections import OrderedDict, deque
+from types import MappingProxyType
 from .AliasParser import AliasParserFactory
 from .CatsParseException import CatsParseException
 from .CommentParser import CommentParser
 from .EnumParser import EnumParserFactory
 from .ImportParser import ImportParserFactory
+from .Lexer import tokenize
+from .ParserDispatcher import ParserDispatcher
 from .ScopeManager import ScopeManager
 from .StructParser import StructParserFactory
+from .TypeDescriptors import create_type_descriptor
+from .parserutils import intern_identifier
+
+# a line with its terminator (any of the universal newlines) or an unterminated last line
+BUFFER_LINE_REGEX = re.compile(rb'[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+')
+
+# type parser factories are immutable, so they are shared by all parsers
+TYPE_PARSER_FACTORIES = (
+    AliasParserFactory(),
+    EnumParserFactory(),
+    ImportParserFactory(),
+    StructParserFactory()
+)
+TYPE_PARSER_DISPATCHER = ParserDispatcher(TYPE_PARSER_FACTORIES)
+
+
+def iter_buffer_lines(buffer):
+    """Yields the decoded lines of a bytes-like buffer (bytes, memoryview or mmap) without splitting it upfront"""
+    for match in BUFFER_LINE_REGEX.finditer(buffer):
+        yield match.group().decode('utf-8')
 
 
 class CatsParser(ScopeManager):
     """Parser used to parse CATS files line by line"""
-    def __init__(self, import_resolver):
+    def __init__(self, import_resolver, use_lexer=False, defer_link_validation=False, record_links=False):
         super().__init__()
         self.import_resolver = import_resolver
+        self.use_lexer = use_lexer
+
+        # when link validation is deferred, links to other types are collected per type instead of being validated,
+        # so that a file can be parsed without its imports
+        # when links are recorded, they are validated and collected, so that cached types can be validated again when loaded
+        self.defer_link_validation = defer_link_validation
+        self.deferred_links = {} if defer_link_validation or record_links else None
+        self.pending_links = []
 
         self.aspect_parser = CommentParser()
-        self.type_parser_factories = [
-            AliasParserFactory(),
-            EnumParserFactory(),
-            ImportParserFactory(),
-            StructParserFactory()
-        ]
 
         self.wip_type_descriptors = OrderedDict()
+        self.wip_type_member_indexes = {}
         self.active_parser = None
+        self.type_listeners = []
+
+    def add_type_listener(self, listener):
+        """Adds a listener that is called with (type_name, type_descriptor) whenever a type is committed"""
+        self.type_listeners.append(listener)
+
+    def remove_type_listener(self, listener):
+        """Removes a previously added type listener"""
+        self.type_listeners.remove(listener)
+
+    def iter_type_descriptors(self, lines):
+        """Processes lines and yields (type_name, type_descriptor) tuples as soon as each type is committed"""
+        committed_types = deque()
+
+        def listener(type_name, type_descriptor):
+            committed_types.append((type_name, type_descriptor))
+
+        self.add_type_listener(listener)
+        try:
+            for line in lines:
+                self.process_line(line)
+                while committed_types:
+                    yield committed_types.popleft()
+
+            self._close_type()
+            while committed_types:
+                yield committed_types.popleft()
+        finally:
+            self.remove_type_listener(listener)
 
     def process_line(self, line):
         """Processes the next line of input"""
@@ -32,6 +89,11 @@ class CatsParser(ScopeManager):
         except Exception as ex:
             raise CatsParseException('\n'.join(self.scope()), ex)
 
+    def process_buffer(self, buffer):
+        """Processes all lines of a bytes-like buffer (bytes, memoryview or mmap)"""
+        for line in iter_buffer_lines(buffer):
+            self.process_line(line)
+
     def _process_line(self, line):
         self.increment_line_number()
 
@@ -51,11 +113,17 @@ class CatsParser(ScopeManager):
         if self.active_parser and not line.startswith('\t'):
             self._close_type()
 
-        active_factories = self.type_parser_factories if not self.active_parser else self.active_parser.factories()
+        active_dispatcher = TYPE_PARSER_DISPATCHER if not self.active_parser else self.active_parser.dispatcher()
 
-        factory = next(factory for factory in active_factories if factory.is_match(line_stripped))
-        parser = factory.create()
-        parse_result = parser.process_line(line_stripped)
+        if self.use_lexer:
+            # tokenize the line once and let the selected parser consume the tokens
+            tokens = tokenize(line_stripped)
+            parser = active_dispatcher.dispatch_tokens(line_stripped, tokens).create()
+            parse_result = parser.process_tokens(tokens)
+        else:
+            factory, match = active_dispatcher.dispatch(line_stripped)
+            parser = factory.create()
+            parse_result = parser.process_match(match)
 
         # create a new scope if the current symbol is a composite
         if not parse_result:
@@ -65,40 +133,50 @@ class CatsParser(ScopeManager):
 
         if self.active_parser:
             if 'type' in parse_result:
-                self._require_known_type(parse_result['type'])
+                links = [('known_type', parse_result['type'])]
 
                 # perform extra validation on some property links for better error detection/messages
                 if 'sort_key' in parse_result:
                     # sort key processing will only occur if linked field type already exists
-                    self._require_type_with_field(parse_result['type'], parse_result['sort_key'])
+                    links.append(('type_with_field', parse_result['type'], parse_result['sort_key']))
 
                 if 'condition' in parse_result:
                     # when condition is being post processed here, it is known that the linked condition field is part of
                     # the struct and the linked condition type already exists
 
-                    # look up condition type descriptor by searching active parser descriptor layout
-                    condition_field_name = parse_result['condition']
-                    condition_type_descriptor = next(
-                        descriptor for descriptor in self.active_parser.type_descriptor['layout']
-                        if descriptor['name'] == condition_field_name
-                    )
+                    # look up condition type descriptor by name in active parser descriptor layout
+                    condition_type_descriptor = self.active_parser.field(parse_result['condition'])
 
-                    self._require_enum_type_with_value(condition_type_descriptor['type'], parse_result['condition_value'])
+                    links.append(('enum_type_with_value', condition_type_descriptor['type'], parse_result['condition_value']))
 
-            self.active_parser.append({**parse_result, **partial_descriptor})
+                self._process_links(links)
+
+            self.active_parser.append(self.active_parser.member_descriptor_class(parse_result, partial_descriptor))
         elif hasattr(parse_result, 'import_file'):
             self.import_resolver(parse_result.import_file)
         else:
-            self._set_type_descriptor(parse_result[0], {**parse_result[1], **partial_descriptor})
+            self._set_type_descriptor(parse_result[0], create_type_descriptor(parse_result[1], partial_descriptor))
 
     def _close_type(self):
         if not self.active_parser:
             return
 
         parsed_tuple = self.active_parser.commit()
-        self._set_type_descriptor(parsed_tuple[0], {**parsed_tuple[1], **self.active_parser.partial_descriptor})
+        self._set_type_descriptor(parsed_tuple[0], create_type_descriptor(parsed_tuple[1], self.active_parser.partial_descriptor))
         self.active_parser = None
 
+    def _process_links(self, links):
+        if not self.defer_link_validation:
+            self.require_links(links)
+
+        if self.deferred_links is not None:
+            self.pending_links.append((self.scope(), links))
+
+    def require_links(self, links):
+        """Validates (kind, *arguments) links against the known types, links are validated in order"""
+        for kind, *arguments in links:
+            getattr(self, '_require_' + kind)(*arguments)
+
     def _require_known_type(self, type_name):
         if type_name not in self.wip_type_descriptors and 'byte' != type_name:
             raise CatsParseException('no definition for linked type "{0}"'.format(type_name))
@@ -106,8 +184,8 @@ class CatsParser(ScopeManager):
         return type_name
 
     def _require_type_with_field(self, type_name, field_name):
-        type_descriptor = self.wip_type_descriptors[type_name]
-        if not any(field_name == field['name'] for field in type_descriptor['layout']):
+        # only structs have fields, the member indexes of enums contain value names
+        if 'layout' not in self.wip_type_descriptors.get(type_name, {}) or field_name not in self.wip_type_member_indexes[type_name]:
             raise CatsParseException('"{0}" does not have field "{1}"'.format(type_name, field_name))
 
     def _require_enum_type_with_value(self, type_name, value_name):
@@ -115,7 +193,7 @@ class CatsParser(ScopeManager):
         if 'values' not in enum_type_descriptor:
             raise CatsParseException('linked type "{0}" must be an enum type'.format(type_name))
 
-        if not any(value_name == value['name'] for value in enum_type_descriptor['values']):
+        if value_name not in self.wip_type_member_indexes[type_name]:
             raise CatsParseException('linked enum type "{0}" does not contain value "{1}"'.format(type_name, value_name))
 
     def _set_type_descriptor(self, type_name, type_descriptor):
@@ -124,6 +202,48 @@ class CatsParser(ScopeManager):
 
         self.wip_type_descriptors[type_name] = type_descriptor
 
+        member_index = self._create_member_index(type_descriptor)
+        if member_index is not None:
+            self.wip_type_member_indexes[type_name] = member_index
+
+        if self.deferred_links is not None:
+            self.deferred_links[type_name] = self.pending_links
+            self.pending_links = []
+
+        for listener in self.type_listeners:
+            listener(type_name, type_descriptor)
+
+    @staticmethod
+    def _create_member_index(type_descriptor):
+        # index enum values by name (name => value) and struct fields by name (name => first field descriptor with name)
+        if 'values' in type_descriptor:
+            return MappingProxyType({value['name']: value['value'] for value in type_descriptor['values']})
+
+        if 'layout' in type_descriptor:
+            fields_by_name = {}
+            for field in type_descriptor['layout']:
+                if 'name' in field:
+                    fields_by_name.setdefault(field['name'], field)
+
+            return MappingProxyType(fields_by_name)
+
+        return None
+
+    def member_index(self, type_name):
+        """Gets a read-only index of the members of a parsed composite type by name"""
+        return self.wip_type_member_indexes[type_name]
+
+    def add_type_descriptor(self, type_name, type_descriptor, deferred_links=None):
+        """Adds a type descriptor that was parsed previously after validating the links deferred while parsing it"""
+        for scope, links in deferred_links or []:
+            try:
+                self.require_links(links)
+            except CatsParseException as ex:
+                raise CatsParseException('\n'.join(scope), ex)
+
+        # descriptors parsed by other processes or loaded from the cache do not share names with this parser
+        self._set_type_descriptor(intern_identifier(type_name), type_descriptor)
+
     def type_descriptors(self):
         """Returns all parsed type descriptors"""
         self._close_type()
@@ -1,8 +1,14 @@
+# pylint: disable=too-few-public-methods
+from .RegexParserFactory import RegexParserFactory
+
+
 class CompositeTypeParser:
     """Base for composite type parsers"""
-    def __init__(self, regex, factories):
+    def __init__(self, regex, factories, dispatcher):
+        # factories and dispatcher are shared by all parsers of the same type, so only the parsed type is created per parser
         self.regex = regex
         self.sub_factories = factories
+        self.sub_dispatcher = dispatcher
         self.type_name = None
         self.type_descriptor = None
 
@@ -10,6 +16,17 @@ class CompositeTypeParser:
         """Gets sub-parsers for this composite type parser"""
         return self.sub_factories
 
+    def dispatcher(self):
+        """Gets the dispatcher selecting sub-parsers for this composite type parser"""
+        return self.sub_dispatcher
+
     def commit(self):
         """Returns the composite type tuple"""
         return (self.type_name, self.type_descriptor)
+
+
+class CompositeTypeParserFactory(RegexParserFactory):
+    """Base for factories of composite type parsers, which accumulate a type over multiple lines"""
+
+    # every composite type needs its own parser
+    shares_parser = False
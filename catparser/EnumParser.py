@@ -1,21 +1,39 @@
 # pylint: disable=too-few-public-methods
 from .CatsParseException import CatsParseException
-from .CompositeTypeParser import CompositeTypeParser
+from .CompositeTypeParser import CompositeTypeParser, CompositeTypeParserFactory
+from .Lexer import PROPERTY_NAME_KINDS, TokenReader
+from .ParserDispatcher import ASSIGNMENT_KEYWORD, ParserDispatcher
 from .RegexParserFactory import RegexParserFactory
+from .TypeDescriptors import EnumValueDescriptor
 from .parserutils import parse_dec_or_hex, parse_builtin, require_property_name, require_user_type_name, require_primitive
 
 
 class EnumParser(CompositeTypeParser):
     """Parser for `enum` statements"""
+    member_descriptor_class = EnumValueDescriptor
+
     def __init__(self, regex):
-        super().__init__(regex, [EnumValueParserFactory()])
+        super().__init__(regex, ENUM_VALUE_FACTORIES, ENUM_VALUE_DISPATCHER)
+        self.value_names = set()
 
     def process_line(self, line):
-        match = self.regex.match(line)
+        return self.process_match(self.regex.match(line))
+
+    def process_match(self, match):
         self.type_name = require_user_type_name(match.group(1))
 
         base_type = require_primitive(match.group(2))
-        builtin_type_descriptor = parse_builtin(base_type)
+        self._set_base_type(parse_builtin(base_type))
+
+    def process_tokens(self, tokens):
+        reader = TokenReader(tokens)
+        reader.require_text('enum')
+        self.type_name = reader.require('type_name').text
+        reader.require_text(':')
+        self._set_base_type(reader.require('primitive').value)
+        reader.require_end()
+
+    def _set_base_type(self, builtin_type_descriptor):
         self.type_descriptor = {
             'type': 'enum',
             'size': builtin_type_descriptor['size'],
@@ -26,17 +44,18 @@ class EnumParser(CompositeTypeParser):
     def append(self, property_value_descriptor):
         self._require_unknown_property(property_value_descriptor['name'])
 
+        self.value_names.add(property_value_descriptor['name'])
         self.type_descriptor['values'].append(property_value_descriptor)
 
     def _require_unknown_property(self, property_name):
-        if any(property_name == property_type_descriptor['name'] for property_type_descriptor in self.type_descriptor['values']):
+        if property_name in self.value_names:
             raise CatsParseException('duplicate definition for enum value "{0}"'.format(property_name))
 
 
-class EnumParserFactory(RegexParserFactory):
+class EnumParserFactory(CompositeTypeParserFactory):
     """Factory for creating enum parsers"""
     def __init__(self):
-        super().__init__(r'enum (\S+) : (u?int\d+)', EnumParser)
+        super().__init__(r'enum (\S+) : (u?int\d+)', EnumParser, 'enum')
 
 
 class EnumValueParser:
@@ -45,11 +64,28 @@ class EnumValueParser:
         self.regex = regex
 
     def process_line(self, line):
-        match = self.regex.match(line)
+        return self.process_match(self.regex.match(line))
+
+    @staticmethod
+    def process_match(match):
         return {'name': require_property_name(match.group(1)), 'value': parse_dec_or_hex(match.group(2))}
 
+    @staticmethod
+    def process_tokens(tokens):
+        reader = TokenReader(tokens)
+        name = reader.require(*PROPERTY_NAME_KINDS).text
+        reader.require_text('=')
+        value = reader.require('number').value
+        reader.require_end()
+        return {'name': name, 'value': value}
+
 
 class EnumValueParserFactory(RegexParserFactory):
     """Factory for creating enum value parsers"""
     def __init__(self):
-        super().__init__(r'(\S+) = (\S+)', EnumValueParser)
+        super().__init__(r'(\S+) = (\S+)', EnumValueParser, ASSIGNMENT_KEYWORD)
+
+
+# value factories are immutable, so they are shared by all enum parsers
+ENUM_VALUE_FACTORIES = (EnumValueParserFactory(),)
+ENUM_VALUE_DISPATCHER = ParserDispatcher(ENUM_VALUE_FACTORIES)
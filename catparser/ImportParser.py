@@ -1,4 +1,5 @@
 # pylint: disable=too-few-public-methods
+from .Lexer import TokenReader
 from .RegexParserFactory import RegexParserFactory
 
 
@@ -17,11 +18,22 @@ class ImportParser:
         self.regex = regex
 
     def process_line(self, line):
-        match = self.regex.match(line)
+        return self.process_match(self.regex.match(line))
+
+    @staticmethod
+    def process_match(match):
         return ImportResult(match.group(1))
 
+    @staticmethod
+    def process_tokens(tokens):
+        reader = TokenReader(tokens)
+        reader.require_text('import')
+        import_file = reader.require('string').text
+        reader.require_end()
+        return ImportResult(import_file)
+
 
 class ImportParserFactory(RegexParserFactory):
     """Factory for creating import parsers"""
     def __init__(self):
-        super().__init__(r'import "([\S ]+)"', ImportParser)
+        super().__init__(r'import "([\S ]+)"', ImportParser, 'import')
@@ -0,0 +1,186 @@
+from collections import namedtuple
+from .CatsParseException import CatsParseException
+
+# builtin type used by all integer and fixed size binary fields
+BUILTIN_TYPE_NAME = 'byte'
+
+# byte widths of builtin types that are integers, all other builtin widths are opaque binary
+INTEGER_SIZES = (1, 2, 4, 8)
+
+# resolved field of a struct layout
+# - kind is one of: integer (enums and integer aliases), bytes (fixed or sized binary), struct (non-inline struct), array
+# - size is the byte width or None when the width depends on the data
+# - offset is the byte offset from the start of the struct or None when it depends on the data
+# - count is the element count of arrays and sized binary, either a number or the name of the field containing it
+# - condition_value is the numeric enum value of the condition field for which the field is present
+ResolvedField = namedtuple('ResolvedField', [
+    'name', 'kind', 'type_name', 'size', 'signedness', 'offset', 'layout', 'element', 'count', 'condition', 'condition_value'
+])
+
+# resolved struct layout, fields are flattened (inline members are expanded and const members are dropped)
+# - size is the byte width or None when the width depends on the data
+# - tail_offset is the byte offset of the first field with a data dependent width or offset (size when there is none)
+ResolvedLayout = namedtuple('ResolvedLayout', ['name', 'fields', 'size', 'tail_offset'])
+
+
+def _create_field(name, kind, type_name, size, **kwargs):
+    field_values = dict.fromkeys(ResolvedField._fields)
+    field_values.update(name=name, kind=kind, type_name=type_name, size=size, **kwargs)
+    return ResolvedField(**field_values)
+
+
+def _advance(offset, size):
+    return None if offset is None or size is None else offset + size
+
+
+def find_condition_group(fields, index):
+    """Gets the run of consecutive fields starting at index that have the same condition"""
+    condition = fields[index].condition
+    end_index = index + 1
+    if condition:
+        while end_index < len(fields) and condition == fields[end_index].condition:
+            end_index += 1
+
+    return fields[index:end_index]
+
+
+def is_union(group):
+    """Returns true if a group of conditional fields are alternatives sharing the same bytes"""
+    # fields present for the same condition value follow each other, so only fields of distinct values are alternatives
+    has_distinct_condition_values = len(group) == len({field.condition_value for field in group})
+    return 1 < len(group) and 1 == len({field.size for field in group}) and has_distinct_condition_values
+
+
+def _place_fields(type_name, fields):
+    placed_fields = []
+    offset = 0
+    tail_offset = None
+    index = 0
+    while index < len(fields):
+        group = find_condition_group(fields, index)
+        index += len(group)
+
+        # consecutive fields with the same condition, distinct condition values and the same width are alternatives sharing the same bytes
+        is_group_union = is_union(group)
+        for field in group:
+            placed_fields.append(field._replace(offset=offset))
+            if not is_group_union:
+                # presence of other conditional fields depends on the data
+                offset = _advance(offset, None if field.condition else field.size)
+
+        if is_group_union:
+            offset = _advance(offset, group[0].size)
+
+        if tail_offset is None and offset is None:
+            tail_offset = placed_fields[-len(group)].offset
+
+    return ResolvedLayout(type_name, tuple(placed_fields), offset, offset if tail_offset is None else tail_offset)
+
+
+class LayoutResolver:
+    """Resolves struct layouts to flat fields with byte widths and offsets, each layout is resolved at most once"""
+    def __init__(self, type_descriptors):
+        self.type_descriptors = type_descriptors
+        self.layouts = {}
+        self.resolving_type_names = []
+
+    def resolve_all(self):
+        """Resolves the layouts of all structs"""
+        return {
+            type_name: self.resolve(type_name)
+            for type_name, type_descriptor in self.type_descriptors.items() if 'struct' == type_descriptor['type']
+        }
+
+    def resolve(self, type_name):
+        """Resolves the layout of a struct"""
+        layout = self.layouts.get(type_name)
+        if layout:
+            return layout
+
+        if type_name in self.resolving_type_names:
+            raise CatsParseException('recursive layout detected: {0}'.format(' -> '.join(self.resolving_type_names + [type_name])))
+
+        type_descriptor = self.type_descriptors[type_name]
+        if 'struct' != type_descriptor['type']:
+            raise CatsParseException('"{0}" is not a struct'.format(type_name))
+
+        self.resolving_type_names.append(type_name)
+        try:
+            fields = self._resolve_fields(type_name, type_descriptor['layout'])
+        finally:
+            self.resolving_type_names.pop()
+
+        layout = _place_fields(type_name, fields)
+        self.layouts[type_name] = layout
+        return layout
+
+    def _resolve_fields(self, type_name, field_descriptors):
+        field_descriptors_by_name = {}
+        fields = []
+        for field_descriptor in field_descriptors:
+            disposition = field_descriptor.get('disposition')
+            if 'inline' == disposition:
+                fields += self.resolve(field_descriptor['type']).fields
+                continue
+
+            field_descriptors_by_name.setdefault(field_descriptor['name'], field_descriptor)
+            if 'const' == disposition:
+                continue
+
+            field = self._resolve_field(field_descriptor)
+            if 'condition' in field_descriptor:
+                field = field._replace(
+                    condition=field_descriptor['condition'],
+                    condition_value=self._resolve_condition_value(type_name, field_descriptor, field_descriptors_by_name))
+
+            fields.append(field)
+
+        return fields
+
+    def _resolve_type(self, name, type_name, size=None, signedness=None):
+        # aliases are expanded to their builtin widths
+        type_descriptor = self.type_descriptors.get(type_name)
+        if type_descriptor and 'byte' == type_descriptor['type']:
+            size = type_descriptor['size']
+            signedness = type_descriptor['signedness']
+
+        if type_descriptor and 'enum' == type_descriptor['type']:
+            return _create_field(name, 'integer', type_name, type_descriptor['size'], signedness=type_descriptor['signedness'])
+
+        if type_descriptor and 'struct' == type_descriptor['type']:
+            layout = self.resolve(type_name)
+            return _create_field(name, 'struct', type_name, layout.size, layout=layout)
+
+        if size in INTEGER_SIZES:
+            return _create_field(name, 'integer', type_name, size, signedness=signedness)
+
+        return _create_field(name, 'bytes', type_name, size, count=size)
+
+    def _resolve_field(self, field_descriptor):
+        name = field_descriptor['name']
+        type_name = field_descriptor['type']
+
+        # builtin scalars are the only byte fields with signedness, all others are arrays
+        is_array = 'size' in field_descriptor and 'signedness' not in field_descriptor
+        if not is_array:
+            return self._resolve_type(name, type_name, field_descriptor.get('size'), field_descriptor.get('signedness'))
+
+        count = field_descriptor['size']
+        is_fixed_count = not isinstance(count, str)
+        if BUILTIN_TYPE_NAME == type_name:
+            return _create_field(name, 'bytes', type_name, count if is_fixed_count else None, count=count)
+
+        element = self._resolve_type(None, type_name)
+        size = count * element.size if is_fixed_count and element.size is not None else None
+        return _create_field(name, 'array', type_name, size, element=element, count=count)
+
+    def _resolve_condition_value(self, type_name, field_descriptor, field_descriptors_by_name):
+        # conditions refer to enum fields defined before the conditional field in the same struct
+        condition_type_name = field_descriptors_by_name[field_descriptor['condition']]['type']
+        enum_descriptor = self.type_descriptors[condition_type_name]
+        for value_descriptor in enum_descriptor['values']:
+            if field_descriptor['condition_value'] == value_descriptor['name']:
+                return value_descriptor['value']
+
+        raise CatsParseException('"{0}" is not a value of "{1}" used by "{2}.{3}"'.format(
+            field_descriptor['condition_value'], condition_type_name, type_name, field_descriptor['name']))
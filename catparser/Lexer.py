@@ -0,0 +1,167 @@
+import re
+from collections import namedtuple
+from types import MappingProxyType
+from .CatsParseException import CatsParseException
+from .parserutils import intern_identifier
+
+Token = namedtuple('Token', ['kind', 'text', 'value'])
+
+KEYWORDS = frozenset(['using', 'enum', 'import', 'struct', 'const', 'inline', 'array', 'sort_key', 'if', 'equals'])
+
+# kinds of tokens that can be used to name a type or a property, naming semantics are checked by the consuming parser
+IDENTIFIER_KINDS = ('type_name', 'property_name', 'keyword', 'identifier', 'primitive')
+
+# keywords and primitive names have property name semantics, so they can be used as property names
+PROPERTY_NAME_KINDS = ('property_name', 'keyword', 'primitive')
+
+# alternatives are tried in order, so more specific token kinds must precede more general ones
+# the sort key argument of arrays is a single token, because its `=` is not surrounded by spaces like other `=`
+# numbers, names and strings follow the same grammar as the regexes of the line parsers
+TOKEN_REGEX = re.compile(
+    r' *(?:'
+    r'(?P<binary_fixed>binary_fixed\((?P<binary_fixed_size>0x[0-9A-Fa-f]+|[0-9]+)\))'
+    r'|(?P<primitive>(?P<primitive_unsigned>u)?int(?P<primitive_bits>8|16|32|64))(?!\w)'
+    r'|(?P<number>0x[0-9A-Fa-f]+|[0-9]+)(?!\w)'
+    r'|(?P<punctuation>sort_key=|[=(),:])'
+    r'|(?P<type_name>[A-Z][a-zA-Z0-9]*)(?!\w)'
+    r'|(?P<property_name>[a-z][a-zA-Z0-9_]*)(?!\w)'
+    r'|(?P<identifier>\w+)'
+    r'|"(?P<string>[\S ]+)"'
+    r')')
+
+# line regexes separate all tokens by single spaces, except the punctuation of arrays (e.g. `array(Foo, size, sort_key=bar)`)
+JOINED_PUNCTUATION = ('(', ')', ',', 'sort_key=')
+
+# tokens of the words (space separated runs) seen so far, schemas reuse a small vocabulary of words
+WORD_TOKENS_CACHE = {}
+WORD_TOKENS_CACHE_MAX_SIZE = 100000
+
+
+def _parse_number(text):
+    return int(text, 16 if text.startswith('0x') else 10)
+
+
+def _make_token(match):
+    kind = match.lastgroup
+    text = match.group(kind)
+    value = text
+    # builtin values are shared by all tokens with the same text, so consumers need to copy them before modification
+    if 'binary_fixed' == kind:
+        kind = 'builtin'
+        value = MappingProxyType({'size': _parse_number(match.group('binary_fixed_size')), 'type': 'byte', 'signedness': 'unsigned'})
+    elif 'primitive' == kind:
+        # primitive names can also be used as property names
+        text = intern_identifier(text)
+        is_unsigned = bool(match.group('primitive_unsigned'))
+        signedness = 'unsigned' if is_unsigned else 'signed'
+        value = MappingProxyType({'size': int(match.group('primitive_bits')) // 8, 'type': 'byte', 'signedness': signedness})
+    elif 'number' == kind:
+        value = _parse_number(text)
+    elif kind in IDENTIFIER_KINDS:
+        # identifiers are stored in many descriptors and compared often, so all occurrences share a single object
+        text = value = intern_identifier(text)
+        if 'property_name' == kind and text in KEYWORDS:
+            kind = 'keyword'
+
+    return Token(kind, text, value)
+
+
+def _is_spaced_like_regexes(tokens):
+    # within a word, `(` and `sort_key=` are followed and `)` and `,` are preceded by a token, and `,` ends the word
+    punctuation = [token.text if 'punctuation' == token.kind else None for token in tokens]
+    return (
+        punctuation[0] not in ('(', ')', ',')
+        and punctuation[-1] not in ('(', 'sort_key=')
+        and ',' not in punctuation[:-1]
+        and all(previous in JOINED_PUNCTUATION or current in JOINED_PUNCTUATION for previous, current in zip(punctuation, punctuation[1:])))
+
+
+def _tokenize_word(word):
+    tokens = []
+    scanner = TOKEN_REGEX.scanner(word)
+    position = 0
+    while position < len(word):
+        match = scanner.match()
+        if not match:
+            raise CatsParseException('unable to tokenize "{0}" at position {1}'.format(word, position))
+
+        tokens.append(_make_token(match))
+        position = match.end()
+
+    # words are checked once before they are cached, so lines do not need to be matched against the regexes of the parsers
+    if not tokens or not _is_spaced_like_regexes(tokens):
+        raise CatsParseException('unexpected spacing around "{0}"'.format(word))
+
+    return tuple(tokens)
+
+
+def tokenize(line):
+    """Splits a stripped line into typed tokens in a single scan"""
+    if not line:
+        return []
+
+    # strings can contain spaces, so a string forms a single word with the rest of the line
+    head, quote, string = line.partition('"')
+    words = head.split(' ')
+    words[-1] += quote + string
+
+    tokens = []
+    for word in words:
+        word_tokens = WORD_TOKENS_CACHE.get(word)
+        if word_tokens is None:
+            word_tokens = _tokenize_word(word)
+            if len(WORD_TOKENS_CACHE) >= WORD_TOKENS_CACHE_MAX_SIZE:
+                WORD_TOKENS_CACHE.clear()
+
+            WORD_TOKENS_CACHE[word] = word_tokens
+
+        tokens += word_tokens
+
+    return tokens
+
+
+def is_builtin_token(token):
+    """Returns true if the token is a builtin type, either binary_fixed or a uint alias"""
+    return token.kind in ('builtin', 'primitive')
+
+
+class TokenReader:
+    """Sequential reader over the tokens of a single line"""
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.index = 0
+
+    def peek(self):
+        """Gets the next token without consuming it or None if all tokens have been consumed"""
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def require(self, *kinds):
+        """Consumes the next token and raises an exception if it is not of one of the specified kinds"""
+        token = self.peek()
+        if not token or token.kind not in kinds:
+            raise CatsParseException('unable to parse "{0}": {1}'.format(' or '.join(kinds), self._describe(token)))
+
+        self.index += 1
+        return token
+
+    def require_text(self, text):
+        """Consumes the next token and raises an exception if it does not have the specified text"""
+        if not self.try_text(text):
+            raise CatsParseException('expected "{0}" but found "{1}"'.format(text, self._describe(self.peek())))
+
+    def try_text(self, text):
+        """Consumes the next token if and only if it has the specified text"""
+        if self.index >= len(self.tokens) or text != self.tokens[self.index].text:
+            return False
+
+        self.index += 1
+        return True
+
+    def require_end(self):
+        """Raises an exception if any tokens have not been consumed"""
+        if self.index < len(self.tokens):
+            raise CatsParseException('unexpected trailing token "{0}"'.format(self.tokens[self.index].text))
+
+    @staticmethod
+    def _describe(token):
+        return token.text if token else '<end>'
@@ -0,0 +1,153 @@
+# pylint: disable=too-many-instance-attributes
+import mmap
+import os
+import re
+from collections import deque
+from .CatsParseException import CatsParseException
+from .CatsParser import CatsParser, iter_buffer_lines
+
+IMPORT_REGEX = re.compile(r'^import "([\S ]+)"$')
+
+
+def map_file(input_file):
+    """Maps an open file into memory read-only, so it can be parsed without reading all of its lines upfront"""
+    # empty files cannot be mapped
+    if not os.fstat(input_file.fileno()).st_size:
+        return b''
+
+    # mapping is released when it is no longer referenced, closing it explicitly fails while a line scan is suspended
+    return mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class MultiFileParser:
+    """CATS parser that resolves imports in global namespace"""
+    def __init__(self, cache=None):
+        # imports are resolved after the importing line has been processed, so that imported types can be yielded
+        self.pending_imports = []
+        self.committed_types = deque()
+        self.cats_parser = CatsParser(self.pending_imports.append, record_links=cache is not None)
+        self.cats_parser.add_type_listener(self._on_type_committed)
+        self.dirname = None
+        self.cache = cache
+
+        # every file is parsed at most once, files are identified by canonical path
+        self.parsed_files = set()
+        self.import_chain = []
+        self.cache_keys = {}
+
+        # ('import', name) and ('type', name, descriptor, links) entries of the files being parsed, which are stored in the cache
+        self.file_entries = []
+
+    def set_include_path(self, include_path):
+        self.dirname = include_path
+
+    def parse(self, schema_filename):
+        deque(self.iter_parse(schema_filename), maxlen=0)
+
+    def iter_parse(self, schema_filename):
+        """Parses a schema file and yields (type_name, type_descriptor) tuples as soon as each type is committed"""
+        yield from self._iter_file(schema_filename)
+
+        # close the last type of the schema file
+        self.cats_parser.type_descriptors()
+        yield from self._drain_committed_types()
+
+    def _on_type_committed(self, type_name, type_descriptor):
+        self.committed_types.append((type_name, type_descriptor))
+        if self.file_entries:
+            self.file_entries[-1].append(('type', type_name, type_descriptor, self.cats_parser.deferred_links.pop(type_name)))
+
+    def _drain_committed_types(self):
+        while self.committed_types:
+            yield self.committed_types.popleft()
+
+    def _get_import_path(self, filename):
+        return os.path.join(self.dirname, filename)
+
+    def _iter_file(self, filename):
+        canonical_filename = os.path.realpath(filename)
+        if any(canonical_filename == chain_filename for chain_filename, _ in self.import_chain):
+            import_chain = [chain_display_name for _, chain_display_name in self.import_chain] + [filename]
+            raise CatsParseException('import cycle detected: {0}'.format(' -> '.join(import_chain)))
+
+        if canonical_filename in self.parsed_files:
+            return
+
+        self.import_chain.append((canonical_filename, filename))
+        self.cats_parser.push_scope(filename)
+
+        with open(filename, 'rb') as input_file:
+            buffer = map_file(input_file)
+            if self.cache:
+                yield from self._iter_buffer_with_cache(filename, buffer)
+            else:
+                yield from self._iter_lines(iter_buffer_lines(buffer))
+
+        self.cats_parser.pop_scope()
+        self.import_chain.pop()
+        self.parsed_files.add(canonical_filename)
+
+    def _iter_lines(self, lines):
+        for line in lines:
+            self.cats_parser.process_line(line)
+            yield from self._drain_committed_types()
+
+            while self.pending_imports:
+                import_name = self.pending_imports.pop(0)
+                if self.file_entries:
+                    self.file_entries[-1].append(('import', import_name))
+
+                yield from self._iter_file(self._get_import_path(import_name))
+
+    def _iter_buffer_with_cache(self, filename, buffer):
+        # imports are processed where they appear in the file both when parsing and when loading cached entries,
+        # so the cache does not change the types that are known when a type is added
+        cache_key = self._find_cache_key(filename, buffer, set())
+        entries = self.cache.load(cache_key) if cache_key else None
+        self.file_entries.append([])
+        if entries is not None:
+            # cached types can link to types of files that are not imported, so their links are validated again
+            for entry in entries:
+                if 'import' == entry[0]:
+                    yield from self._iter_file(self._get_import_path(entry[1]))
+                else:
+                    self.cats_parser.add_type_descriptor(*entry[1:])
+                    yield from self._drain_committed_types()
+        else:
+            yield from self._iter_lines(iter_buffer_lines(buffer))
+
+            # close the last type of the file, so that it is part of the entries of the file
+            self.cats_parser.type_descriptors()
+            yield from self._drain_committed_types()
+
+        file_entries = self.file_entries.pop()
+        if entries is None and cache_key:
+            self.cache.save(cache_key, file_entries)
+
+    def _find_cache_key(self, filename, buffer, scanned_filenames):
+        # cache keys depend on the cache keys of all imported files, which are scanned without parsing them
+        canonical_filename = os.path.realpath(filename)
+        if canonical_filename in self.cache_keys:
+            return self.cache_keys[canonical_filename]
+
+        # files in an import cycle are not cached, the cycle is reported when they are parsed
+        if canonical_filename in scanned_filenames:
+            return None
+
+        scanned_filenames.add(canonical_filename)
+        import_keys = []
+        for line in iter_buffer_lines(buffer):
+            match = IMPORT_REGEX.match(line.strip())
+            if match:
+                import_filename = self._get_import_path(match.group(1))
+                with open(import_filename, 'rb') as input_file:
+                    import_key = self._find_cache_key(import_filename, map_file(input_file), scanned_filenames)
+
+                if not import_key:
+                    return None
+
+                import_keys.append(import_key)
+
+        scanned_filenames.remove(canonical_filename)
+        self.cache_keys[canonical_filename] = self.cache.create_key(buffer, import_keys)
+        return self.cache_keys[canonical_filename]
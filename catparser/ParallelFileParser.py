@@ -0,0 +1,112 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .CatsParseException import CatsParseException
+from .CatsParser import CatsParser, iter_buffer_lines
+from .MultiFileParser import IMPORT_REGEX, map_file
+
+
+def parse_file(filename):
+    """Parses a single schema file without its imports and returns its ('import', name) and ('type', name, descriptor, links) entries"""
+    entries = []
+    parser = CatsParser(lambda import_file: entries.append(('import', import_file)), defer_link_validation=True)
+    parser.add_type_listener(lambda type_name, type_descriptor: entries.append(
+        ('type', type_name, type_descriptor, parser.deferred_links.pop(type_name))))
+
+    parser.push_scope(filename)
+    with open(filename, 'rb') as input_file:
+        parser.process_buffer(map_file(input_file))
+
+    # close the last type of the file
+    parser.type_descriptors()
+    return entries
+
+
+class ParallelFileParser:
+    """CATS parser that parses all files of an import graph in parallel and merges them in import order"""
+    def __init__(self, jobs, cache=None):
+        self.cats_parser = CatsParser(None)
+        self.dirname = None
+        self.jobs = jobs
+        self.cache = cache
+
+        # every file is parsed at most once, files are identified by canonical path
+        self.parsed_files = set()
+        self.file_imports = {}
+        self.cache_keys = {}
+
+    def set_include_path(self, include_path):
+        self.dirname = include_path
+
+    def parse_all(self, schema_filenames):
+        """Parses schema files and all of their imports, types are added in the same order as when parsing serially"""
+        # scan imports first, files are ordered such that all imports of a file precede it
+        ordered_filenames = []
+        for schema_filename in schema_filenames:
+            self._scan_file(schema_filename, [], ordered_filenames)
+
+        cached_entries = {}
+        if self.cache:
+            for filename in ordered_filenames:
+                entries = self.cache.load(self.cache_keys[filename])
+                if entries is not None:
+                    cached_entries[filename] = entries
+
+        # links to types of other files are validated when merging, so all files can be parsed independently
+        filenames_to_parse = [filename for filename in ordered_filenames if filename not in cached_entries]
+        parsed_entries = {}
+        if filenames_to_parse:
+            with ProcessPoolExecutor(self.jobs) as executor:
+                chunk_size = max(1, len(filenames_to_parse) // (4 * self.jobs))
+                parsed_entries = dict(zip(filenames_to_parse, executor.map(parse_file, filenames_to_parse, chunksize=chunk_size)))
+
+        for schema_filename in schema_filenames:
+            self._merge_file(os.path.realpath(schema_filename), cached_entries, parsed_entries)
+
+    def _get_import_path(self, filename):
+        return os.path.join(self.dirname, filename)
+
+    def _scan_file(self, filename, import_chain, ordered_filenames):
+        canonical_filename = os.path.realpath(filename)
+        if any(canonical_filename == chain_filename for chain_filename, _ in import_chain):
+            import_chain = [chain_display_name for _, chain_display_name in import_chain] + [filename]
+            raise CatsParseException('import cycle detected: {0}'.format(' -> '.join(import_chain)))
+
+        if canonical_filename in self.file_imports:
+            return
+
+        import_chain.append((canonical_filename, filename))
+        with open(filename, 'rb') as input_file:
+            buffer = map_file(input_file)
+            import_names = [match.group(1) for match in map(IMPORT_REGEX.match, map(str.strip, iter_buffer_lines(buffer))) if match]
+            imports = [(import_name, os.path.realpath(self._get_import_path(import_name))) for import_name in import_names]
+            for import_name in import_names:
+                self._scan_file(self._get_import_path(import_name), import_chain, ordered_filenames)
+
+            if self.cache:
+                self.cache_keys[canonical_filename] = self.cache.create_key(buffer, [
+                    self.cache_keys[import_filename] for _, import_filename in imports
+                ])
+
+        import_chain.pop()
+        self.file_imports[canonical_filename] = imports
+        ordered_filenames.append(canonical_filename)
+
+    def _merge_file(self, filename, cached_entries, parsed_entries):
+        if filename in self.parsed_files:
+            return
+
+        self.parsed_files.add(filename)
+        import_filenames = dict(self.file_imports[filename])
+
+        # imports are merged where they appear in the file, so types are validated against the types defined before them
+        # (cached types can link to types of files that are not imported, so their links are validated again)
+        is_cached = filename in cached_entries
+        entries = cached_entries[filename] if is_cached else parsed_entries[filename]
+        for entry in entries:
+            if 'import' == entry[0]:
+                self._merge_file(import_filenames[entry[1]], cached_entries, parsed_entries)
+            else:
+                self.cats_parser.add_type_descriptor(*entry[1:])
+
+        if self.cache and not is_cached:
+            self.cache.save(self.cache_keys[filename], entries)
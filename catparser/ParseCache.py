@@ -0,0 +1,60 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+
+CACHE_FILE_EXTENSION = '.pickle'
+
+
+@lru_cache(maxsize=None)
+def parser_version():
+    """Gets a version of the parser that changes whenever any parser source file changes"""
+    # any change to the parser sources can change the produced descriptors, so they are part of every cache key
+    hasher = hashlib.sha256()
+    package_directory = os.path.dirname(os.path.abspath(__file__))
+    for filename in sorted(os.listdir(package_directory)):
+        if filename.endswith('.py'):
+            with open(os.path.join(package_directory, filename), 'rb') as input_file:
+                hasher.update(input_file.read())
+
+    return hasher.hexdigest()
+
+
+class ParseCache:
+    """On-disk cache of the type descriptors defined by each schema file"""
+    def __init__(self, directory):
+        self.directory = directory
+
+    @staticmethod
+    def create_key(content, import_keys):
+        """Creates a cache key for a file from its content (string or bytes-like) and the keys of the files it imports"""
+        hasher = hashlib.sha256()
+        hasher.update(parser_version().encode('ascii'))
+        for import_key in import_keys:
+            hasher.update(import_key.encode('ascii'))
+
+        hasher.update(content.encode('utf-8') if isinstance(content, str) else content)
+        return hasher.hexdigest()
+
+    def load(self, key):
+        """Loads the ('import', name) and ('type', name, descriptor, links) entries stored for a key or None if there are none"""
+        try:
+            with open(self._get_path(key), 'rb') as input_file:
+                return pickle.load(input_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def save(self, key, entries):
+        """Stores ('import', name) and ('type', name, descriptor, links) entries for a key"""
+        os.makedirs(self.directory, exist_ok=True)
+
+        # write to a temporary file first so that concurrent readers never see a partially written entry
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as output_file:
+            pickle.dump(entries, output_file, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_path, self._get_path(key))
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, key + CACHE_FILE_EXTENSION)
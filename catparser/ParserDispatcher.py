@@ -0,0 +1,41 @@
+# pylint: disable=too-few-public-methods
+from .CatsParseException import CatsParseException
+
+# dispatch keywords for lines without a leading keyword of the form `<name> = ...`
+ASSIGNMENT_KEYWORD = '='
+ARRAY_ASSIGNMENT_KEYWORD = '= array'
+
+
+class ParserDispatcher:
+    """Selects the parser factory for a line by its leading keyword instead of trying every factory"""
+    def __init__(self, factories):
+        self.keyword_factories = {factory.keyword: factory for factory in factories}
+
+    def dispatch(self, line):
+        """Returns a (factory, match) tuple for the factory matching the line"""
+        head, _, tail = line.partition(' ')
+        if tail.startswith('= '):
+            keyword = ARRAY_ASSIGNMENT_KEYWORD if tail.startswith('= array(') else ASSIGNMENT_KEYWORD
+        else:
+            keyword = head
+
+        factory = self.keyword_factories.get(keyword)
+        match = factory.is_match(line) if factory else None
+        if not match:
+            raise CatsParseException('unable to parse line: {0}'.format(line))
+
+        return (factory, match)
+
+    def dispatch_tokens(self, line, tokens):
+        """Returns the factory for the parser that should consume the tokens of the line"""
+        if len(tokens) > 1 and '=' == tokens[1].text:
+            keyword = ARRAY_ASSIGNMENT_KEYWORD if len(tokens) > 2 and 'array' == tokens[2].text else ASSIGNMENT_KEYWORD
+        else:
+            keyword = tokens[0].text if tokens else None
+
+        # spacing is checked by the lexer, so the line does not need to be matched against the regex of the factory
+        factory = self.keyword_factories.get(keyword)
+        if not factory:
+            raise CatsParseException('unable to parse line: {0}'.format(line))
+
+        return factory
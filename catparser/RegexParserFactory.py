@@ -3,14 +3,20 @@ import re
 
 class RegexParserFactory:
     """Base for top-level parser factories"""
-    def __init__(self, regex, parser_type):
+
+    # parsers only hold the immutable regex by default, so a single parser can be shared by all lines
+    shares_parser = True
+
+    def __init__(self, regex, parser_type, keyword=None):
         self.regex = re.compile('^{0}$'.format(regex))
         self.parser_type = parser_type
+        self.keyword = keyword
+        self.shared_parser = parser_type(self.regex) if self.shares_parser else None
 
     def is_match(self, line):
         """Returns True if the line is a match for this factory's parser"""
         return self.regex.match(line)
 
     def create(self):
-        """Creates a new parser"""
-        return self.parser_type(self.regex)
+        """Gets the shared parser or creates a new parser if parsers have state"""
+        return self.shared_parser or self.parser_type(self.regex)
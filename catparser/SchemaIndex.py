@@ -0,0 +1,70 @@
+from collections import deque
+
+# builtin type used by all integer and fixed size binary fields
+BUILTIN_TYPE_NAME = 'byte'
+
+
+class SchemaIndex:
+    """Forward and reverse dependency maps between parsed type descriptors"""
+    def __init__(self, type_descriptors):
+        # type name => list of (kind, field name, linked type name)
+        self.forward_links = {}
+
+        # linked type name => set of names of the types linking to it
+        self.reverse_links = {}
+
+        for type_name, type_descriptor in type_descriptors.items():
+            links = list(self._find_links(type_descriptor, type_descriptors))
+            self.forward_links[type_name] = links
+            for _, _, linked_type_name in links:
+                self.reverse_links.setdefault(linked_type_name, set()).add(type_name)
+
+    @staticmethod
+    def _find_links(type_descriptor, type_descriptors):
+        layout = type_descriptor.get('layout', [])
+        fields_by_name = {}
+        for field in layout:
+            if 'name' in field:
+                fields_by_name.setdefault(field['name'], field)
+
+        for field in layout:
+            field_name = field.get('name')
+            field_type_name = field.get('type')
+            if BUILTIN_TYPE_NAME != field_type_name:
+                yield ('inline' if 'inline' == field.get('disposition') else 'type', field_name, field_type_name)
+
+            # array sizes and conditions link to other fields of the same struct, so they depend on the types of those fields
+            if isinstance(field.get('size'), str) and field['size'] in fields_by_name:
+                size_type_name = fields_by_name[field['size']]['type']
+                if BUILTIN_TYPE_NAME != size_type_name:
+                    yield ('size', field_name, size_type_name)
+
+            if 'sort_key' in field and field_type_name in type_descriptors:
+                yield ('sort_key', field_name, field_type_name)
+
+            if 'condition' in field and field['condition'] in fields_by_name:
+                yield ('condition', field_name, fields_by_name[field['condition']]['type'])
+
+    def links(self, type_name):
+        """Gets (kind, field name, linked type name) tuples for all links of a type"""
+        return self.forward_links.get(type_name, [])
+
+    def dependencies(self, type_name):
+        """Gets the names of all types directly linked by a type"""
+        return {linked_type_name for _, _, linked_type_name in self.links(type_name)}
+
+    def dependents(self, type_name):
+        """Gets the names of all types directly linking to a type"""
+        return self.reverse_links.get(type_name, set())
+
+    def affected(self, type_names):
+        """Gets the names of the specified types and all types directly or indirectly linking to any of them"""
+        affected_type_names = set(type_names)
+        pending_type_names = deque(affected_type_names)
+        while pending_type_names:
+            for dependent_type_name in self.dependents(pending_type_names.popleft()):
+                if dependent_type_name not in affected_type_names:
+                    affected_type_names.add(dependent_type_name)
+                    pending_type_names.append(dependent_type_name)
+
+        return affected_type_names
@@ -0,0 +1,126 @@
+import os
+from .CatsParseException import CatsParseException
+from .CatsParser import CatsParser
+from .ParallelFileParser import parse_file
+
+
+class SchemaSession:
+    """Parsed schema that is kept up to date by reparsing only changed files and revalidating the links of all files"""
+    def __init__(self, include_path):
+        self.include_path = include_path
+        self.cats_parser = CatsParser(None)
+        self.schema_filenames = []
+
+        # all maps are keyed by canonical path
+        self.file_entries = {}
+        self.file_imports = {}
+        self.file_types = {}
+
+    def add_schema(self, schema_filename):
+        """Adds a schema file, parses it and all of its imports and returns the canonical paths of newly parsed files"""
+        canonical_filename = os.path.realpath(schema_filename)
+        loaded_files = self._load_file(canonical_filename)
+        if canonical_filename not in self.schema_filenames:
+            self.schema_filenames.append(canonical_filename)
+
+        self._merge()
+        return loaded_files
+
+    def update_file(self, filename):
+        """Reparses a changed file and revalidates all files depending on it, returns the canonical paths of affected files"""
+        canonical_filename = os.path.realpath(filename)
+        if canonical_filename not in self.file_entries:
+            return set()
+
+        self._set_file_entries(canonical_filename, self._parse_file(canonical_filename))
+        affected_files = {canonical_filename} | self.dependents(canonical_filename)
+        for _, import_filename in self.file_imports[canonical_filename]:
+            affected_files |= self._load_file(import_filename)
+
+        self._merge()
+        return affected_files
+
+    def importers(self, filename):
+        """Gets the canonical paths of all files directly importing a file"""
+        canonical_filename = os.path.realpath(filename)
+        return {
+            importer for importer, imports in self.file_imports.items()
+            if any(canonical_filename == import_filename for _, import_filename in imports)
+        }
+
+    def dependents(self, filename):
+        """Gets the canonical paths of all files directly or indirectly importing a file"""
+        dependents = set()
+        pending_filenames = [os.path.realpath(filename)]
+        while pending_filenames:
+            for importer in self.importers(pending_filenames.pop()):
+                if importer not in dependents:
+                    dependents.add(importer)
+                    pending_filenames.append(importer)
+
+        return dependents
+
+    def types_defined_by(self, filename):
+        """Gets the names of all types defined by a file"""
+        return self.file_types.get(os.path.realpath(filename), [])
+
+    def type_descriptors(self):
+        """Returns all type descriptors of the session"""
+        return self.cats_parser.type_descriptors()
+
+    def _parse_file(self, filename):  # pylint: disable=no-self-use
+        return parse_file(filename)
+
+    def _set_file_entries(self, canonical_filename, entries):
+        self.file_entries[canonical_filename] = entries
+        self.file_imports[canonical_filename] = [
+            (entry[1], os.path.realpath(os.path.join(self.include_path, entry[1]))) for entry in entries if 'import' == entry[0]
+        ]
+
+    def _load_file(self, canonical_filename):
+        if canonical_filename in self.file_entries:
+            return set()
+
+        self._set_file_entries(canonical_filename, self._parse_file(canonical_filename))
+        loaded_files = {canonical_filename}
+        for _, import_filename in self.file_imports[canonical_filename]:
+            loaded_files |= self._load_file(import_filename)
+
+        return loaded_files
+
+    def _merge(self):
+        # rebuild the symbol table in serial parse order, links of all files are validated because types are global,
+        # so a change can break a file that uses a type of the changed file without importing it
+        # (when the merge fails, the last valid symbol table is kept)
+        cats_parser = CatsParser(None)
+        file_types = {}
+        for schema_filename in self.schema_filenames:
+            self._merge_file(cats_parser, schema_filename, file_types, [])
+
+        # forget files that are no longer imported by any schema
+        for canonical_filename in set(self.file_entries) - set(file_types):
+            del self.file_entries[canonical_filename]
+            del self.file_imports[canonical_filename]
+
+        self.cats_parser = cats_parser
+        self.file_types = file_types
+
+    def _merge_file(self, cats_parser, canonical_filename, file_types, import_chain):
+        if canonical_filename in import_chain:
+            raise CatsParseException('import cycle detected: {0}'.format(' -> '.join(import_chain + [canonical_filename])))
+
+        if canonical_filename in file_types:
+            return
+
+        import_chain.append(canonical_filename)
+        import_filenames = dict(self.file_imports[canonical_filename])
+        type_names = []
+        for entry in self.file_entries[canonical_filename]:
+            if 'import' == entry[0]:
+                self._merge_file(cats_parser, import_filenames[entry[1]], file_types, import_chain)
+            else:
+                cats_parser.add_type_descriptor(*entry[1:])
+                type_names.append(entry[1])
+
+        import_chain.pop()
+        file_types[canonical_filename] = type_names
@@ -0,0 +1,48 @@
+import os
+from .SchemaIndex import SchemaIndex
+
+
+def get_file_states(filenames):
+    """Gets (modification time, size) tuples for files keyed by filename, files that cannot be accessed have no state"""
+    file_states = {}
+    for filename in filenames:
+        try:
+            file_stat = os.stat(filename)
+            file_states[filename] = (file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            file_states[filename] = None
+
+    return file_states
+
+
+class SchemaWatcher:
+    """Detects changed files of a schema session and the types that are affected by reparsing them"""
+    def __init__(self, session):
+        self.session = session
+        self.file_states = get_file_states(session.file_entries)
+
+    def find_changed_files(self):
+        """Gets the canonical paths of all files of the session that changed since they were last updated"""
+        current_file_states = get_file_states(self.session.file_entries)
+        return [filename for filename, state in current_file_states.items() if state != self.file_states.get(filename)]
+
+    def update_files(self, filenames):
+        """Reparses changed files and returns the names of all types that were added, removed or changed"""
+        previous_type_descriptors = dict(self.session.type_descriptors())
+        try:
+            for filename in filenames:
+                self.session.update_file(filename)
+        finally:
+            # files that fail to parse are only reparsed after they change again, newly imported files are watched too
+            self.file_states = get_file_states(self.session.file_entries)
+
+        type_descriptors = self.session.type_descriptors()
+        return {
+            type_name for type_name in set(previous_type_descriptors) | set(type_descriptors)
+            if previous_type_descriptors.get(type_name) != type_descriptors.get(type_name)
+        }
+
+    def find_affected_types(self, changed_type_names, type_names):
+        """Filters type names, preserving order, to the types directly or indirectly linking to any changed type"""
+        affected_type_names = SchemaIndex(self.session.type_descriptors()).affected(changed_type_names)
+        return [type_name for type_name in type_names if type_name in affected_type_names]
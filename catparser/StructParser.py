@@ -1,9 +1,12 @@
 # pylint: disable=too-few-public-methods
 from .CatsParseException import CatsParseException
-from .CompositeTypeParser import CompositeTypeParser
+from .CompositeTypeParser import CompositeTypeParser, CompositeTypeParserFactory
+from .Lexer import IDENTIFIER_KINDS, PROPERTY_NAME_KINDS, TokenReader, is_builtin_token
+from .ParserDispatcher import ARRAY_ASSIGNMENT_KEYWORD, ASSIGNMENT_KEYWORD, ParserDispatcher
 from .RegexParserFactory import RegexParserFactory
+from .TypeDescriptors import FieldDescriptor
 from .parserutils import \
-    is_builtin, is_dec_or_hex, is_primitive, \
+    intern_identifier, is_builtin, is_dec_or_hex, is_primitive, \
     parse_builtin, parse_dec_or_hex, require_property_name, require_user_type_name
 
 
@@ -11,19 +14,29 @@ from .parserutils import \
 
 class StructParser(CompositeTypeParser):
     """Parser for `struct` statements"""
+    member_descriptor_class = FieldDescriptor
+
     def __init__(self, regex):
-        super().__init__(regex, [
-            StructConstParserFactory(),
-            StructInlineParserFactory(),
-            StructArrayMemberParserFactory(),
-            StructScalarMemberParserFactory()
-        ])
+        super().__init__(regex, STRUCT_MEMBER_FACTORIES, STRUCT_MEMBER_DISPATCHER)
+
+        # indexes over layout used to validate appended properties without scanning the layout
+        self.fields_by_name = {}
+        self.descriptor_uids = set()
 
     def process_line(self, line):
-        match = self.regex.match(line)
+        return self.process_match(self.regex.match(line))
+
+    def process_match(self, match):
         self.type_name = require_user_type_name(match.group(1))
         self.type_descriptor = {'type': 'struct', 'layout': []}
 
+    def process_tokens(self, tokens):
+        reader = TokenReader(tokens)
+        reader.require_text('struct')
+        self.type_name = reader.require('type_name').text
+        reader.require_end()
+        self.type_descriptor = {'type': 'struct', 'layout': []}
+
     def append(self, property_type_descriptor):
         if 'size' in property_type_descriptor:
             self._require_known_property(property_type_descriptor['size'])
@@ -34,21 +47,28 @@ class StructParser(CompositeTypeParser):
         descriptor_uid = self._get_descriptor_uid(property_type_descriptor)
         if descriptor_uid[0]:
             self._require_unknown_property(descriptor_uid)
+            self.descriptor_uids.add(descriptor_uid)
+
+            # when multiple properties share a name (with different dispositions), the first one is found by name
+            self.fields_by_name.setdefault(descriptor_uid[0], property_type_descriptor)
 
         self.type_descriptor['layout'].append(property_type_descriptor)
 
+    def field(self, property_name):
+        """Gets the descriptor of the first appended property with the specified name"""
+        self._require_known_property(property_name, False)
+        return self.fields_by_name[property_name]
+
     def _require_known_property(self, property_name, allow_numeric=True):
         # size can be a constant represented by a numeric type
         if allow_numeric and not isinstance(property_name, str):
             return
 
-        if all('name' not in property_type_descriptor or property_name != property_type_descriptor['name']
-               for property_type_descriptor in self.type_descriptor['layout']):
+        if property_name not in self.fields_by_name:
             raise CatsParseException('no definition for referenced property "{0}"'.format(property_name))
 
     def _require_unknown_property(self, descriptor_uid):
-        if any(descriptor_uid == self._get_descriptor_uid(property_type_descriptor)
-               for property_type_descriptor in self.type_descriptor['layout']):
+        if descriptor_uid in self.descriptor_uids:
             raise CatsParseException('duplicate definition for property "{0}"'.format(descriptor_uid))
 
     @staticmethod
@@ -56,10 +76,10 @@ class StructParser(CompositeTypeParser):
         return (descriptor.get('name'), descriptor.get('disposition'))
 
 
-class StructParserFactory(RegexParserFactory):
+class StructParserFactory(CompositeTypeParserFactory):
     """Factory for creating struct parsers"""
     def __init__(self):
-        super().__init__(r'struct (\S+)', StructParser)
+        super().__init__(r'struct (\S+)', StructParser, 'struct')
 
 # endregion
 
@@ -72,7 +92,10 @@ class StructConstParser:
         self.regex = regex
 
     def process_line(self, line):
-        match = self.regex.match(line)
+        return self.process_match(self.regex.match(line))
+
+    @staticmethod
+    def process_match(match):
         type_name = match.group(1)
 
         const_descriptor = {
@@ -88,11 +111,29 @@ class StructConstParser:
 
         return const_descriptor
 
+    @staticmethod
+    def process_tokens(tokens):
+        reader = TokenReader(tokens)
+        reader.require_text('const')
+        type_token = reader.require('primitive', 'type_name')
+
+        const_descriptor = {'name': reader.require(*PROPERTY_NAME_KINDS).text, 'disposition': 'const'}
+        reader.require_text('=')
+        const_descriptor['value'] = reader.require('number').value
+        reader.require_end()
+
+        if 'primitive' == type_token.kind:
+            const_descriptor = {**const_descriptor, **type_token.value}
+        else:
+            const_descriptor['type'] = type_token.text
+
+        return const_descriptor
+
 
 class StructConstParserFactory(RegexParserFactory):
     """Factory for creating struct const parsers"""
     def __init__(self):
-        super().__init__(r'const (\S+) (\S+) = (\S+)', StructConstParser)
+        super().__init__(r'const (\S+) (\S+) = (\S+)', StructConstParser, 'const')
 
 
 # endregion
@@ -105,15 +146,26 @@ class StructInlineParser:
         self.regex = regex
 
     def process_line(self, line):
+        return self.process_match(self.regex.match(line))
+
+    @staticmethod
+    def process_match(match):
         # type is resolved to exist upstream, so its naming doesn't need to be checked here
-        match = self.regex.match(line)
-        return {'type': match.group(1), 'disposition': 'inline'}
+        return {'type': intern_identifier(match.group(1)), 'disposition': 'inline'}
+
+    @staticmethod
+    def process_tokens(tokens):
+        reader = TokenReader(tokens)
+        reader.require_text('inline')
+        type_name = reader.require(*IDENTIFIER_KINDS).text
+        reader.require_end()
+        return {'type': type_name, 'disposition': 'inline'}
 
 
 class StructInlineParserFactory(RegexParserFactory):
     """Factory for creating struct inline parsers"""
     def __init__(self):
-        super().__init__(r'inline (\S+)', StructInlineParser)
+        super().__init__(r'inline (\S+)', StructInlineParser, 'inline')
 
 # endregion
 
@@ -126,29 +178,54 @@ class StructArrayMemberParser:
         self.regex = regex
 
     def process_line(self, line):
-        match = self.regex.match(line)
+        return self.process_match(self.regex.match(line))
 
+    @staticmethod
+    def process_match(match):
         # type is resolved to exist upstream, so its naming doesn't need to be checked here
         array_size = match.group(3)
-        if is_dec_or_hex(array_size):
-            array_size = parse_dec_or_hex(array_size)
+        array_size = parse_dec_or_hex(array_size) if is_dec_or_hex(array_size) else intern_identifier(array_size)
 
         property_type_descriptor = {
-            'type': match.group(2),
+            'type': intern_identifier(match.group(2)),
             'size': array_size
         }
 
         if match.group(4):
-            property_type_descriptor['sort_key'] = match.group(5)
+            property_type_descriptor['sort_key'] = intern_identifier(match.group(5))
 
         property_type_descriptor['name'] = require_property_name(match.group(1))
         return property_type_descriptor
 
+    @staticmethod
+    def process_tokens(tokens):
+        reader = TokenReader(tokens)
+        property_name = reader.require(*PROPERTY_NAME_KINDS).text
+        reader.require_text('=')
+        reader.require_text('array')
+        reader.require_text('(')
+
+        # type is resolved to exist upstream, so its naming doesn't need to be checked here
+        property_type_descriptor = {'type': reader.require(*IDENTIFIER_KINDS).text}
+        reader.require_text(',')
+        size_token = reader.require('number', *IDENTIFIER_KINDS)
+        property_type_descriptor['size'] = size_token.value if 'number' == size_token.kind else size_token.text
+
+        if reader.try_text(','):
+            reader.require_text('sort_key=')
+            property_type_descriptor['sort_key'] = reader.require(*IDENTIFIER_KINDS).text
+
+        reader.require_text(')')
+        reader.require_end()
+
+        property_type_descriptor['name'] = property_name
+        return property_type_descriptor
+
 
 class StructArrayMemberParserFactory(RegexParserFactory):
     """Factory for creating struct member parsers"""
     def __init__(self):
-        super().__init__(r'(\S+) = array\((\S+), (\S+)(, sort_key=(\S+))?\)', StructArrayMemberParser)
+        super().__init__(r'(\S+) = array\((\S+), (\S+)(, sort_key=(\S+))?\)', StructArrayMemberParser, ARRAY_ASSIGNMENT_KEYWORD)
 
 # endregion
 
@@ -161,26 +238,62 @@ class StructScalarMemberParser:
         self.regex = regex
 
     def process_line(self, line):
-        match = self.regex.match(line)
+        return self.process_match(self.regex.match(line))
+
+    @staticmethod
+    def process_match(match):
         linked_type_name = match.group(2)
 
         # type is resolved to exist upstream, so its naming doesn't need to be checked here
         if is_builtin(linked_type_name):
             property_type_descriptor = parse_builtin(linked_type_name)  # reduce builtins to byte
         else:
-            property_type_descriptor = {'type': linked_type_name}
+            property_type_descriptor = {'type': intern_identifier(linked_type_name)}
 
         if match.group(3):
-            property_type_descriptor['condition'] = match.group(4)
-            property_type_descriptor['condition_value'] = match.group(5)
+            property_type_descriptor['condition'] = intern_identifier(match.group(4))
+            property_type_descriptor['condition_value'] = intern_identifier(match.group(5))
 
         property_type_descriptor['name'] = require_property_name(match.group(1))
         return property_type_descriptor
 
+    @staticmethod
+    def process_tokens(tokens):
+        reader = TokenReader(tokens)
+        property_name = reader.require(*PROPERTY_NAME_KINDS).text
+        reader.require_text('=')
+
+        # type is resolved to exist upstream, so its naming doesn't need to be checked here
+        linked_type_token = reader.require('builtin', 'primitive', *IDENTIFIER_KINDS)
+        if is_builtin_token(linked_type_token):
+            property_type_descriptor = dict(linked_type_token.value)  # reduce builtins to byte
+        else:
+            property_type_descriptor = {'type': linked_type_token.text}
+
+        if reader.try_text('if'):
+            property_type_descriptor['condition'] = reader.require(*IDENTIFIER_KINDS).text
+            reader.require_text('equals')
+            property_type_descriptor['condition_value'] = reader.require(*IDENTIFIER_KINDS).text
+
+        reader.require_end()
+
+        property_type_descriptor['name'] = property_name
+        return property_type_descriptor
+
 
 class StructScalarMemberParserFactory(RegexParserFactory):
     """Factory for creating struct member parsers"""
     def __init__(self):
-        super().__init__(r'(\S+) = (\S+)( if (\S+) equals (\S+))?', StructScalarMemberParser)
+        super().__init__(r'(\S+) = (\S+)( if (\S+) equals (\S+))?', StructScalarMemberParser, ASSIGNMENT_KEYWORD)
 
 # endregion
+
+
+# member factories are immutable, so they are shared by all struct parsers
+STRUCT_MEMBER_FACTORIES = (
+    StructConstParserFactory(),
+    StructInlineParserFactory(),
+    StructArrayMemberParserFactory(),
+    StructScalarMemberParserFactory()
+)
+STRUCT_MEMBER_DISPATCHER = ParserDispatcher(STRUCT_MEMBER_FACTORIES)
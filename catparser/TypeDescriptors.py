@@ -0,0 +1,109 @@
+from collections.abc import Mapping
+from .parserutils import intern_identifier
+
+# marks keys without a value, None is a valid value
+_UNSET = object()
+
+
+class SlottedDescriptor(Mapping):
+    """Read-only mapping storing a fixed set of keys in slots, compares equal to a dict with the same items"""
+    __slots__ = ()
+
+    # key => slot name of the derived class
+    slot_names = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # slot names are prefixed so that keys (e.g. `values`) do not hide mapping methods
+        cls.slot_names = {slot_name[1:]: slot_name for slot_name in cls.__slots__}
+
+    def __init__(self, *mappings):
+        slot_names = self.slot_names
+        for mapping in mappings:
+            for key, value in mapping.items():
+                if key not in slot_names:
+                    raise KeyError('{0} does not support key "{1}"'.format(type(self).__name__, key))
+
+                setattr(self, slot_names[key], value)
+
+    def __getitem__(self, key):
+        value = getattr(self, self.slot_names.get(key, ''), _UNSET)
+        if _UNSET is value:
+            raise KeyError(key)
+
+        return value
+
+    def get(self, key, default=None):
+        return getattr(self, self.slot_names.get(key, ''), default)
+
+    def __contains__(self, key):
+        return hasattr(self, self.slot_names.get(key, ''))
+
+    def __iter__(self):
+        return (key for key, slot_name in self.slot_names.items() if hasattr(self, slot_name))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        return (_load_descriptor, (type(self), dict(self)))
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, dict(self))
+
+
+def _load_descriptor(descriptor_class, items):
+    # names are interned again, so that descriptors loaded from different pickles share them
+    return descriptor_class({
+        key: intern_identifier(value) if isinstance(value, str) and 'comments' != key else value for key, value in items.items()
+    })
+
+
+class FieldDescriptor(SlottedDescriptor):
+    """Descriptor of a struct field"""
+    __slots__ = (
+        '_name', '_type', '_size', '_signedness', '_disposition', '_value', '_sort_key', '_condition', '_condition_value', '_comments'
+    )
+
+
+class EnumValueDescriptor(SlottedDescriptor):
+    """Descriptor of an enum value"""
+    __slots__ = ('_name', '_value', '_comments')
+
+
+class StructDescriptor(SlottedDescriptor):
+    """Descriptor of a struct type"""
+    __slots__ = ('_type', '_layout', '_comments')
+
+
+class EnumDescriptor(SlottedDescriptor):
+    """Descriptor of an enum type"""
+    __slots__ = ('_type', '_size', '_signedness', '_values', '_comments')
+
+
+class AliasDescriptor(SlottedDescriptor):
+    """Descriptor of a type alias of a builtin type"""
+    __slots__ = ('_type', '_size', '_signedness', '_comments')
+
+
+def create_type_descriptor(*mappings):
+    """Creates a type descriptor of the appropriate kind from the items of all mappings"""
+    if any('layout' in mapping for mapping in mappings):
+        return StructDescriptor(*mappings)
+
+    if any('values' in mapping for mapping in mappings):
+        return EnumDescriptor(*mappings)
+
+    return AliasDescriptor(*mappings)
+
+
+def descriptor_to_dict(value):
+    """Converts a descriptor, including all nested descriptors, into builtin dicts and lists"""
+    if isinstance(value, Mapping):
+        return {key: descriptor_to_dict(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [descriptor_to_dict(item) for item in value]
+
+    return value
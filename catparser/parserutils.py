@@ -1,4 +1,5 @@
 import re
+import sys
 from .CatsParseException import CatsParseException
 
 REGEXES = {
@@ -6,8 +7,8 @@ REGEXES = {
     'property_name': re.compile(r'^[a-z][a-zA-Z0-9_]*$'),
 
     'int_or_uint': re.compile(r'^(u)?int(8|16|32|64)$'),
-    'binary_fixed_type': re.compile(r'^binary_fixed\((0x[0-9A-F]+|[0-9]+)\)$'),
-    'dec_or_hex': re.compile(r'^(0x[0-9A-F]+|[0-9]+)$'),
+    'binary_fixed_type': re.compile(r'^binary_fixed\((0x[0-9A-Fa-f]+|[0-9]+)\)$'),
+    'dec_or_hex': re.compile(r'^(0x[0-9A-Fa-f]+|[0-9]+)$'),
 }
 
 
@@ -19,16 +20,21 @@ def _match_regex_or_throw(regex_key, line):
     return match
 
 
+def intern_identifier(name):
+    """Returns the single shared instance of a type or property name"""
+    return sys.intern(name)
+
+
 def require_user_type_name(type_name):
     """Raises an exception if the specified name is not a valid user type name"""
     _match_regex_or_throw('user_type_name', type_name)
-    return type_name
+    return intern_identifier(type_name)
 
 
 def require_property_name(type_name):
     """Raises an exception if the specified name is not a valid property name"""
     _match_regex_or_throw('property_name', type_name)
-    return type_name
+    return intern_identifier(type_name)
 
 
 def is_primitive(type_name):
@@ -49,6 +55,10 @@ def is_dec_or_hex(string):
 
 def parse_dec_or_hex(string):
     """Parses a string as either decimal or hexidecimal"""
+    # int accepts signs and underscores, which are not part of the number grammar
+    if not is_dec_or_hex(string):
+        raise ValueError('invalid decimal or hexidecimal number: {0}'.format(string))
+
     base = 16 if string.startswith('0x') else 10
     return int(string, base)
 
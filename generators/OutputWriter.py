@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class OutputWriter:
+    """Writes generated files to a directory and only touches files whose content changed"""
+    def __init__(self, output_path, manifest_filename):
+        self.output_path = output_path
+        self.manifest_filename = manifest_filename
+        self.previous_hashes = self._load_manifest()
+        self.hashes = {}
+        self.written_filenames = []
+        self.removed_filenames = []
+
+    def write(self, descriptor):
+        """Writes a generated Descriptor unless an identical file already exists and returns true if it was written"""
+        # lines are streamed to a temporary file, so a file is never held in memory as a whole
+        output_filename = os.path.join(self.output_path, descriptor.filename)
+        temp_filename = output_filename + '.tmp'
+        hasher = hashlib.sha256()
+        try:
+            with open(temp_filename, 'wb') as output_file:
+                output_file.writelines(self._encode_lines(descriptor.code, hasher))
+
+            content_hash = hasher.hexdigest()
+            self.hashes[descriptor.filename] = content_hash
+            if self._hash_file(output_filename) == content_hash:
+                return False
+
+            os.replace(temp_filename, output_filename)
+        finally:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+
+        self.written_filenames.append(descriptor.filename)
+        return True
+
+    def close(self, remove_stale_files=False):
+        """Saves the manifest and, if enabled, removes previously generated files that were not generated again"""
+        # by default, files of earlier runs are kept (and stay listed in the manifest), so partial runs only add files
+        if remove_stale_files:
+            for filename in sorted(set(self.previous_hashes) - set(self.hashes)):
+                try:
+                    os.remove(os.path.join(self.output_path, filename))
+                    self.removed_filenames.append(filename)
+                except FileNotFoundError:
+                    pass
+
+        manifest_hashes = self.hashes if remove_stale_files else {**self.previous_hashes, **self.hashes}
+        content = json.dumps({'files': manifest_hashes}, indent=4, sort_keys=True) + '\n'
+        if self._read_file(self.manifest_filename) != content.encode('utf-8'):
+            with open(self.manifest_filename, 'w', newline='\n') as manifest_file:
+                manifest_file.write(content)
+
+    def _load_manifest(self):
+        content = self._read_file(self.manifest_filename)
+        if content is None:
+            return {}
+
+        try:
+            return json.loads(content.decode('utf-8'))['files']
+        except (ValueError, KeyError, TypeError):
+            # a damaged manifest only prevents removal of stale files
+            return {}
+
+    @staticmethod
+    def _encode_lines(lines, hasher):
+        for line in lines:
+            encoded_line = ('%s\n' % line).encode('utf-8')
+            hasher.update(encoded_line)
+            yield encoded_line
+
+    @staticmethod
+    def _hash_file(filename):
+        hasher = hashlib.sha256()
+        try:
+            with open(filename, 'rb') as input_file:
+                for block in iter(lambda: input_file.read(HASH_BLOCK_SIZE), b''):
+                    hasher.update(block)
+        except OSError:
+            return None
+
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _read_file(filename):
+        try:
+            with open(filename, 'rb') as input_file:
+                return input_file.read()
+        except OSError:
+            return None
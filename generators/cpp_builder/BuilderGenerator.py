@@ -1,4 +1,4 @@
-# pylint: disable=too-few-public-methods
+from itertools import chain
 from generators.Descriptor import Descriptor
 from .HeaderGenerator import HeaderGenerator
 from .ImplementationGenerator import ImplementationGenerator
@@ -9,35 +9,23 @@ class BuilderGenerator:
     def __init__(self, schema, options):
         self.schema = schema
         self.options = options
-        self.current = None
-        self.generated_header = False
-        self.current_name = None
 
     def __iter__(self):
         """Creates an iterator around this generator"""
-        self.current = iter(self.schema)
-        self.generated_header = False
-        return self
+        return chain.from_iterable(self.generate_transaction(name) for name in self.transaction_names())
 
-    def _iterate_until_next_transaction(self):
-        if self.generated_header:
-            return None
+    def transaction_names(self):
+        """Gets the names of all transactions for which builders are generated"""
+        return [
+            name for name in self.schema
+            if name != 'Transaction' and not name.startswith('Embedded') and name.endswith('Transaction')
+        ]
 
-        name = next(self.current)
-        while name == 'Transaction' or name.startswith('Embedded') or not name.endswith('Transaction'):
-            name = next(self.current)
-        return name
-
-    def __next__(self):
-        """Returns Descriptor with desired filename and generated file content"""
-        if not self.generated_header:
-            self.current_name = self._iterate_until_next_transaction()
-            generator = HeaderGenerator(self.schema, self.options, self.current_name)
-            code = generator.generate()
-            self.generated_header = True
-            return Descriptor('{}.h'.format(generator.builder_name()), code)
-
-        generator = ImplementationGenerator(self.schema, self.options, self.current_name)
-        code = generator.generate()
-        self.generated_header = False
-        return Descriptor('{}.cpp'.format(generator.builder_name()), code)
+    def generate_transaction(self, name):
+        """Returns Descriptors with desired filenames and lazily generated file lines for a single transaction"""
+        header_generator = HeaderGenerator(self.schema, self.options, name)
+        implementation_generator = ImplementationGenerator(self.schema, self.options, name)
+        return [
+            Descriptor('{}.h'.format(header_generator.builder_name()), header_generator.generate_lines()),
+            Descriptor('{}.cpp'.format(implementation_generator.builder_name()), implementation_generator.generate_lines())
+        ]
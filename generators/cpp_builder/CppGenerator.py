@@ -1,11 +1,14 @@
 # pylint: disable=too-few-public-methods
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 import os
 import re
-import yaml
+from string import Formatter
+from .HintStore import DEFAULT_HINTS_DIRECTORY, HINT_STORE
 
 SUFFIX = 'Transaction'
+TEMPLATE_FORMATTER = Formatter()
 
 
 class FieldKind(Enum):
@@ -45,6 +48,24 @@ def singularize(string):
     return string
 
 
+@lru_cache(maxsize=None)
+def indent_prefix(indent):
+    return '\t' * indent
+
+
+# templates are often formatted before they are appended, so the cache is bounded to not grow with every generated type
+# (generating all transaction builders uses less than 300 distinct templates)
+@lru_cache(maxsize=1024)
+def compile_template(multiline_string):
+    """Splits a template into (line, has_placeholders) tuples, lines without placeholders are already unescaped"""
+    compiled_lines = []
+    for line in multiline_string.split('\n'):
+        has_placeholders = any(field_name is not None for _, field_name, _, _ in TEMPLATE_FORMATTER.parse(line))
+        compiled_lines.append((line if has_placeholders else line.format(), has_placeholders))
+
+    return tuple(compiled_lines)
+
+
 class GeneratorInterface(ABC):
     @abstractmethod
     def _add_includes(self):
@@ -87,23 +108,10 @@ class CppGenerator(GeneratorInterface):
         }
 
         self.indent = 0
-        self.hints = CppGenerator._load_hints(['includes', 'namespaces', 'plugin', 'rewrites', 'setters'])[self.transaction_name]
+        # hints are shared by all generators in the process, so they must not be modified
+        self.hints = HINT_STORE.hints(options.get('hints_directory') or DEFAULT_HINTS_DIRECTORY)[self.transaction_name]
         self.prepend_copyright(options['copyright'])
 
-    @staticmethod
-    def _load_hints(filenames):
-        all_hints = {}
-        for filename in filenames:
-            with open('generators/cpp_builder/hints/{0}.yaml'.format(filename)) as input_file:
-                hints = yaml.load(input_file)
-                for hint_key in hints:
-                    if hint_key not in all_hints:
-                        all_hints[hint_key] = {}
-
-                    all_hints[hint_key][filename] = hints.get(hint_key)
-
-        return all_hints
-
     def transaction_body_name(self):
         return '{}Body'.format(self.transaction_name)
 
@@ -119,18 +127,39 @@ class CppGenerator(GeneratorInterface):
                 self.code = [line.strip() for line in header]
 
     def generate(self):
+        return list(self.generate_lines())
+
+    def generate_lines(self):
+        """Yields generated lines, each section of the file is yielded as soon as it is complete"""
+        for chunk in self.generate_chunks():
+            yield from chunk
+
+    def generate_chunks(self):
+        """Yields lists of generated lines, one list per section of the file"""
         self._add_includes()
         self._namespace_start()
+        yield self._flush_code()
+
         self.indent = 1
         self._class_header()
+        yield self._flush_code()
+
         self._setters()
+        yield self._flush_code()
+
         self._builds()
+        yield self._flush_code()
+
         self._privates()
         self._class_footer()
         self.indent = 0
         self._namespace_end()
+        yield self._flush_code()
 
-        return self.code
+    def _flush_code(self):
+        code = self.code
+        self.code = []
+        return code
 
     # region helpers
 
@@ -142,13 +171,17 @@ class CppGenerator(GeneratorInterface):
         return namespace
 
     def append(self, multiline_string, additional_replacements=None):
-        for line in re.split(r'\n', multiline_string):
+        replacements = {**self.replacements, **additional_replacements} if additional_replacements else self.replacements
+        prefix = indent_prefix(self.indent)
+        code = self.code
+        for line, has_placeholders in compile_template(multiline_string):
             # indent non-empty lines
-            if line:
-                replacements = {**self.replacements, **additional_replacements} if additional_replacements else self.replacements
-                self.code.append('\t' * self.indent + line.format(**replacements))
+            if not line:
+                code.append('')
+            elif has_placeholders:
+                code.append(prefix + line.format_map(replacements))
             else:
-                self.code.append('')
+                code.append(prefix + line)
 
     def qualified_type(self, typename):
         namespace = self._get_namespace(typename)
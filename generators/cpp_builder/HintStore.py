@@ -0,0 +1,43 @@
+# pylint: disable=too-few-public-methods
+import os
+import yaml
+
+DEFAULT_HINTS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hints')
+HINT_FILENAMES = ('includes', 'namespaces', 'plugin', 'rewrites', 'setters')
+
+# C implementation is only available when PyYAML is built against libyaml
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class HintStore:
+    """Process-wide store of generator hints, hint files are reloaded only when they are modified"""
+    def __init__(self):
+        self.entries = {}
+
+    def hints(self, directory):
+        """Gets all hints in a directory grouped by transaction name and then by hint filename"""
+        paths = [os.path.join(directory, '{0}.yaml'.format(filename)) for filename in HINT_FILENAMES]
+        mtimes = tuple(os.stat(path).st_mtime_ns for path in paths)
+        entry = self.entries.get(directory)
+        if not entry or entry[0] != mtimes:
+            entry = (mtimes, self._load_hints(paths))
+            self.entries[directory] = entry
+
+        return entry[1]
+
+    @staticmethod
+    def _load_hints(paths):
+        all_hints = {}
+        for filename, path in zip(HINT_FILENAMES, paths):
+            with open(path) as input_file:
+                hints = yaml.load(input_file, Loader=YamlLoader)
+                for hint_key in hints:
+                    if hint_key not in all_hints:
+                        all_hints[hint_key] = {}
+
+                    all_hints[hint_key][filename] = hints.get(hint_key)
+
+        return all_hints
+
+
+HINT_STORE = HintStore()
@@ -1,75 +1,190 @@
-# pylint: disable=too-few-public-methods
 import argparse
 import os
 import pprint
-from catparser.CatsParser import CatsParser
+import time
+from multiprocessing import Pool
+from catparser.CatsParseException import CatsParseException
+from catparser.MultiFileParser import MultiFileParser
+from catparser.ParallelFileParser import ParallelFileParser
+from catparser.ParseCache import ParseCache
+from catparser.SchemaSession import SchemaSession
+from catparser.SchemaWatcher import SchemaWatcher
+from catparser.TypeDescriptors import descriptor_to_dict
 from generators.All import AVAILABLE_GENERATORS
+from generators.Descriptor import Descriptor
+from generators.OutputWriter import OutputWriter
 
 
-class MultiFileParser:
-    """CATS parser that resolves imports in global namespace"""
-    def __init__(self):
-        self.cats_parser = CatsParser(self._process_import_file)
-        self.dirname = None
+# generator used by the current worker process, each worker receives the schema once when it is started
+WORKER_STATE = {}
 
-    def set_include_path(self, include_path):
-        self.dirname = include_path
 
-    def parse(self, schema_filename):
-        self._process_file(schema_filename)
+def _initialize_worker(generator_name, schema, options):
+    WORKER_STATE['generator'] = AVAILABLE_GENERATORS[generator_name](schema, options)
 
-    def _process_import_file(self, filename):
-        filename = os.path.join(self.dirname, filename)
-        self._process_file(filename)
 
-    def _process_file(self, filename):
-        self.cats_parser.push_scope(filename)
+def _generate_transaction(name):
+    # lazily generated lines cannot be sent back to the parent process
+    generated_descriptors = WORKER_STATE['generator'].generate_transaction(name)
+    return [Descriptor(descriptor.filename, list(descriptor.code)) for descriptor in generated_descriptors]
 
-        with open(filename) as input_file:
-            lines = input_file.readlines()
-            for line in lines:
-                self.cats_parser.process_line(line)
 
-        self.cats_parser.pop_scope()
+def _generate_descriptors(generator_name, schema, options, jobs, transaction_names):
+    generator = AVAILABLE_GENERATORS[generator_name](schema, options)
+    if transaction_names is None:
+        transaction_names = generator.transaction_names()
 
+    if jobs <= 1:
+        for name in transaction_names:
+            yield from generator.generate_transaction(name)
 
-def _generate_output(generator_name, directory, schema, options):
-    generator_class = AVAILABLE_GENERATORS[generator_name]
+        return
+
+    # imap yields results in submission order, so output does not depend on the number of workers
+    # (multiprocessing pool is used because executor initializers require python 3.7)
+    with Pool(jobs, _initialize_worker, (generator_name, schema, options)) as pool:
+        for generated_descriptors in pool.imap(_generate_transaction, transaction_names):
+            yield from generated_descriptors
+
+
+def _generate_output(  # pylint: disable=too-many-arguments
+        generator_name, directory, schema, options, jobs, transaction_names=None, prune=False):
     output_path = os.path.join(directory, generator_name)
     os.makedirs(output_path, exist_ok=True)
-    generator = generator_class(schema, options)
-    for generated_descriptor in generator:
-        output_filename = os.path.join(output_path, generated_descriptor.filename)
-        with open(output_filename, 'w', newline='\n') as output_file:
-            for line in generated_descriptor.code:
-                output_file.write('%s\n' % line)
+
+    # manifest is stored next to (not inside) the output directory, so it is not copied along with the generated files
+    writer = OutputWriter(output_path, os.path.join(directory, '{0}.manifest.json'.format(generator_name)))
+    for generated_descriptor in _generate_descriptors(generator_name, schema, options, jobs, transaction_names):
+        writer.write(generated_descriptor)
+
+    # stale files are only removed on request and never when only some transactions are generated
+    writer.close(prune and transaction_names is None)
+    print('{0}: {1} files generated, {2} written, {3} removed'.format(
+        generator_name,
+        len(writer.hashes),
+        len(writer.written_filenames),
+        len(writer.removed_filenames)))
+
+
+def _find_affected_transactions(generator_name, watcher, changed_type_names):
+    # a transaction is affected if it directly or indirectly links to any changed type
+    generator = AVAILABLE_GENERATORS[generator_name](watcher.session.type_descriptors(), {})
+    return watcher.find_affected_types(changed_type_names, generator.transaction_names())
+
+
+def _watch(session, args, options):
+    print('watching {0} schema files for changes'.format(len(session.file_entries)))
+    watcher = SchemaWatcher(session)
+    while True:
+        time.sleep(args.watch_interval)
+        changed_filenames = watcher.find_changed_files()
+        if not changed_filenames:
+            continue
+
+        try:
+            changed_type_names = watcher.update_files(changed_filenames)
+        except (CatsParseException, OSError) as ex:
+            print('failed to parse {0}: {1}'.format(', '.join(changed_filenames), ex))
+            continue
+
+        # generators can fail for valid schemas (e.g. a new transaction without hints), which must not stop watching
+        try:
+            transaction_names = _find_affected_transactions(args.generator, watcher, changed_type_names)
+            print('{0} changed: regenerating {1}'.format(', '.join(changed_filenames), ', '.join(transaction_names) or 'nothing'))
+            if transaction_names:
+                _generate_output(args.generator, args.output, session.type_descriptors(), options, args.jobs, transaction_names)
+        except Exception as ex:  # pylint: disable=broad-except
+            print('failed to generate {0}: {1}'.format(', '.join(changed_filenames), repr(ex)))
+
+
+def _find_schema_files(path):
+    if not os.path.isdir(path):
+        return [path]
+
+    schema_files = []
+    for root, directories, filenames in os.walk(path):
+        directories.sort()
+        schema_files += [os.path.join(root, filename) for filename in sorted(filenames) if filename.endswith('.cats')]
+
+    return schema_files
+
+
+def _read_manifest(manifest_filename):
+    # manifest lists one schema file or directory per line, relative to the manifest
+    manifest_directory = os.path.dirname(manifest_filename)
+    with open(manifest_filename) as input_file:
+        for line in input_file.readlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield os.path.join(manifest_directory, line)
 
 
 def generate():
     parser = argparse.ArgumentParser(description='CATS code generator')
-    parser.add_argument('-s', '--schema', help='input CATS file', required=True)
+    parser.add_argument('-s', '--schema', help='input CATS file or directory (can be repeated)', action='append', default=[])
+    parser.add_argument('-m', '--manifest', help='file listing input CATS files or directories, one per line')
     parser.add_argument('-o', '--output', help='output directory', default='_generated')
     parser.add_argument('-i', '--include', help='schema root directory', default='./schemas')
 
     generators_list = list(AVAILABLE_GENERATORS.keys())
     parser.add_argument('-g', '--generator', help='generator to use to produce output files', choices=generators_list)
     parser.add_argument('-c', '--copyright', help='file containing copyright data to use with output files', default='../HEADER.inc')
+    parser.add_argument('--cache', help='directory used to cache parsed schema files', default='.catscache')
+    parser.add_argument('--no-cache', help='parse all schema files without using the cache', action='store_true')
+    parser.add_argument('--hints', help='directory containing generator hint files (defaults to the generator hints)')
+    parser.add_argument('-j', '--jobs', help='number of processes used to parse schemas and generate output files', type=int, default=1)
+    parser.add_argument('-w', '--watch', help='regenerate affected output files whenever schema files change', action='store_true')
+    parser.add_argument('--prune', help='remove previously generated files that are not generated by this run', action='store_true')
+    parser.add_argument('--watch-interval', help='seconds between checks for changed schema files', type=float, default=1.0)
     args = parser.parse_args()
 
-    file_parser = MultiFileParser()
-    file_parser.set_include_path(args.include)
-    file_parser.parse(args.schema)
+    schema_paths = args.schema + (list(_read_manifest(args.manifest)) if args.manifest else [])
+    if not schema_paths:
+        parser.error('at least one schema or a manifest is required')
+
+    if args.watch and not args.generator:
+        parser.error('watch requires a generator')
 
-    # console output the parsed schema
+    # parse all schemas into a single symbol table, files shared by multiple schemas are only parsed once
+    schema_filenames = [schema_filename for schema_path in schema_paths for schema_filename in _find_schema_files(schema_path)]
     printer = pprint.PrettyPrinter(width=140)
     printer.pprint('*** *** ***')
-    type_descriptors = file_parser.cats_parser.type_descriptors()
-    for key in type_descriptors:
-        printer.pprint((key, type_descriptors[key]))
+    if args.watch:
+        # session remembers file dependencies, so that changed files can be reparsed individually
+        session = SchemaSession(args.include)
+        for schema_filename in schema_filenames:
+            session.add_schema(schema_filename)
+
+        type_descriptors = session.type_descriptors()
+        for type_name, type_descriptor in type_descriptors.items():
+            printer.pprint((type_name, descriptor_to_dict(type_descriptor)))
+    else:
+        cache = None if args.no_cache else ParseCache(args.cache)
+        file_parser = ParallelFileParser(args.jobs, cache) if args.jobs > 1 else MultiFileParser(cache)
+        file_parser.set_include_path(args.include)
+
+        # console output the parsed schema while it is being parsed
+        file_parser.cats_parser.add_type_listener(
+            lambda type_name, type_descriptor: printer.pprint((type_name, descriptor_to_dict(type_descriptor))))
+        if args.jobs > 1:
+            file_parser.parse_all(schema_filenames)
+        else:
+            for schema_filename in schema_filenames:
+                file_parser.parse(schema_filename)
+
+        type_descriptors = file_parser.cats_parser.type_descriptors()
 
     # generate and output code
     if args.generator:
-        _generate_output(args.generator, args.output, type_descriptors, {'copyright': args.copyright})
+        options = {'copyright': args.copyright, 'hints_directory': args.hints}
+        _generate_output(args.generator, args.output, type_descriptors, options, args.jobs, prune=args.prune)
+
+        if args.watch:
+            try:
+                _watch(session, args, options)
+            except KeyboardInterrupt:
+                pass
 
 
-generate()
+if '__main__' == __name__:
+    generate()
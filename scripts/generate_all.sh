@@ -29,16 +29,20 @@ function generate_all {
 		"transfer/transfer"
 	)
 
+	local schema_args=()
 	for input in ${inputs[*]}
 	do
 		echo "generating ${input}"
-		python3 main.py --schema ./schemas/${input}.cats --output _generated --generator ${builder} --copyright $1
-		if [ $? -ne 0 ]; then
-			echo "${start_error_color}ERROR: failed generating ${input}${end_color}"
-			exit 1
-		fi
+		schema_args+=(--schema "./schemas/${input}.cats")
 	done
 
+	# all schemas are parsed and generated by a single process, so builders that are no longer generated can be pruned
+	python3 main.py "${schema_args[@]}" --output _generated --generator ${builder} --copyright $1 --prune
+	if [ $? -ne 0 ]; then
+		echo "${start_error_color}ERROR: failed generating ${inputs[*]}${end_color}"
+		exit 1
+	fi
+
 	echo "${start_success_color}SUCCESS: generation complete with no errors${end_color}"
 }
 
@@ -46,7 +50,7 @@ if [ "$#" -lt 2 ]; then
 	generate_all "../HEADER.inc"
 else
 	nis2_root="$2"
-	rm -rf _generated/${builder}
 	generate_all "${nis2_root}/HEADER.inc"
-	cp ./_generated/${builder}/* ${nis2_root}/sdk/src/builders/
+	# unchanged files keep their modification time, so only changed builders are copied and rebuilt
+	cp -u ./_generated/${builder}/* ${nis2_root}/sdk/src/builders/
 fi
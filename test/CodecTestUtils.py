@@ -0,0 +1,73 @@
+import struct
+from catparser.CatsParser import CatsParser
+
+# reduced transaction schema covering scalar runs, binary fields, arrays, nested structs and unions
+CODEC_SCHEMA_LINES = [
+    'using Amount = uint64',
+    'using Key = binary_fixed(6)',
+    'using MosaicId = uint64',
+    'using Delta = int16',
+    'enum EntityType : uint16',
+    '\ttransfer = 0x4154',
+    '\tnamespace = 0x414E',
+    'enum NamespaceType : uint8',
+    '\troot = 0',
+    '\tchild = 1',
+    'struct SizePrefixedEntity',
+    '\tsize = uint32',
+    'struct Mosaic',
+    '\tmosaicId = MosaicId',
+    '\tamount = Amount',
+    'struct Transaction',
+    '\tinline SizePrefixedEntity',
+    '\ttype = EntityType',
+    '\tsigner = Key',
+    '\tfee = Amount',
+    'struct TransferTransaction',
+    '\tconst EntityType entityType = 0x4154',
+    '\tinline Transaction',
+    '\tmessageSize = uint16',
+    '\tmosaicsCount = uint8',
+    '\tmessage = array(byte, messageSize)',
+    '\tmosaics = array(Mosaic, mosaicsCount, sort_key=mosaicId)',
+    'struct NamespaceTransaction',
+    '\tinline Transaction',
+    '\tnamespaceType = NamespaceType',
+    '\tduration = Amount if namespaceType equals root',
+    '\tparentId = uint64 if namespaceType equals child',
+    '\tnameSize = uint8',
+    '\tname = array(byte, nameSize)',
+    'struct Renewal',
+    '\tnamespaceType = NamespaceType',
+    '\tduration = Amount if namespaceType equals root',
+    '\tcount = uint8',
+    'struct Note',
+    '\ttextSize = uint8',
+    '\ttext = array(byte, textSize)',
+    'struct Journal',
+    '\tnotesCount = uint8',
+    '\tnotes = array(Note, notesCount)',
+    '\tamount = Amount'
+]
+
+
+def parse_type_descriptors(lines):
+    """Parses schema lines and returns the parsed type descriptors"""
+    parser = CatsParser(None)
+    for line in lines:
+        parser.process_line(line)
+
+    return parser.type_descriptors()
+
+
+def pack_transfer(message, mosaics):
+    """Packs a transfer transaction of the codec schema with the specified message and (mosaic id, amount) tuples"""
+    size = 4 + 6 + 2 + 8 + 2 + 1 + len(message) + 16 * len(mosaics)
+    buffer = struct.pack('<IH6sQHB', size, 0x4154, b'KEY123', 100, len(message), len(mosaics)) + message
+    return buffer + b''.join(struct.pack('<QQ', *mosaic) for mosaic in mosaics)
+
+
+def pack_namespace(namespace_type, id_or_duration, name):
+    """Packs a namespace transaction of the codec schema"""
+    size = 4 + 6 + 2 + 8 + 1 + 8 + 1 + len(name)
+    return struct.pack('<IH6sQBQB', size, 0x414E, b'KEY123', 100, namespace_type, id_or_duration, len(name)) + name
@@ -0,0 +1,28 @@
+import os
+from catparser.MultiFileParser import MultiFileParser
+
+# schema files whose types must be added in file order, when parsed from a.cats
+IMPORT_AFTER_USE_FILES = {'a.cats': ['struct X', '\tb = B', 'import "b.cats"'], 'b.cats': ['using B = uint8']}
+IMPORT_BETWEEN_TYPES_FILES = {'a.cats': ['using A = uint8', 'import "b.cats"', 'using C = uint8'], 'b.cats': ['struct B', '\ta = A']}
+
+# schema files where bar.cats does not import foo.cats, so it can only be parsed after it
+UNIMPORTED_LINK_FILES = {'foo.cats': ['using Amount = uint64'], 'bar.cats': ['struct Bar', '\tamount = Amount']}
+
+
+def write_files(directory, files):
+    """Writes schema files, given as lists of lines keyed by relative path, below a directory"""
+    for filename, lines in files.items():
+        full_path = os.path.join(directory, filename)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'w') as output_file:
+            output_file.write('\n'.join(lines) + '\n')
+
+
+def parse_serially(directory, *filenames, cache=None):
+    """Parses schema files below a directory in order with a single multi file parser"""
+    parser = MultiFileParser(cache)
+    parser.set_include_path(directory)
+    for filename in filenames:
+        parser.parse(os.path.join(directory, filename))
+
+    return parser
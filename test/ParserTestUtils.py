@@ -1,4 +1,5 @@
 from catparser.CatsParseException import CatsParseException
+from catparser.Lexer import tokenize
 
 
 class SingleLineParserTestUtils:
@@ -6,26 +7,37 @@ class SingleLineParserTestUtils:
         self.parser_factory_type = parser_factory_type
         self.unittest = unittest
 
+        # test cases can opt into parsing tokens produced by the lexer instead of matching regexes
+        self.use_lexer = getattr(unittest, 'use_lexer', False)
+
+    def process_line(self, parser, line):
+        if self.use_lexer:
+            return parser.process_tokens(tokenize(line))
+
+        return parser.process_line(line)
+
     def assert_parse(self, line, expected_result):
         # Arrange:
         parser = self.parser_factory_type().create()
 
         # Act:
-        result = parser.process_line(line)
+        result = self.process_line(parser, line)
 
         # Assert:
         self.unittest.assertEqual(expected_result, result)
 
     def assert_parse_exception(self, line, exception_type=CatsParseException):
-        # Arrange:
+        # Arrange: lexer rejects all malformed tokens with parse exceptions
         parser = self.parser_factory_type().create()
+        if self.use_lexer:
+            exception_type = CatsParseException
 
         # Sanity:
         self.unittest.assertTrue(self.parser_factory_type().is_match(line))
 
         # Act + Assert:
         with self.unittest.assertRaises(exception_type):
-            parser.process_line(line)
+            self.process_line(parser, line)
 
     def assert_parse_exceptions(self, invalid_lines):
         # Arrange:
@@ -36,7 +48,7 @@ class SingleLineParserTestUtils:
     def assert_naming(self, pattern, valid_names, invalid_names):
         for name in valid_names:
             # Act + Assert: no exception
-            self.parser_factory_type().create().process_line(pattern.format(name))
+            self.process_line(self.parser_factory_type().create(), pattern.format(name))
 
         for name in invalid_names:
             # Act + Assert: exception
@@ -49,7 +61,7 @@ class MultiLineParserTestUtils(SingleLineParserTestUtils):
         parser = self.parser_factory_type().create()
 
         # Act:
-        parser.process_line(line)
+        self.process_line(parser, line)
         result = parser.commit()
 
         # Assert:
@@ -42,3 +42,7 @@ class AliasParserTest(unittest.TestCase):
             'using Age = uint33',  # unknown type
             'using Age = FooBar'  # user type
         ])
+
+
+class AliasParserLexerTest(AliasParserTest):
+    use_lexer = True
@@ -4,12 +4,12 @@ import unittest
 from catparser.CatsParser import CatsParser, CatsParseException
 
 
-def parse_all(lines, imports=None):
+def parse_all(lines, imports=None, use_lexer=True):
     # Act:
     if imports is None:
         imports = []
 
-    parser = CatsParser(imports.append)
+    parser = CatsParser(imports.append, use_lexer)
     for line in lines:
         parser.process_line(line)
 
@@ -31,12 +31,17 @@ def int_descriptor(size, explicit_type=True):
 
 
 class CatsParserTests(unittest.TestCase):
+    use_lexer = True
+
     # region utils
 
+    def _parse_all(self, lines, imports=None):
+        return parse_all(lines, imports, self.use_lexer)
+
     def _assert_parse_delayed_exception(self, lines):
         # Arrange:
         imports = []
-        parser = CatsParser(imports.append)
+        parser = CatsParser(imports.append, self.use_lexer)
         for line in lines[:-1]:
             parser.process_line(line)
 
@@ -50,14 +55,14 @@ class CatsParserTests(unittest.TestCase):
 
     def test_no_types_are_exposed_initially(self):
         # Act:
-        parser = CatsParser(None)
+        parser = CatsParser(None, self.use_lexer)
 
         # Assert:
         self.assertEqual(0, len(parser.type_descriptors()))
 
     def test_no_types_are_extracted_from_blank_lines(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             '',
             '',
             ''
@@ -79,7 +84,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_unattached_comments_are_ignored(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             '# comment alias',
             '# another comment',
             '',  # should clear previous comments
@@ -92,7 +97,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_previously_attached_comments_are_ignored(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             '# comment one',
             'using Age = uint64',
             '# comment two',
@@ -111,7 +116,7 @@ class CatsParserTests(unittest.TestCase):
     def test_can_parse_valid_import(self):
         # Act:
         imports = []
-        type_descriptors = parse_all(['import "foo.cats"'], imports)
+        type_descriptors = self._parse_all(['import "foo.cats"'], imports)
 
         # Assert:
         self.assertEqual(0, len(type_descriptors))
@@ -123,7 +128,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_alias(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'using MosaicId = uint64',
             '# unique account identifier',
             'using Address = binary_fixed(25)'
@@ -140,7 +145,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_struct_builtin_types(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             '# binary layout for a pair',
             'struct Pair',
             '\t# some field comment',
@@ -157,7 +162,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_struct_custom_types(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'using MosaicId = uint16',
             'using Amount = uint16',
             '# binary layout for a mosaic',
@@ -176,7 +181,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_struct_conditional_types(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'enum Shape : uint8',
             '\tcircle = 4',
             '\trectangle = 9',
@@ -200,7 +205,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_struct_array_types(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'using Truck = uint16',
             'using Car = uint16',
             'struct Fleet',
@@ -220,7 +225,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_struct_sorted_array_types(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'struct Face',
             '\teyeColor = uint8',
             'struct Tracking',
@@ -233,9 +238,27 @@ class CatsParserTests(unittest.TestCase):
             {'name': 'faces', 'type': 'Face', 'size': 10, 'sort_key': 'eyeColor', 'comments': ''},
         ]})
 
+    def test_can_parse_struct_sorted_array_types_with_inline_members(self):
+        # Act:
+        type_descriptors = self._parse_all([
+            'struct Head',
+            '	size = uint8',
+            'struct Face',
+            '	inline Head',
+            '	eyeColor = uint8',
+            'struct Tracking',
+            '	faces = array(Face, 10, sort_key=eyeColor)'
+        ])
+
+        # Assert:
+        self.assertEqual(3, len(type_descriptors))
+        self.assertEqual(type_descriptors['Tracking'], {'type': 'struct', 'comments': '', 'layout': [
+            {'name': 'faces', 'type': 'Face', 'size': 10, 'sort_key': 'eyeColor', 'comments': ''},
+        ]})
+
     def test_can_parse_struct_closed_by_other_type(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'struct Mosaic',
             '\tmosaicId = uint64',
             '',
@@ -252,7 +275,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_struct_with_inline_member(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'struct Placeholder',
             'struct Pair',
             '\tfooBar = uint64',
@@ -271,7 +294,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_struct_with_const_member(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'struct Pair',
             '\tfooBar = uint64',
             '# some const comment',
@@ -332,6 +355,25 @@ class CatsParserTests(unittest.TestCase):
             '\tfaces = array(Face, 10, sort_key=eyeColor)'
         ])
 
+    def test_cannot_parse_struct_with_sort_key_of_non_struct_type(self):
+        # Act + Assert:
+        for type_name in ['byte', 'Face']:
+            self._assert_parse_delayed_exception([
+                'using Face = uint16',
+                'struct Tracking',
+                '\tfaces = array({0}, 10, sort_key=eyeColor)'.format(type_name)
+            ])
+
+    def test_cannot_parse_struct_with_sort_key_of_enum_value(self):
+        # Act + Assert:
+        self._assert_parse_delayed_exception([
+            'enum Color : uint8',
+            '\tred = 0x01',
+            'struct Palette',
+            '\tcount = uint8',
+            '\tcolors = array(Color, count, sort_key=red)'
+        ])
+
     def test_cannot_parse_struct_with_unknown_inline_type(self):
         # Act + Assert:
         for type_name in ['MosaicId', 'array(MosaicId, 10)', 'uint8', 'binary_fixed(25)']:
@@ -354,7 +396,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_enum_values(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             '# enumeration of entity types',
             'enum EntityType : uint16',
             '\t# transfer transaction type',
@@ -373,7 +415,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_enum_closed_by_other_type(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'enum EntityType : uint16',
             '\ttransfer = 7',
             '',
@@ -451,7 +493,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_schema_with_duplicate_struct_property_names_in_different_scopes(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'struct Bar',
             '\tfoo = uint8',
             '',
@@ -469,7 +511,7 @@ class CatsParserTests(unittest.TestCase):
 
     def test_can_parse_schema_with_duplicate_enum_property_names_in_different_scopes(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'enum Bar : uint16',
             '\tfoo = 4',
             '',
@@ -487,11 +529,212 @@ class CatsParserTests(unittest.TestCase):
 
     # endregion
 
+    # region member indexes
+
+    def _parse_with_member_indexes(self):
+        parser = CatsParser(None, self.use_lexer)
+        for line in [
+                'enum Shape : uint8',
+                '\tcircle = 4',
+                '\trectangle = 0x09',
+                'struct Base',
+                '\tbaseSize = uint8',
+                'struct Enclosing',
+                '\tconst uint8 version = 1',
+                '\tinline Base',
+                '\tversion = uint8',
+                '\tenclosingType = Shape',
+                'using Circ = uint16'
+        ]:
+            parser.process_line(line)
+
+        parser.type_descriptors()
+        return parser
+
+    def test_enum_member_index_maps_value_names_to_values(self):
+        # Act:
+        parser = self._parse_with_member_indexes()
+
+        # Assert:
+        self.assertEqual({'circle': 4, 'rectangle': 9}, dict(parser.member_index('Shape')))
+
+    def test_struct_member_index_maps_field_names_to_first_field_descriptor(self):
+        # Act:
+        parser = self._parse_with_member_indexes()
+
+        # Assert:
+        member_index = parser.member_index('Enclosing')
+        self.assertEqual(['version', 'enclosingType'], list(member_index.keys()))
+        self.assertEqual('const', member_index['version']['disposition'])
+        self.assertEqual('Shape', member_index['enclosingType']['type'])
+
+    def test_member_index_is_read_only(self):
+        # Act:
+        parser = self._parse_with_member_indexes()
+
+        # Assert:
+        with self.assertRaises(TypeError):
+            parser.member_index('Shape')['triangle'] = 3
+
+    def test_member_index_is_not_available_for_alias(self):
+        # Act:
+        parser = self._parse_with_member_indexes()
+
+        # Assert:
+        with self.assertRaises(KeyError):
+            parser.member_index('Circ')
+
+    # endregion
+
+    # region buffer
+
+    def _parse_buffer(self, buffer):
+        parser = CatsParser(None, self.use_lexer)
+        parser.process_buffer(buffer)
+        return parser
+
+    def test_can_parse_bytes_buffer(self):
+        # Act:
+        type_descriptors = self._parse_buffer(b'using Truck = uint16\n\nstruct Fleet\n\tcarCount = uint8\n').type_descriptors()
+
+        # Assert:
+        self.assertEqual(self._parse_all(['using Truck = uint16', '', 'struct Fleet', '\tcarCount = uint8']), type_descriptors)
+
+    def test_can_parse_memoryview_buffer_with_any_line_terminators(self):
+        # Act:
+        type_descriptors = self._parse_buffer(memoryview(b'using Truck = uint16\r\nstruct Fleet\r\tcarCount = uint8')).type_descriptors()
+
+        # Assert:
+        self.assertEqual(self._parse_all(['using Truck = uint16', 'struct Fleet', '\tcarCount = uint8']), type_descriptors)
+
+    def test_can_parse_empty_buffer(self):
+        # Act:
+        type_descriptors = self._parse_buffer(b'').type_descriptors()
+
+        # Assert:
+        self.assertEqual(0, len(type_descriptors))
+
+    def test_buffer_parse_tracks_line_numbers(self):
+        # Act + Assert:
+        with self.assertRaises(CatsParseException) as context:
+            self._parse_buffer(b'using Truck = uint16\n\n# comment\nalias Bar = uint8\n')
+
+        self.assertIn('<unknown>:4', str(context.exception))
+
+    # endregion
+
+    # region deferred link validation
+
+    def test_links_to_unknown_types_are_deferred(self):
+        # Arrange:
+        parser = CatsParser(None, self.use_lexer, defer_link_validation=True)
+
+        # Act:
+        for line in ['struct Fleet', '\tcarCount = uint8', '\tcars = array(Car, carCount, sort_key=id)']:
+            parser.process_line(line)
+
+        parser.type_descriptors()
+
+        # Assert:
+        self.assertEqual(['Fleet'], list(parser.deferred_links.keys()))
+        self.assertEqual([
+            [('known_type', 'byte')],
+            [('known_type', 'Car'), ('type_with_field', 'Car', 'id')]
+        ], [links for _, links in parser.deferred_links['Fleet']])
+
+    def test_deferred_links_are_validated_when_type_is_added(self):
+        # Arrange:
+        deferring_parser = CatsParser(None, self.use_lexer, defer_link_validation=True)
+        for line in ['struct Fleet', '\tcar = Car']:
+            deferring_parser.process_line(line)
+
+        fleet_descriptor = deferring_parser.type_descriptors()['Fleet']
+        parser = CatsParser(None, self.use_lexer)
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            parser.add_type_descriptor('Fleet', fleet_descriptor, deferring_parser.deferred_links['Fleet'])
+
+        parser.process_line('using Car = uint16')
+        parser.add_type_descriptor('Fleet', fleet_descriptor, deferring_parser.deferred_links['Fleet'])
+        self.assertEqual(['Car', 'Fleet'], list(parser.type_descriptors().keys()))
+
+    # endregion
+
+    # region type listeners
+
+    def test_listener_is_called_when_type_is_committed(self):
+        # Arrange:
+        committed_types = []
+        parser = CatsParser(None, self.use_lexer)
+        parser.add_type_listener(lambda type_name, type_descriptor: committed_types.append(type_name))
+
+        # Act:
+        for line in ['using Truck = uint16', 'struct Fleet', '\tcarCount = uint8']:
+            parser.process_line(line)
+
+        type_names_before_close = list(committed_types)
+        parser.type_descriptors()
+
+        # Assert: struct is only committed when it is closed
+        self.assertEqual(['Truck'], type_names_before_close)
+        self.assertEqual(['Truck', 'Fleet'], committed_types)
+
+    def test_removed_listener_is_not_called(self):
+        # Arrange:
+        committed_types = []
+        parser = CatsParser(None, self.use_lexer)
+
+        def listener(type_name, _):
+            committed_types.append(type_name)
+
+        parser.add_type_listener(listener)
+        parser.process_line('using Truck = uint16')
+
+        # Act:
+        parser.remove_type_listener(listener)
+        parser.process_line('using Car = uint16')
+
+        # Assert:
+        self.assertEqual(['Truck'], committed_types)
+
+    def test_iter_type_descriptors_yields_types_as_soon_as_they_are_committed(self):
+        # Arrange:
+        processed_lines = []
+
+        def lines():
+            for line in ['using Truck = uint16', 'struct Fleet', '\tcarCount = uint8', 'using Car = uint16', '']:
+                processed_lines.append(line)
+                yield line
+
+        parser = CatsParser(None, self.use_lexer)
+
+        # Act:
+        yielded = [(type_name, len(processed_lines)) for type_name, _ in parser.iter_type_descriptors(lines())]
+
+        # Assert: Fleet is committed by the line defining Car
+        self.assertEqual([('Truck', 1), ('Fleet', 4), ('Car', 4)], yielded)
+        self.assertEqual([], parser.type_listeners)
+
+    def test_iter_type_descriptors_closes_last_type(self):
+        # Arrange:
+        parser = CatsParser(None, self.use_lexer)
+
+        # Act:
+        type_descriptor_tuples = list(parser.iter_type_descriptors(['struct Fleet', '\tcarCount = uint8']))
+
+        # Assert:
+        self.assertEqual(['Fleet'], [type_name for type_name, _ in type_descriptor_tuples])
+        self.assertEqual(['carCount'], [field['name'] for field in type_descriptor_tuples[0][1]['layout']])
+        self.assertEqual(parser.type_descriptors(), dict(type_descriptor_tuples))
+
+    # endregion
+
     # region ordering
 
     def test_type_definition_order_is_preserved(self):
         # Act:
-        type_descriptors = parse_all([
+        type_descriptors = self._parse_all([
             'using Truck = uint16',
             'struct Fleet',
             '\tcarCount = uint8',
@@ -505,3 +748,124 @@ class CatsParserTests(unittest.TestCase):
         self.assertEqual(list(type_descriptors.keys()), ['Truck', 'Fleet', 'Bar', 'Car'])
 
     # endregion
+
+    # region interning
+
+    def test_repeated_names_share_single_object(self):
+        # Act:
+        type_descriptors = self._parse_all([
+            'using Amount = uint64',
+            'struct Mosaic',
+            '\tamount = Amount',
+            'struct Fee',
+            '\tamount = Amount',
+            '\tmosaics = array(Mosaic, amount, sort_key=amount)'
+        ])
+
+        # Assert:
+        type_names = {type_name: type_name for type_name in type_descriptors}
+        mosaic_layout = type_descriptors['Mosaic']['layout']
+        fee_layout = type_descriptors['Fee']['layout']
+        self.assertIs(type_names['Amount'], mosaic_layout[0]['type'])
+        self.assertIs(type_names['Amount'], fee_layout[0]['type'])
+        self.assertIs(type_names['Mosaic'], fee_layout[1]['type'])
+        self.assertIs(mosaic_layout[0]['name'], fee_layout[0]['name'])
+        self.assertIs(mosaic_layout[0]['name'], fee_layout[1]['size'])
+        self.assertIs(mosaic_layout[0]['name'], fee_layout[1]['sort_key'])
+
+    # endregion
+
+
+class CatsParserRegexTests(CatsParserTests):
+    use_lexer = False
+
+
+# region lexer and regex grammar
+
+GRAMMAR_TYPE_LINES = ['using Amount = uint64', 'enum Color : uint8', '\tred = 1', 'struct Mosaic', '\tamount = Amount']
+GRAMMAR_STRUCT_LINES = ['struct Foo', '\tcount = uint8', '\tcolor = Color']
+GRAMMAR_ENUM_LINES = ['enum Shape : uint16']
+
+VALID_GRAMMAR_LINES = [
+    GRAMMAR_ENUM_LINES + ['\tcircle = 0xab', '\tsquare = 0x0C', '\ttriangle = 12'],
+    ['using Hash = binary_fixed(0x2f)'],
+    GRAMMAR_STRUCT_LINES + ['\tuint8 = uint16', '\tsize = uint32', '\tamounts = array(Amount, uint8)'],
+    GRAMMAR_STRUCT_LINES + ['\tamounts = array(Amount, 0x0a)', '\tmosaics = array(Mosaic, count, sort_key=amount)'],
+    GRAMMAR_STRUCT_LINES + ['\tradius = uint8 if color equals red', '\tconst uint8 version = 0xff', '\tinline Mosaic']
+]
+
+INVALID_GRAMMAR_LINES = [
+    # spacing
+    GRAMMAR_STRUCT_LINES + ['\tx  = uint8'],
+    GRAMMAR_STRUCT_LINES + ['\tx =  uint8'],
+    GRAMMAR_STRUCT_LINES + ['\tx=uint8'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array(Amount,  10)'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array(Amount,10)'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array( Amount, 10)'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array(Mosaic, count, sort_key = amount)'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array(Mosaic, count, sort_key= amount)'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array(Mosaic, count,sort_key=amount)'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array (Amount, 10)'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array(Amount , 10)'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array(Amount, 10 )'],
+    GRAMMAR_STRUCT_LINES + ['\tx= uint8'],
+    GRAMMAR_STRUCT_LINES + ['\tx =uint8'],
+    GRAMMAR_STRUCT_LINES + ['\tx = uint8 if color  equals red'],
+    GRAMMAR_STRUCT_LINES + ['\tinline  Mosaic'],
+    GRAMMAR_STRUCT_LINES + ['\tconst uint8  version = 1'],
+    GRAMMAR_ENUM_LINES + ['\tcircle  = 1'],
+    ['enum Shape: uint8'],
+    ['using Hash = binary_fixed( 32)'],
+    ['struct  Foo'],
+    ['import  "foo.cats"'],
+    ['import"foo.cats"'],
+    ['enum Shape :uint8'],
+
+    # numbers
+    GRAMMAR_ENUM_LINES + ['\tcircle = -1'],
+    GRAMMAR_ENUM_LINES + ['\tcircle = +1'],
+    GRAMMAR_ENUM_LINES + ['\tcircle = 1_0'],
+    GRAMMAR_ENUM_LINES + ['\tcircle = 0x'],
+    GRAMMAR_ENUM_LINES + ['\tcircle = 0XAB'],
+    GRAMMAR_STRUCT_LINES + ['\tconst uint8 version = 0x1g'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array(Amount, -1)'],
+
+    # names and punctuation
+    GRAMMAR_STRUCT_LINES + ['\tx = Amount.Value'],
+    GRAMMAR_STRUCT_LINES + ['\tx = array(Mosaic, count, sort_key=amount))'],
+    GRAMMAR_STRUCT_LINES + ['\tx = uint8 if color equals blue'],
+    GRAMMAR_STRUCT_LINES + ['\tinline uint8'],
+    ['using Hash = binary_fixed(0x2g)']
+]
+
+
+def parse_outcome(lines, use_lexer):
+    # parsed type descriptors or the type of the raised exception, the regex path raises value errors for malformed numbers
+    try:
+        return dict(parse_all(GRAMMAR_TYPE_LINES + lines, use_lexer=use_lexer))
+    except (CatsParseException, ValueError):
+        return CatsParseException
+
+
+class CatsParserGrammarTests(unittest.TestCase):
+    def test_lexer_and_regex_accept_same_lines(self):
+        for lines in VALID_GRAMMAR_LINES:
+            # Act:
+            regex_outcome = parse_outcome(lines, False)
+            lexer_outcome = parse_outcome(lines, True)
+
+            # Assert:
+            self.assertNotEqual(CatsParseException, regex_outcome, lines)
+            self.assertEqual(regex_outcome, lexer_outcome, lines)
+
+    def test_lexer_and_regex_reject_same_lines(self):
+        for lines in INVALID_GRAMMAR_LINES:
+            # Act:
+            regex_outcome = parse_outcome(lines, False)
+            lexer_outcome = parse_outcome(lines, True)
+
+            # Assert:
+            self.assertEqual(CatsParseException, regex_outcome, lines)
+            self.assertEqual(CatsParseException, lexer_outcome, lines)
+
+# endregion
@@ -41,6 +41,16 @@ class EnumParserTest(unittest.TestCase):
         # Assert
         self.assertEqual(1, len(parser.factories()))
 
+    def test_parsers_share_factories(self):
+        # Act:
+        parser1 = EnumParserFactory().create()
+        parser2 = EnumParserFactory().create()
+
+        # Assert: each enum has its own parser
+        self.assertIsNot(parser1, parser2)
+        self.assertIs(parser1.factories(), parser2.factories())
+        self.assertIs(parser1.dispatcher(), parser2.dispatcher())
+
     def test_can_parse_type_declaration(self):
         for primitive_tuple in PRIMITIVE_TYPE_TUPLES:
             # Act + Assert:
@@ -102,6 +112,10 @@ class EnumParserTest(unittest.TestCase):
             result)
 
 
+class EnumParserLexerTest(EnumParserTest):
+    use_lexer = True
+
+
 class EnumValueParserFactoryTest(unittest.TestCase):
     def test_is_match_returns_true_for_positives(self):
         # Assert:
@@ -115,6 +129,13 @@ class EnumValueParserFactoryTest(unittest.TestCase):
             ' foo = bar', 'foo = bar ', 'foo = ', '= bar', 'foo = array(bar, baz)'
         ])
 
+    def test_create_returns_shared_parser(self):
+        # Arrange:
+        factory = EnumValueParserFactory()
+
+        # Act + Assert:
+        self.assertIs(factory.create(), factory.create())
+
 
 class EnumValueParserTest(unittest.TestCase):
     def _assert_parse(self, line, expected_result):
@@ -140,3 +161,7 @@ class EnumValueParserTest(unittest.TestCase):
     def test_member_names_must_have_property_name_semantics(self):
         # Assert:
         SingleLineParserTestUtils(EnumValueParserFactory, self).assert_naming('{0} = 12', VALID_PROPERTY_NAMES, INVALID_PROPERTY_NAMES)
+
+
+class EnumValueParserLexerTest(EnumValueParserTest):
+    use_lexer = True
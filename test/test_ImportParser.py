@@ -27,3 +27,7 @@ class ImportParserTest(unittest.TestCase):
             SingleLineParserTestUtils(ImportParserFactory, self).assert_parse(
                 'import "{0}"'.format(import_file),
                 ImportResult(import_file))
+
+
+class ImportParserLexerTest(ImportParserTest):
+    use_lexer = True
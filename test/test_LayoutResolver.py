@@ -0,0 +1,273 @@
+# pylint: disable=invalid-name
+import unittest
+from catparser.CatsParseException import CatsParseException
+from catparser.CatsParser import CatsParser
+from catparser.LayoutResolver import LayoutResolver
+
+
+def create_resolver(lines):
+    parser = CatsParser(None)
+    for line in lines:
+        parser.process_line(line)
+
+    return LayoutResolver(parser.type_descriptors())
+
+
+def field_tuples(layout, *keys):
+    return [tuple(getattr(field, key) for key in ('name',) + keys) for field in layout.fields]
+
+
+TYPE_LINES = [
+    'using Amount = uint64',
+    'using Key = binary_fixed(32)',
+    'enum EntityType : uint16',
+    '\ttransfer = 0x4154',
+    '\tlock = 0x4148',
+    'struct Mosaic',
+    '\tmosaicId = uint64',
+    '\tamount = Amount',
+    'struct SizePrefixedEntity',
+    '\tsize = uint32',
+    'struct Transaction',
+    '\tinline SizePrefixedEntity',
+    '\tsigner = Key',
+    '\ttype = EntityType'
+]
+
+
+class LayoutResolverTest(unittest.TestCase):
+    def test_aliases_and_enums_are_expanded_to_widths(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES + ['struct Foo', '\tdelta = int8', '\tamount = Amount', '\tkey = Key', '\ttype = EntityType'])
+
+        # Act:
+        layout = resolver.resolve('Foo')
+
+        # Assert:
+        self.assertEqual([
+            ('delta', 'integer', 'byte', 1, 'signed'),
+            ('amount', 'integer', 'Amount', 8, 'unsigned'),
+            ('key', 'bytes', 'Key', 32, None),
+            ('type', 'integer', 'EntityType', 2, 'unsigned')
+        ], field_tuples(layout, 'kind', 'type_name', 'size', 'signedness'))
+
+    def test_fixed_struct_has_offsets_and_size(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES)
+
+        # Act:
+        layout = resolver.resolve('Mosaic')
+
+        # Assert:
+        self.assertEqual([('mosaicId', 0, 8), ('amount', 8, 8)], field_tuples(layout, 'offset', 'size'))
+        self.assertEqual(16, layout.size)
+        self.assertEqual(16, layout.tail_offset)
+
+    def test_inline_members_are_flattened_and_const_members_are_dropped(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES + [
+            'struct TransferTransaction',
+            '\tconst uint8 version = 3',
+            '\tconst EntityType entityType = 0x4154',
+            '\tinline Transaction',
+            '\tmosaic = Mosaic'
+        ])
+
+        # Act:
+        layout = resolver.resolve('TransferTransaction')
+
+        # Assert:
+        self.assertEqual([
+            ('size', 'integer', 0, 4),
+            ('signer', 'bytes', 4, 32),
+            ('type', 'integer', 36, 2),
+            ('mosaic', 'struct', 38, 16)
+        ], field_tuples(layout, 'kind', 'offset', 'size'))
+        self.assertEqual(54, layout.size)
+        self.assertIs(resolver.resolve('Mosaic'), layout.fields[3].layout)
+
+    def test_variable_arrays_start_tail(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES + [
+            'struct Transfer',
+            '\tmessageSize = uint16',
+            '\tmosaicsCount = uint8',
+            '\tmessage = array(byte, messageSize)',
+            '\tmosaics = array(Mosaic, mosaicsCount, sort_key=mosaicId)',
+            '\tamount = Amount'
+        ])
+
+        # Act:
+        layout = resolver.resolve('Transfer')
+
+        # Assert:
+        self.assertEqual([
+            ('messageSize', 'integer', 0, 2, None),
+            ('mosaicsCount', 'integer', 2, 1, None),
+            ('message', 'bytes', 3, None, 'messageSize'),
+            ('mosaics', 'array', None, None, 'mosaicsCount'),
+            ('amount', 'integer', None, 8, None)
+        ], field_tuples(layout, 'kind', 'offset', 'size', 'count'))
+        self.assertEqual(None, layout.size)
+        self.assertEqual(3, layout.tail_offset)
+        self.assertIs(resolver.resolve('Mosaic'), layout.fields[3].element.layout)
+
+    def test_fixed_arrays_have_fixed_size(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES + [
+            'struct Foo',
+            '\thash = array(byte, 32)',
+            '\tamounts = array(Amount, 3)',
+            '\tmosaics = array(Mosaic, 2)'
+        ])
+
+        # Act:
+        layout = resolver.resolve('Foo')
+
+        # Assert:
+        self.assertEqual([
+            ('hash', 'bytes', 0, 32, 32),
+            ('amounts', 'array', 32, 24, 3),
+            ('mosaics', 'array', 56, 32, 2)
+        ], field_tuples(layout, 'kind', 'offset', 'size', 'count'))
+        self.assertEqual(('integer', 8), (layout.fields[1].element.kind, layout.fields[1].element.size))
+        self.assertEqual(88, layout.size)
+
+    def test_conditional_fields_with_equal_widths_share_offset(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES + [
+            'struct Foo',
+            '\ttype = EntityType',
+            '\tduration = Amount if type equals transfer',
+            '\tparentId = uint64 if type equals lock',
+            '\tid = uint64'
+        ])
+
+        # Act:
+        layout = resolver.resolve('Foo')
+
+        # Assert:
+        self.assertEqual([
+            ('type', 0, None, None),
+            ('duration', 2, 'type', 0x4154),
+            ('parentId', 2, 'type', 0x4148),
+            ('id', 10, None, None)
+        ], field_tuples(layout, 'offset', 'condition', 'condition_value'))
+        self.assertEqual(18, layout.size)
+
+    def test_standalone_conditional_field_starts_tail(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES + [
+            'struct Foo',
+            '\ttype = EntityType',
+            '\tduration = Amount if type equals transfer',
+            '\tid = uint64'
+        ])
+
+        # Act:
+        layout = resolver.resolve('Foo')
+
+        # Assert:
+        self.assertEqual([('type', 0), ('duration', 2), ('id', None)], field_tuples(layout, 'offset'))
+        self.assertEqual(None, layout.size)
+        self.assertEqual(2, layout.tail_offset)
+
+    def test_conditional_fields_with_same_condition_value_do_not_share_offset(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES + [
+            'struct Foo',
+            '\ttype = EntityType',
+            '\tduration = Amount if type equals transfer',
+            '\tparentId = uint64 if type equals transfer',
+            '\tid = uint64'
+        ])
+
+        # Act:
+        layout = resolver.resolve('Foo')
+
+        # Assert: both fields are present for the same value, so they are consecutive
+        self.assertEqual([('type', 0), ('duration', 2), ('parentId', None), ('id', None)], field_tuples(layout, 'offset'))
+        self.assertEqual(None, layout.size)
+        self.assertEqual(2, layout.tail_offset)
+
+    def test_conditional_fields_of_inlined_struct_keep_condition(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES + [
+            'struct Body',
+            '\ttype = EntityType',
+            '\tduration = Amount if type equals transfer',
+            '\tparentId = uint64 if type equals lock',
+            'struct Foo',
+            '\tinline SizePrefixedEntity',
+            '\tinline Body'
+        ])
+
+        # Act:
+        layout = resolver.resolve('Foo')
+
+        # Assert:
+        self.assertEqual([
+            ('size', 0, None),
+            ('type', 4, None),
+            ('duration', 6, 0x4154),
+            ('parentId', 6, 0x4148)
+        ], field_tuples(layout, 'offset', 'condition_value'))
+        self.assertEqual(14, layout.size)
+
+    def test_layouts_are_memoized(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES)
+
+        # Act:
+        layout = resolver.resolve('Transaction')
+
+        # Assert:
+        self.assertIs(layout, resolver.resolve('Transaction'))
+        self.assertEqual({'SizePrefixedEntity', 'Transaction'}, set(resolver.layouts))
+
+    def test_can_resolve_all_structs(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES)
+
+        # Act:
+        layouts = resolver.resolve_all()
+
+        # Assert:
+        self.assertEqual(['Mosaic', 'SizePrefixedEntity', 'Transaction'], list(layouts))
+        self.assertEqual([16, 4, 38], [layout.size for layout in layouts.values()])
+
+    def test_cannot_resolve_non_struct(self):
+        # Arrange:
+        resolver = create_resolver(TYPE_LINES)
+
+        # Act + Assert:
+        for type_name in ['Amount', 'EntityType']:
+            with self.assertRaises(CatsParseException):
+                resolver.resolve(type_name)
+
+    def test_cannot_resolve_recursive_layout(self):
+        # Arrange: parser does not allow a struct to inline itself
+        resolver = LayoutResolver({
+            'Foo': {'type': 'struct', 'layout': [{'type': 'Bar', 'disposition': 'inline'}]},
+            'Bar': {'type': 'struct', 'layout': [{'type': 'Foo', 'disposition': 'inline'}]}
+        })
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            resolver.resolve('Foo')
+
+        self.assertEqual([], resolver.resolving_type_names)
+
+    def test_cannot_resolve_unknown_condition_value(self):
+        # Arrange: parser does not allow conditions on unknown enum values
+        resolver = LayoutResolver({
+            'EntityType': {'type': 'enum', 'size': 2, 'signedness': 'unsigned', 'values': [{'name': 'transfer', 'value': 0x4154}]},
+            'Foo': {'type': 'struct', 'layout': [
+                {'name': 'type', 'type': 'EntityType'},
+                {'name': 'duration', 'type': 'byte', 'size': 8, 'signedness': 'unsigned', 'condition': 'type', 'condition_value': 'lock'}
+            ]}
+        })
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            resolver.resolve('Foo')
@@ -0,0 +1,191 @@
+# pylint: disable=invalid-name
+import unittest
+from test.constants import \
+    BUILTIN_TYPE_TUPLES, VALID_USER_TYPE_NAMES, INVALID_USER_TYPE_NAMES, VALID_PROPERTY_NAMES, INVALID_PROPERTY_NAMES
+from catparser.CatsParseException import CatsParseException
+from catparser.Lexer import Token, TokenReader, tokenize
+
+
+def token_kinds(line):
+    return [token.kind for token in tokenize(line)]
+
+
+class TokenizeTest(unittest.TestCase):
+    def test_no_tokens_are_extracted_from_empty_line(self):
+        # Act:
+        tokens = tokenize('')
+
+        # Assert:
+        self.assertEqual([], tokens)
+
+    def test_can_tokenize_struct_member(self):
+        # Act:
+        tokens = tokenize('mosaics = array(UnresolvedMosaic, mosaicsCount, sort_key=mosaicId)')
+
+        # Assert:
+        self.assertEqual([
+            Token('property_name', 'mosaics', 'mosaics'),
+            Token('punctuation', '=', '='),
+            Token('keyword', 'array', 'array'),
+            Token('punctuation', '(', '('),
+            Token('type_name', 'UnresolvedMosaic', 'UnresolvedMosaic'),
+            Token('punctuation', ',', ','),
+            Token('property_name', 'mosaicsCount', 'mosaicsCount'),
+            Token('punctuation', ',', ','),
+            Token('punctuation', 'sort_key=', 'sort_key='),
+            Token('property_name', 'mosaicId', 'mosaicId'),
+            Token('punctuation', ')', ')')
+        ], tokens)
+
+    def test_can_tokenize_builtin_types(self):
+        for builtin_tuple in BUILTIN_TYPE_TUPLES:
+            # Act:
+            tokens = tokenize(builtin_tuple[0])
+
+            # Assert:
+            self.assertEqual(1, len(tokens))
+            self.assertEqual(builtin_tuple[0], tokens[0].text)
+            self.assertEqual({'type': 'byte', 'size': builtin_tuple[1], 'signedness': builtin_tuple[2]}, tokens[0].value)
+
+    def test_builtin_tokens_distinguish_primitives(self):
+        # Act + Assert:
+        self.assertEqual(['primitive', 'builtin'], token_kinds('uint32 binary_fixed(32)'))
+
+    def test_can_tokenize_numbers(self):
+        # Act:
+        tokens = tokenize('12 0x1F 0x414E')
+
+        # Assert:
+        self.assertEqual([12, 31, 0x414E], [token.value for token in tokens])
+        self.assertEqual(['number'] * 3, [token.kind for token in tokens])
+
+    def test_can_tokenize_lowercase_hex_numbers(self):
+        # Act:
+        tokens = tokenize('0xab 0x1f binary_fixed(0x2f)')
+
+        # Assert:
+        self.assertEqual([0xAB, 0x1F], [token.value for token in tokens[:2]])
+        self.assertEqual(0x2F, tokens[2].value['size'])
+        self.assertEqual(['number', 'number', 'builtin'], [token.kind for token in tokens])
+
+    def test_can_tokenize_string(self):
+        # Act:
+        tokens = tokenize('import "foo bar.cats"')
+
+        # Assert:
+        self.assertEqual([Token('keyword', 'import', 'import'), Token('string', 'foo bar.cats', 'foo bar.cats')], tokens)
+
+    def test_identifiers_are_classified_by_naming_semantics(self):
+        # Act + Assert:
+        for name in VALID_USER_TYPE_NAMES:
+            self.assertEqual(['type_name'], token_kinds(name))
+
+        for name in VALID_PROPERTY_NAMES:
+            self.assertEqual(['property_name'], token_kinds(name))
+
+        for name in INVALID_USER_TYPE_NAMES:
+            self.assertNotEqual(['type_name'], token_kinds(name))
+
+        for name in INVALID_PROPERTY_NAMES:
+            self.assertNotEqual(['property_name'], token_kinds(name))
+
+    def test_keywords_are_classified_as_keywords(self):
+        # Act + Assert:
+        self.assertEqual(['keyword', 'type_name', 'punctuation', 'keyword', 'punctuation', 'keyword'], token_kinds(
+            'struct Foo = if = equals'))
+
+    def test_identifiers_with_same_text_share_single_object(self):
+        # Act: identifiers are part of different words
+        tokens1 = tokenize('amount = array(Amount, 2)')
+        tokens2 = tokenize('amount = Amount if amount equals zero')
+
+        # Assert:
+        self.assertIs(tokens1[0].text, tokens2[0].text)
+        self.assertIs(tokens1[0].text, tokens2[4].text)
+        self.assertIs(tokens1[4].text, tokens2[2].text)
+        self.assertIs(tokens1[4].value, tokens2[2].text)
+
+    def test_malformed_tokens_are_not_classified_as_numbers_or_builtins(self):
+        # Act + Assert:
+        self.assertEqual(['identifier'], token_kinds('2x22'))
+        self.assertEqual(['property_name'], token_kinds('uint33'))
+        self.assertEqual(['property_name', 'punctuation', 'identifier', 'punctuation'], token_kinds('binary_fixed(0x2g)'))
+
+    def test_sort_key_is_only_joined_with_assignment_when_not_spaced(self):
+        # Act + Assert:
+        self.assertEqual(['punctuation', 'property_name', 'punctuation'], token_kinds('sort_key=amount)'))
+        self.assertEqual(['keyword', 'punctuation', 'primitive'], token_kinds('sort_key = uint8'))
+
+    def test_can_tokenize_words_spaced_like_line_regexes(self):
+        # Act + Assert:
+        for line in ['x = array(Foo, 10)', 'x = array(Foo, count, sort_key=id)', 'enum Foo : uint8', 'import "foo bar.cats"']:
+            tokenize(line)
+
+    def test_cannot_tokenize_words_not_spaced_like_line_regexes(self):
+        for line in [
+                'using  Age = uint8', 'using Age=uint8', 'using Age =uint8', 'using Age= uint8', 'import  "foo.cats"', 'import"foo.cats"',
+                'enum Foo :uint8', 'x = array (Foo, 10)', 'x = array( Foo, 10)', 'x = array(Foo , 10)', 'x = array(Foo,10)',
+                'x = array(Foo, 10 )', 'x = array(Foo, count, sort_key= id)', 'x = array(Foo, count, sort_key =id)'
+        ]:
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                tokenize(line)
+
+    def test_cannot_tokenize_unknown_characters(self):
+        for line in ['using ^ = $$$', 'foo\tbar', 'import ""']:
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                tokenize(line)
+
+
+class TokenReaderTest(unittest.TestCase):
+    def test_can_consume_tokens_in_order(self):
+        # Arrange:
+        reader = TokenReader(tokenize('foo = Bar'))
+
+        # Act:
+        name_token = reader.require('property_name')
+        reader.require_text('=')
+        type_token = reader.require('property_name', 'type_name')
+
+        # Assert: no exception
+        reader.require_end()
+        self.assertEqual('foo', name_token.text)
+        self.assertEqual('Bar', type_token.text)
+
+    def test_require_fails_for_unexpected_kind(self):
+        # Arrange:
+        reader = TokenReader(tokenize('foo = Bar'))
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            reader.require('type_name')
+
+    def test_require_fails_at_end(self):
+        # Arrange:
+        reader = TokenReader([])
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            reader.require('type_name')
+
+        with self.assertRaises(CatsParseException):
+            reader.require_text('=')
+
+    def test_try_text_only_consumes_matching_token(self):
+        # Arrange:
+        reader = TokenReader(tokenize('if foo'))
+
+        # Act + Assert:
+        self.assertFalse(reader.try_text('equals'))
+        self.assertTrue(reader.try_text('if'))
+        self.assertEqual('foo', reader.peek().text)
+
+    def test_require_end_fails_when_tokens_remain(self):
+        # Arrange:
+        reader = TokenReader(tokenize('foo bar'))
+        reader.require('property_name')
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            reader.require_end()
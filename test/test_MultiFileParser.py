@@ -0,0 +1,271 @@
+# pylint: disable=invalid-name
+import os
+import tempfile
+import unittest
+from test.FileParserTestUtils import IMPORT_AFTER_USE_FILES, IMPORT_BETWEEN_TYPES_FILES, UNIMPORTED_LINK_FILES, parse_serially, write_files
+from catparser.CatsParseException import CatsParseException
+from catparser.MultiFileParser import MultiFileParser
+from catparser.ParseCache import ParseCache
+
+
+class CountingParseCache(ParseCache):
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def load(self, key):
+        type_descriptor_tuples = super().load(key)
+        if type_descriptor_tuples is None:
+            self.miss_count += 1
+        else:
+            self.hit_count += 1
+
+        return type_descriptor_tuples
+
+
+class MultiFileParserTest(unittest.TestCase):
+    def test_can_parse_file_with_imports(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {
+                'types.cats': ['using Amount = uint64'],
+                'entity.cats': ['import "types.cats"', 'struct Entity', '\tamount = Amount']
+            })
+
+            # Act:
+            parser = parse_serially(directory, 'entity.cats')
+
+            # Assert:
+            self.assertEqual(['Amount', 'Entity'], list(parser.cats_parser.type_descriptors().keys()))
+
+    def test_can_parse_empty_imported_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {'entity.cats': ['import "empty.cats"', 'using Amount = uint64']})
+            with open(os.path.join(directory, 'empty.cats'), 'w'):
+                pass
+
+            # Act:
+            parser = parse_serially(directory, 'entity.cats')
+
+            # Assert:
+            self.assertEqual(['Amount'], list(parser.cats_parser.type_descriptors().keys()))
+            self.assertEqual(2, len(parser.parsed_files))
+
+    def test_diamond_imports_are_parsed_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {
+                'types.cats': ['using Amount = uint64'],
+                'entity.cats': ['import "types.cats"', 'struct Entity', '\tamount = Amount'],
+                'transaction.cats': ['import "types.cats"', 'import "entity.cats"', 'struct Transaction', '\tfee = Amount'],
+                'transfer.cats': ['import "entity.cats"', 'import "transaction.cats"', 'struct Transfer', '\tinline Transaction']
+            })
+
+            # Act:
+            parser = parse_serially(directory, 'transfer.cats')
+
+            # Assert:
+            self.assertEqual(['Amount', 'Entity', 'Transaction', 'Transfer'], list(parser.cats_parser.type_descriptors().keys()))
+
+    def test_files_shared_across_multiple_parse_calls_are_parsed_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {
+                'types.cats': ['using Amount = uint64'],
+                'foo/foo.cats': ['import "types.cats"', 'using Foo = uint8'],
+                'bar/bar.cats': ['import "foo/../types.cats"', 'using Bar = uint8']
+            })
+
+            # Act:
+            parser = parse_serially(directory, 'foo/foo.cats', 'bar/bar.cats', 'types.cats')
+
+            # Assert:
+            self.assertEqual(['Amount', 'Foo', 'Bar'], list(parser.cats_parser.type_descriptors().keys()))
+            self.assertEqual(3, len(parser.parsed_files))
+
+    def test_cannot_parse_file_with_import_cycle(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {
+                'a.cats': ['import "b.cats"', 'using Foo = uint8'],
+                'b.cats': ['import "c.cats"'],
+                'c.cats': ['import "a.cats"']
+            })
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException) as context:
+                parse_serially(directory, 'a.cats')
+
+            import_chain = [os.path.join(directory, name) for name in ['a.cats', 'b.cats', 'c.cats', 'a.cats']]
+            self.assertIn(' -> '.join(import_chain), str(context.exception))
+
+    def test_cannot_parse_file_importing_itself(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {'a.cats': ['import "a.cats"']})
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_serially(directory, 'a.cats')
+
+    # region iter_parse
+
+    def test_iter_parse_yields_imported_types_before_importing_types(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            self._write_transfer_files(directory)
+            parser = MultiFileParser()
+            parser.set_include_path(directory)
+
+            # Act:
+            type_descriptor_tuples = list(parser.iter_parse(os.path.join(directory, 'transfer.cats')))
+
+            # Assert:
+            self.assertEqual(['Amount', 'Mosaic', 'EntityType', 'Transfer'], [type_name for type_name, _ in type_descriptor_tuples])
+            self.assertEqual(parser.cats_parser.type_descriptors(), dict(type_descriptor_tuples))
+
+    def test_iter_parse_yields_types_before_later_imports_are_parsed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {
+                'foo.cats': ['using Foo = uint8'],
+                'bar.cats': ['using Bar = uint8'],
+                'baz.cats': ['import "foo.cats"', 'import "bar.cats"', 'using Baz = uint8']
+            })
+            parser = MultiFileParser()
+            parser.set_include_path(directory)
+
+            # Act:
+            type_descriptor_tuples = parser.iter_parse(os.path.join(directory, 'baz.cats'))
+            first_type_name = next(type_descriptor_tuples)[0]
+            is_bar_parsed = os.path.realpath(os.path.join(directory, 'bar.cats')) in parser.parsed_files
+            remaining_type_names = [type_name for type_name, _ in type_descriptor_tuples]
+
+            # Assert:
+            self.assertEqual('Foo', first_type_name)
+            self.assertFalse(is_bar_parsed)
+            self.assertEqual(['Bar', 'Baz'], remaining_type_names)
+
+    def test_iter_parse_yields_cached_types(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            self._write_transfer_files(directory)
+            parse_serially(directory, 'transfer.cats', cache=ParseCache(os.path.join(directory, 'cache')))
+            parser = MultiFileParser(ParseCache(os.path.join(directory, 'cache')))
+            parser.set_include_path(directory)
+
+            # Act:
+            type_descriptor_tuples = list(parser.iter_parse(os.path.join(directory, 'transfer.cats')))
+
+            # Assert:
+            self.assertEqual(['Amount', 'Mosaic', 'EntityType', 'Transfer'], [type_name for type_name, _ in type_descriptor_tuples])
+
+    # endregion
+
+    # region cache
+
+    @staticmethod
+    def _write_transfer_files(directory):
+        write_files(directory, {
+            'types.cats': ['using Amount = uint64', '# binary layout for a mosaic', 'struct Mosaic', '\tamount = Amount'],
+            'entity.cats': ['import "types.cats"', 'enum EntityType : uint16', '\ttransfer = 0x4154', ''],
+            'transfer.cats': ['import "entity.cats"', 'import "types.cats"', 'struct Transfer', '\tmosaics = array(Mosaic, 10)']
+        })
+
+    def _assert_parse_with_cache(self, directory, cache, expected_counts):
+        # Act:
+        parser = parse_serially(directory, 'transfer.cats', cache=cache)
+        uncached_parser = parse_serially(directory, 'transfer.cats')
+
+        # Assert:
+        self.assertEqual(uncached_parser.cats_parser.type_descriptors(), parser.cats_parser.type_descriptors())
+        self.assertEqual(['Amount', 'Mosaic', 'EntityType', 'Transfer'], list(parser.cats_parser.type_descriptors().keys()))
+        self.assertEqual(expected_counts, (cache.hit_count, cache.miss_count))
+        self.assertEqual(['amount'], list(parser.cats_parser.member_index('Mosaic').keys()))
+        self.assertEqual({'transfer': 0x4154}, dict(parser.cats_parser.member_index('EntityType')))
+
+    def test_cache_is_populated_on_first_parse(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            self._write_transfer_files(directory)
+            cache = CountingParseCache(os.path.join(directory, 'cache'))
+
+            # Act + Assert:
+            self._assert_parse_with_cache(directory, cache, (0, 3))
+            self.assertEqual(3, len(os.listdir(os.path.join(directory, 'cache'))))
+
+    def test_cached_files_are_not_reparsed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            self._write_transfer_files(directory)
+            parse_serially(directory, 'transfer.cats', cache=ParseCache(os.path.join(directory, 'cache')))
+            cache = CountingParseCache(os.path.join(directory, 'cache'))
+
+            # Act + Assert:
+            self._assert_parse_with_cache(directory, cache, (3, 0))
+
+    def test_changed_file_invalidates_itself_and_importing_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            self._write_transfer_files(directory)
+            parse_serially(directory, 'transfer.cats', cache=ParseCache(os.path.join(directory, 'cache')))
+            cache = CountingParseCache(os.path.join(directory, 'cache'))
+
+            with open(os.path.join(directory, 'entity.cats'), 'a') as output_file:
+                output_file.write('# trailing comment\n')
+
+            # Act + Assert:
+            self._assert_parse_with_cache(directory, cache, (1, 2))
+
+    def test_cached_types_are_checked_for_duplicates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {'foo.cats': ['using Foo = uint8'], 'bar.cats': ['using Foo = uint8']})
+            cache = ParseCache(os.path.join(directory, 'cache'))
+            parse_serially(directory, 'foo.cats', cache=cache)
+
+            # Act + Assert: bar.cats is cached because it has the same content as foo.cats
+            with self.assertRaises(CatsParseException):
+                parse_serially(directory, 'foo.cats', 'bar.cats', cache=cache)
+
+    def test_cached_types_are_added_before_imports_following_them(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, IMPORT_AFTER_USE_FILES)
+            cache = ParseCache(os.path.join(directory, 'cache'))
+
+            # Act + Assert: parsing with an empty and with a populated cache fails like parsing without cache
+            for _ in range(2):
+                with self.assertRaises(CatsParseException):
+                    parse_serially(directory, 'a.cats', cache=cache)
+
+    def test_cached_and_uncached_types_are_added_in_same_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, IMPORT_BETWEEN_TYPES_FILES)
+            cache = CountingParseCache(os.path.join(directory, 'cache'))
+
+            # Act:
+            parsers = [parse_serially(directory, 'a.cats', cache=cache) for _ in range(2)]
+
+            # Assert:
+            self.assertEqual((2, 2), (cache.hit_count, cache.miss_count))
+            for parser in parsers:
+                self.assertEqual(['A', 'B', 'C'], list(parser.cats_parser.type_descriptors().keys()))
+
+    def test_cached_types_are_checked_for_unknown_links(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, UNIMPORTED_LINK_FILES)
+            cache = ParseCache(os.path.join(directory, 'cache'))
+            parse_serially(directory, 'foo.cats', 'bar.cats', cache=cache)
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException) as context:
+                parse_serially(directory, 'bar.cats', cache=cache)
+
+            self.assertIn('no definition for linked type "Amount"', str(context.exception))
+
+    # endregion
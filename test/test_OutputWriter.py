@@ -0,0 +1,62 @@
+# pylint: disable=invalid-name
+import json
+import os
+import tempfile
+import unittest
+from generators.Descriptor import Descriptor
+from generators.OutputWriter import OutputWriter
+
+
+def generate(directory, filenames, remove_stale_files=False):
+    """Writes one generated file per filename with a single writer and returns the writer"""
+    writer = OutputWriter(directory, os.path.join(directory, 'manifest.json'))
+    for filename in filenames:
+        writer.write(Descriptor(filename, ['// {0}'.format(filename)]))
+
+    writer.close(remove_stale_files)
+    return writer
+
+
+def load_manifest_filenames(directory):
+    with open(os.path.join(directory, 'manifest.json')) as input_file:
+        return sorted(json.load(input_file)['files'])
+
+
+class OutputWriterTest(unittest.TestCase):
+    def test_unchanged_files_are_not_written_again(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            generate(directory, ['A.cpp', 'B.cpp'])
+
+            # Act:
+            writer = generate(directory, ['A.cpp', 'B.cpp'])
+
+            # Assert:
+            self.assertEqual([], writer.written_filenames)
+            self.assertEqual(['A.cpp', 'B.cpp', 'manifest.json'], sorted(os.listdir(directory)))
+
+    def test_partial_generation_keeps_files_of_previous_runs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange: generate all files and then the files of a single schema
+            generate(directory, ['A.cpp', 'A.h', 'B.cpp', 'B.h'])
+
+            # Act:
+            writer = generate(directory, ['A.cpp', 'A.h'])
+
+            # Assert:
+            self.assertEqual([], writer.removed_filenames)
+            self.assertEqual(['A.cpp', 'A.h', 'B.cpp', 'B.h', 'manifest.json'], sorted(os.listdir(directory)))
+            self.assertEqual(['A.cpp', 'A.h', 'B.cpp', 'B.h'], load_manifest_filenames(directory))
+
+    def test_stale_files_are_removed_when_pruning(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            generate(directory, ['A.cpp', 'A.h', 'B.cpp', 'B.h'])
+
+            # Act:
+            writer = generate(directory, ['A.cpp', 'A.h'], remove_stale_files=True)
+
+            # Assert:
+            self.assertEqual(['B.cpp', 'B.h'], writer.removed_filenames)
+            self.assertEqual(['A.cpp', 'A.h', 'manifest.json'], sorted(os.listdir(directory)))
+            self.assertEqual(['A.cpp', 'A.h'], load_manifest_filenames(directory))
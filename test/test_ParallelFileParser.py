@@ -0,0 +1,235 @@
+# pylint: disable=invalid-name
+import os
+import tempfile
+import unittest
+from test.FileParserTestUtils import IMPORT_AFTER_USE_FILES, IMPORT_BETWEEN_TYPES_FILES, UNIMPORTED_LINK_FILES, parse_serially, write_files
+from catparser.ParallelFileParser import CatsParseException, ParallelFileParser, parse_file
+from catparser.ParseCache import ParseCache
+
+
+class ParallelFileParserTest(unittest.TestCase):
+    # region utils
+
+    @staticmethod
+    def _parse(directory, *filenames, cache=None):
+        parser = ParallelFileParser(2, cache)
+        parser.set_include_path(directory)
+        parser.parse_all([os.path.join(directory, filename) for filename in filenames])
+        return parser
+
+    def _parse_with_cache(self, directory, *filenames):
+        return self._parse(directory, *filenames, cache=ParseCache(os.path.join(directory, 'cache')))
+
+    @staticmethod
+    def _try_parse_serially_with_cache(directory, *filenames):
+        try:
+            parse_serially(directory, *filenames, cache=ParseCache(os.path.join(directory, 'cache')))
+        except CatsParseException:
+            pass
+
+    def _assert_same_as_serial(self, files, *filenames):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, files)
+
+            # Act:
+            parser = self._parse(directory, *filenames)
+            serial_parser = parse_serially(directory, *filenames)
+
+            # Assert:
+            type_descriptors = parser.cats_parser.type_descriptors()
+            self.assertEqual(serial_parser.cats_parser.type_descriptors(), type_descriptors)
+            self.assertEqual(list(serial_parser.cats_parser.type_descriptors().keys()), list(type_descriptors.keys()))
+            self.assertEqual(serial_parser.parsed_files, parser.parsed_files)
+
+    TRANSFER_FILES = {
+        'types.cats': ['using Amount = uint64', '# binary layout for a mosaic', 'struct Mosaic', '\tamount = Amount'],
+        'entity.cats': ['import "types.cats"', 'enum EntityType : uint16', '\ttransfer = 0x4154', ''],
+        'transfer.cats': [
+            'import "entity.cats"',
+            'import "types.cats"',
+            'struct Transfer',
+            '\ttype = EntityType',
+            '\tmosaicsCount = uint8',
+            '\tmosaics = array(Mosaic, mosaicsCount, sort_key=amount)',
+            '\tfee = Amount if type equals transfer'
+        ]
+    }
+
+    # endregion
+
+    # region parse_file
+
+    def test_parse_file_returns_imports_and_types_in_definition_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {'foo.cats': ['using Foo = uint8', 'import "bar.cats"', 'struct Baz', '\tbar = Bar']})
+
+            # Act:
+            entries = parse_file(os.path.join(directory, 'foo.cats'))
+
+            # Assert:
+            self.assertEqual(['type', 'import', 'type'], [entry[0] for entry in entries])
+            self.assertEqual(('type', 'Foo'), entries[0][:2])
+            self.assertEqual(('import', 'bar.cats'), entries[1])
+            self.assertEqual(('type', 'Baz'), entries[2][:2])
+
+    def test_parse_file_defers_links_to_unknown_types(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {'foo.cats': ['struct Baz', '\tbar = Bar']})
+
+            # Act:
+            entries = parse_file(os.path.join(directory, 'foo.cats'))
+
+            # Assert:
+            deferred_links = entries[0][3]
+            self.assertEqual(1, len(deferred_links))
+            self.assertEqual([('known_type', 'Bar')], deferred_links[0][1])
+
+    # endregion
+
+    # region parse_all
+
+    def test_parses_same_types_as_serial_parser(self):
+        self._assert_same_as_serial(self.TRANSFER_FILES, 'transfer.cats')
+
+    def test_parses_same_types_as_serial_parser_for_multiple_schemas(self):
+        self._assert_same_as_serial({
+            'types.cats': ['using Amount = uint64'],
+            'foo/foo.cats': ['import "types.cats"', 'using Foo = uint8'],
+            'bar/bar.cats': ['using Bar = uint8', 'import "foo/../types.cats"', 'struct Baz', '\tamount = Amount']
+        }, 'foo/foo.cats', 'bar/bar.cats', 'types.cats')
+
+    def test_imports_are_merged_where_they_appear(self):
+        self._assert_same_as_serial({
+            'types.cats': ['using Amount = uint64'],
+            'entity.cats': ['using Height = uint64', 'import "types.cats"', 'struct Entity', '\tamount = Amount', '\theight = Height']
+        }, 'entity.cats')
+
+    def _assert_parse_exception(self, files, filename):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, files)
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException) as context:
+                self._parse(directory, filename)
+
+            with self.assertRaises(CatsParseException):
+                parse_serially(directory, filename)
+
+            return str(context.exception)
+
+    def test_cannot_link_to_type_defined_after_import_of_use(self):
+        self._assert_parse_exception({
+            'types.cats': ['using Amount = uint64'],
+            'entity.cats': ['struct Entity', '\tamount = Amount', 'import "types.cats"']
+        }, 'entity.cats')
+
+    def test_cannot_link_to_type_that_is_not_imported(self):
+        message = self._assert_parse_exception({
+            'types.cats': ['using Amount = uint64'],
+            'entity.cats': ['struct Entity', '\tamount = Amount']
+        }, 'entity.cats')
+
+        self.assertIn('entity.cats:2', message)
+
+    def test_cannot_link_to_unknown_sort_key(self):
+        self._assert_parse_exception({
+            'types.cats': ['struct Mosaic', '\tamount = uint64'],
+            'entity.cats': ['import "types.cats"', 'struct Entity', '\tcount = uint8', '\tmosaics = array(Mosaic, count, sort_key=id)']
+        }, 'entity.cats')
+
+    def test_cannot_link_to_unknown_condition_value(self):
+        self._assert_parse_exception({
+            'types.cats': ['enum Shape : uint8', '\tcircle = 4'],
+            'entity.cats': ['import "types.cats"', 'struct Entity', '\tshape = Shape', '\tradius = uint8 if shape equals square']
+        }, 'entity.cats')
+
+    def test_cannot_define_type_in_multiple_files(self):
+        self._assert_parse_exception({
+            'types.cats': ['using Amount = uint64'],
+            'entity.cats': ['import "types.cats"', 'using Amount = uint64']
+        }, 'entity.cats')
+
+    def test_cannot_parse_file_with_import_cycle(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {
+                'a.cats': ['import "b.cats"', 'using Foo = uint8'],
+                'b.cats': ['import "a.cats"']
+            })
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException) as context:
+                self._parse(directory, 'a.cats')
+
+            import_chain = [os.path.join(directory, name) for name in ['a.cats', 'b.cats', 'a.cats']]
+            self.assertIn(' -> '.join(import_chain), str(context.exception))
+
+    # endregion
+
+    # region cache
+
+    def test_cache_entries_are_shared_with_serial_parser(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, self.TRANSFER_FILES)
+            serial_parser = parse_serially(directory, 'transfer.cats', cache=ParseCache(os.path.join(directory, 'cache')))
+
+            # Act:
+            parser = self._parse(directory, 'transfer.cats', cache=ParseCache(os.path.join(directory, 'cache')))
+
+            # Assert:
+            self.assertEqual(serial_parser.cats_parser.type_descriptors(), parser.cats_parser.type_descriptors())
+            self.assertEqual(serial_parser.cache_keys, parser.cache_keys)
+            self.assertEqual(3, len(os.listdir(os.path.join(directory, 'cache'))))
+
+    def test_cache_is_populated_by_parallel_parse(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, self.TRANSFER_FILES)
+
+            # Act:
+            self._parse(directory, 'transfer.cats', cache=ParseCache(os.path.join(directory, 'cache')))
+            parser = self._parse(directory, 'transfer.cats', cache=ParseCache(os.path.join(directory, 'cache')))
+
+            # Assert:
+            self.assertEqual(3, len(os.listdir(os.path.join(directory, 'cache'))))
+            self.assertEqual(['Amount', 'Mosaic', 'EntityType', 'Transfer'], list(parser.cats_parser.type_descriptors().keys()))
+
+    def test_cached_types_are_added_before_imports_following_them(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange: a.cats is cached by the serial parser, if it accepts it
+            write_files(directory, IMPORT_AFTER_USE_FILES)
+            self._try_parse_serially_with_cache(directory, 'a.cats')
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                self._parse_with_cache(directory, 'a.cats')
+
+    def test_cached_and_uncached_types_are_added_in_same_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, IMPORT_BETWEEN_TYPES_FILES)
+
+            # Act:
+            type_descriptors = [self._parse(directory, 'a.cats').cats_parser.type_descriptors()] + [
+                self._parse_with_cache(directory, 'a.cats').cats_parser.type_descriptors() for _ in range(2)
+            ]
+
+            # Assert:
+            self.assertEqual([['A', 'B', 'C']] * 3, [list(descriptors.keys()) for descriptors in type_descriptors])
+
+    def test_cached_types_are_checked_for_unknown_links(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, UNIMPORTED_LINK_FILES)
+            self._parse_with_cache(directory, 'foo.cats', 'bar.cats')
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                self._parse_with_cache(directory, 'bar.cats')
+
+    # endregion
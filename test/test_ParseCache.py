@@ -0,0 +1,77 @@
+# pylint: disable=invalid-name
+import os
+import tempfile
+import unittest
+from catparser.ParseCache import ParseCache, parser_version
+
+
+class ParseCacheTest(unittest.TestCase):
+    def test_parser_version_is_stable(self):
+        # Act + Assert:
+        self.assertEqual(64, len(parser_version()))
+        self.assertEqual(parser_version(), parser_version())
+
+    def test_key_is_deterministic(self):
+        # Act:
+        key1 = ParseCache.create_key('using Foo = uint8\n', ['abc', 'def'])
+        key2 = ParseCache.create_key('using Foo = uint8\n', ['abc', 'def'])
+
+        # Assert:
+        self.assertEqual(key1, key2)
+
+    def test_key_depends_on_content_and_import_keys(self):
+        # Act:
+        key = ParseCache.create_key('using Foo = uint8\n', ['abc', 'def'])
+
+        # Assert:
+        self.assertNotEqual(key, ParseCache.create_key('using Foo = uint16\n', ['abc', 'def']))
+        self.assertNotEqual(key, ParseCache.create_key('using Foo = uint8\n', ['abc', 'deg']))
+        self.assertNotEqual(key, ParseCache.create_key('using Foo = uint8\n', ['def', 'abc']))
+        self.assertNotEqual(key, ParseCache.create_key('using Foo = uint8\n', ['abc']))
+
+    def test_key_of_buffer_matches_key_of_utf8_content(self):
+        # Act:
+        key = ParseCache.create_key('using Foo = uint8\n', ['abc'])
+
+        # Assert:
+        self.assertEqual(key, ParseCache.create_key(b'using Foo = uint8\n', ['abc']))
+        self.assertEqual(key, ParseCache.create_key(memoryview(b'using Foo = uint8\n'), ['abc']))
+
+    def test_can_roundtrip_entries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            cache = ParseCache(os.path.join(directory, 'cache'))
+            entries = [
+                ('type', 'Foo', {'type': 'byte', 'size': 1, 'signedness': 'unsigned', 'comments': 'foo'}, []),
+                ('import', 'baz.cats'),
+                ('type', 'Bar', {'type': 'struct', 'layout': [{'name': 'foo', 'type': 'Foo', 'comments': ''}], 'comments': ''}, [
+                    (('bar.cats:2',), [('known_type', 'Foo')])
+                ])
+            ]
+
+            # Act:
+            cache.save('abcd', entries)
+            loaded_entries = cache.load('abcd')
+
+            # Assert:
+            self.assertEqual(entries, loaded_entries)
+            self.assertEqual(['abcd.pickle'], os.listdir(os.path.join(directory, 'cache')))
+
+    def test_load_returns_none_for_unknown_key(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            cache = ParseCache(directory)
+
+            # Act + Assert:
+            self.assertIsNone(cache.load('abcd'))
+
+    def test_load_returns_none_for_corrupt_entry(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            cache = ParseCache(directory)
+            for content in [b'', b'not a pickle']:
+                with open(os.path.join(directory, 'abcd.pickle'), 'wb') as output_file:
+                    output_file.write(content)
+
+                # Act + Assert:
+                self.assertIsNone(cache.load('abcd'))
@@ -0,0 +1,107 @@
+# pylint: disable=invalid-name
+import unittest
+from catparser.AliasParser import AliasParserFactory
+from catparser.CatsParseException import CatsParseException
+from catparser.ImportParser import ImportParserFactory
+from catparser.Lexer import tokenize
+from catparser.ParserDispatcher import ParserDispatcher
+from catparser.StructParser import \
+    StructConstParserFactory, StructInlineParserFactory, StructArrayMemberParserFactory, StructScalarMemberParserFactory
+
+
+def create_top_level_dispatcher():
+    return ParserDispatcher([AliasParserFactory(), ImportParserFactory()])
+
+
+def create_struct_member_dispatcher():
+    return ParserDispatcher([
+        StructConstParserFactory(),
+        StructInlineParserFactory(),
+        StructArrayMemberParserFactory(),
+        StructScalarMemberParserFactory()
+    ])
+
+
+class ParserDispatcherTest(unittest.TestCase):
+    # region dispatch
+
+    def _assert_dispatch(self, dispatcher, line, expected_factory_type, expected_groups):
+        # Act:
+        factory, match = dispatcher.dispatch(line)
+
+        # Assert:
+        self.assertIsInstance(factory, expected_factory_type)
+        self.assertEqual(expected_groups, match.groups())
+
+    def test_can_dispatch_by_keyword(self):
+        # Arrange:
+        dispatcher = create_top_level_dispatcher()
+
+        # Act + Assert:
+        self._assert_dispatch(dispatcher, 'using Age = uint8', AliasParserFactory, ('Age', 'uint8'))
+        self._assert_dispatch(dispatcher, 'import "foo.cats"', ImportParserFactory, ('foo.cats',))
+
+    def test_can_dispatch_assignments_by_value(self):
+        # Arrange:
+        dispatcher = create_struct_member_dispatcher()
+
+        # Act + Assert:
+        self._assert_dispatch(dispatcher, 'cars = array(Car, 10)', StructArrayMemberParserFactory, ('cars', 'Car', '10', None, None))
+        self._assert_dispatch(dispatcher, 'car = Car', StructScalarMemberParserFactory, ('car', 'Car', None, None, None))
+
+    def test_can_dispatch_keyword_named_property_as_assignment(self):
+        # Arrange:
+        dispatcher = create_struct_member_dispatcher()
+
+        # Act + Assert:
+        self._assert_dispatch(dispatcher, 'const = uint8', StructScalarMemberParserFactory, ('const', 'uint8', None, None, None))
+        self._assert_dispatch(dispatcher, 'inline = uint8', StructScalarMemberParserFactory, ('inline', 'uint8', None, None, None))
+
+    def test_cannot_dispatch_unmatched_line(self):
+        # Arrange:
+        dispatcher = create_top_level_dispatcher()
+
+        # Act + Assert:
+        for line in ['using Age', 'alias Age = uint8', 'foo = uint8', '']:
+            with self.assertRaises(CatsParseException):
+                dispatcher.dispatch(line)
+
+    # endregion
+
+    # region dispatch_tokens
+
+    def _assert_dispatch_tokens(self, dispatcher, line, expected_factory_type):
+        # Act:
+        factory = dispatcher.dispatch_tokens(line, tokenize(line))
+
+        # Assert:
+        self.assertIsInstance(factory, expected_factory_type)
+
+    def test_can_dispatch_tokens_by_keyword(self):
+        # Arrange:
+        dispatcher = create_top_level_dispatcher()
+
+        # Act + Assert:
+        self._assert_dispatch_tokens(dispatcher, 'using Age = uint8', AliasParserFactory)
+        self._assert_dispatch_tokens(dispatcher, 'import "foo.cats"', ImportParserFactory)
+
+    def test_can_dispatch_assignment_tokens_by_value(self):
+        # Arrange:
+        dispatcher = create_struct_member_dispatcher()
+
+        # Act + Assert:
+        self._assert_dispatch_tokens(dispatcher, 'cars = array(Car, 10)', StructArrayMemberParserFactory)
+        self._assert_dispatch_tokens(dispatcher, 'car = Car', StructScalarMemberParserFactory)
+        self._assert_dispatch_tokens(dispatcher, 'const = uint8', StructScalarMemberParserFactory)
+        self._assert_dispatch_tokens(dispatcher, 'inline Car', StructInlineParserFactory)
+
+    def test_cannot_dispatch_unmatched_tokens(self):
+        # Arrange:
+        dispatcher = create_top_level_dispatcher()
+
+        # Act + Assert:
+        for line in ['alias Age = uint8', 'foo = uint8', '']:
+            with self.assertRaises(CatsParseException):
+                dispatcher.dispatch_tokens(line, tokenize(line))
+
+    # endregion
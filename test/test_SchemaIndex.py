@@ -0,0 +1,97 @@
+# pylint: disable=invalid-name
+import unittest
+from catparser.CatsParser import CatsParser
+from catparser.SchemaIndex import SchemaIndex
+
+
+def create_index(lines):
+    parser = CatsParser(None)
+    for line in lines:
+        parser.process_line(line)
+
+    return SchemaIndex(parser.type_descriptors())
+
+
+SCHEMA_LINES = [
+    'using Amount = uint64',
+    'using Count = uint8',
+    'enum EntityType : uint16',
+    '\ttransfer = 0x4154',
+    'struct Mosaic',
+    '\tmosaicId = uint64',
+    '\tamount = Amount',
+    'struct Transaction',
+    '\ttype = EntityType',
+    'struct TransferTransactionBody',
+    '\tmosaicsCount = Count',
+    '\tmosaics = array(Mosaic, mosaicsCount, sort_key=mosaicId)',
+    'struct TransferTransaction',
+    '\tconst EntityType entityType = 0x4154',
+    '\tinline Transaction',
+    '\tinline TransferTransactionBody',
+    'struct Fee',
+    '\tkind = EntityType',
+    '\tamount = Amount if kind equals transfer'
+]
+
+
+class SchemaIndexTest(unittest.TestCase):
+    def test_links_are_indexed_by_kind(self):
+        # Act:
+        index = create_index(SCHEMA_LINES)
+
+        # Assert:
+        self.assertEqual([], index.links('Amount'))
+        self.assertEqual([('type', 'amount', 'Amount')], index.links('Mosaic'))
+        self.assertEqual([
+            ('type', 'mosaicsCount', 'Count'),
+            ('type', 'mosaics', 'Mosaic'),
+            ('size', 'mosaics', 'Count'),
+            ('sort_key', 'mosaics', 'Mosaic')
+        ], index.links('TransferTransactionBody'))
+        self.assertEqual([
+            ('type', 'entityType', 'EntityType'),
+            ('inline', None, 'Transaction'),
+            ('inline', None, 'TransferTransactionBody')
+        ], index.links('TransferTransaction'))
+        self.assertEqual([
+            ('type', 'kind', 'EntityType'),
+            ('type', 'amount', 'Amount'),
+            ('condition', 'amount', 'EntityType')
+        ], index.links('Fee'))
+
+    def test_links_of_unknown_type_are_empty(self):
+        # Act:
+        index = create_index(SCHEMA_LINES)
+
+        # Assert:
+        self.assertEqual([], index.links('Foo'))
+        self.assertEqual(set(), index.dependencies('Foo'))
+        self.assertEqual(set(), index.dependents('Foo'))
+
+    def test_can_query_dependencies(self):
+        # Act:
+        index = create_index(SCHEMA_LINES)
+
+        # Assert:
+        self.assertEqual({'Count', 'Mosaic'}, index.dependencies('TransferTransactionBody'))
+        self.assertEqual({'EntityType', 'Transaction', 'TransferTransactionBody'}, index.dependencies('TransferTransaction'))
+
+    def test_can_query_dependents(self):
+        # Act:
+        index = create_index(SCHEMA_LINES)
+
+        # Assert:
+        self.assertEqual({'Mosaic', 'Fee'}, index.dependents('Amount'))
+        self.assertEqual({'Transaction', 'TransferTransaction', 'Fee'}, index.dependents('EntityType'))
+        self.assertEqual(set(), index.dependents('TransferTransaction'))
+
+    def test_affected_includes_transitive_dependents(self):
+        # Act:
+        index = create_index(SCHEMA_LINES)
+
+        # Assert:
+        self.assertEqual({'Amount', 'Mosaic', 'TransferTransactionBody', 'TransferTransaction', 'Fee'}, index.affected(['Amount']))
+        self.assertEqual({'Count', 'TransferTransactionBody', 'TransferTransaction'}, index.affected(['Count']))
+        self.assertEqual({'TransferTransaction'}, index.affected(['TransferTransaction']))
+        self.assertEqual({'Mosaic', 'Fee', 'TransferTransactionBody', 'TransferTransaction'}, index.affected(['Mosaic', 'Fee']))
@@ -0,0 +1,206 @@
+# pylint: disable=invalid-name
+import os
+import tempfile
+import unittest
+from test.FileParserTestUtils import parse_serially, write_files
+from catparser.SchemaSession import CatsParseException, SchemaSession
+
+
+class CountingSchemaSession(SchemaSession):
+    def __init__(self, include_path):
+        super().__init__(include_path)
+        self.parsed_filenames = []
+
+    def _parse_file(self, filename):
+        self.parsed_filenames.append(os.path.basename(filename))
+        return super()._parse_file(filename)
+
+
+class SchemaSessionTest(unittest.TestCase):
+    # region utils
+
+    @staticmethod
+    def _create_session(directory, *filenames):
+        session = CountingSchemaSession(directory)
+        for filename in filenames:
+            session.add_schema(os.path.join(directory, filename))
+
+        return session
+
+    def _assert_same_as_serial(self, session, directory, *filenames):
+        type_descriptors = session.type_descriptors()
+        serial_type_descriptors = parse_serially(directory, *filenames).cats_parser.type_descriptors()
+        self.assertEqual(serial_type_descriptors, type_descriptors)
+        self.assertEqual(list(serial_type_descriptors.keys()), list(type_descriptors.keys()))
+
+    @staticmethod
+    def _path(directory, *filenames):
+        return {os.path.realpath(os.path.join(directory, filename)) for filename in filenames}
+
+    TRANSFER_FILES = {
+        'types.cats': ['using Amount = uint64', 'struct Mosaic', '\tamount = Amount'],
+        'entity.cats': ['import "types.cats"', 'enum EntityType : uint16', '\ttransfer = 0x4154'],
+        'transfer.cats': ['import "entity.cats"', 'struct Transfer', '\ttype = EntityType', '\tmosaic = Mosaic'],
+        'alias.cats': ['import "entity.cats"', 'struct Alias', '\ttype = EntityType']
+    }
+
+    # endregion
+
+    # region add_schema
+
+    def test_can_add_schemas(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, self.TRANSFER_FILES)
+
+            # Act:
+            session = self._create_session(directory, 'transfer.cats', 'alias.cats')
+
+            # Assert:
+            self._assert_same_as_serial(session, directory, 'transfer.cats', 'alias.cats')
+            self.assertEqual(['transfer.cats', 'entity.cats', 'types.cats', 'alias.cats'], session.parsed_filenames)
+            self.assertEqual(['Amount', 'Mosaic'], session.types_defined_by(os.path.join(directory, 'types.cats')))
+
+    def test_can_query_importers_and_dependents(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, self.TRANSFER_FILES)
+
+            # Act:
+            session = self._create_session(directory, 'transfer.cats', 'alias.cats')
+
+            # Assert:
+            self.assertEqual(self._path(directory, 'entity.cats'), session.importers(os.path.join(directory, 'types.cats')))
+            self.assertEqual(
+                self._path(directory, 'entity.cats', 'transfer.cats', 'alias.cats'),
+                session.dependents(os.path.join(directory, 'types.cats')))
+            self.assertEqual(set(), session.dependents(os.path.join(directory, 'alias.cats')))
+
+    # endregion
+
+    # region update_file
+
+    def test_update_reparses_only_changed_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, self.TRANSFER_FILES)
+            session = self._create_session(directory, 'transfer.cats', 'alias.cats')
+            session.parsed_filenames.clear()
+            write_files(directory, {'types.cats': ['using Amount = uint32', 'struct Mosaic', '\tamount = Amount']})
+
+            # Act:
+            affected_files = session.update_file(os.path.join(directory, 'types.cats'))
+
+            # Assert:
+            self.assertEqual(['types.cats'], session.parsed_filenames)
+            self.assertEqual(self._path(directory, 'types.cats', 'entity.cats', 'transfer.cats', 'alias.cats'), affected_files)
+            self._assert_same_as_serial(session, directory, 'transfer.cats', 'alias.cats')
+
+    def test_update_of_unknown_file_has_no_effect(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, self.TRANSFER_FILES)
+            session = self._create_session(directory, 'alias.cats')
+            session.parsed_filenames.clear()
+
+            # Act:
+            affected_files = session.update_file(os.path.join(directory, 'transfer.cats'))
+
+            # Assert:
+            self.assertEqual(set(), affected_files)
+            self.assertEqual([], session.parsed_filenames)
+
+    def test_update_loads_new_imports_and_forgets_removed_imports(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {**self.TRANSFER_FILES, 'height.cats': ['using Height = uint64']})
+            session = self._create_session(directory, 'alias.cats')
+            write_files(directory, {'alias.cats': ['import "height.cats"', 'struct Alias', '\theight = Height']})
+
+            # Act:
+            affected_files = session.update_file(os.path.join(directory, 'alias.cats'))
+
+            # Assert:
+            self.assertEqual(self._path(directory, 'alias.cats', 'height.cats'), affected_files)
+            self.assertEqual(self._path(directory, 'alias.cats', 'height.cats'), set(session.file_entries))
+            self._assert_same_as_serial(session, directory, 'alias.cats')
+
+    def test_update_revalidates_dependents(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, self.TRANSFER_FILES)
+            session = self._create_session(directory, 'transfer.cats')
+            type_descriptors = session.type_descriptors()
+            write_files(directory, {'types.cats': ['using Amount = uint64']})
+
+            # Act + Assert: Mosaic is used by transfer.cats
+            with self.assertRaises(CatsParseException):
+                session.update_file(os.path.join(directory, 'types.cats'))
+
+            self.assertEqual(type_descriptors, session.type_descriptors())
+
+    def test_update_revalidates_files_using_types_without_importing_them(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange: c.cats uses T, which is only known because root.cats imports a.cats before c.cats
+            write_files(directory, {
+                'root.cats': ['import "a.cats"', 'import "c.cats"'],
+                'a.cats': ['using T = uint8'],
+                'c.cats': ['struct C', '\tt = T']
+            })
+            session = self._create_session(directory, 'root.cats')
+            type_descriptors = session.type_descriptors()
+            write_files(directory, {'a.cats': ['using U = uint8']})
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                session.update_file(os.path.join(directory, 'a.cats'))
+
+            with self.assertRaises(CatsParseException):
+                parse_serially(directory, 'root.cats')
+
+            self.assertEqual(type_descriptors, session.type_descriptors())
+
+    def test_update_after_failed_update_revalidates_failed_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, self.TRANSFER_FILES)
+            session = self._create_session(directory, 'transfer.cats')
+            write_files(directory, {'transfer.cats': ['import "entity.cats"', 'struct Transfer', '\theight = Height']})
+            with self.assertRaises(CatsParseException):
+                session.update_file(os.path.join(directory, 'transfer.cats'))
+
+            # Act: fix the error by defining the missing type in an unrelated change
+            write_files(directory, {
+                'types.cats': ['using Height = uint64', 'using Amount = uint64', 'struct Mosaic', '\tamount = Amount']
+            })
+            session.update_file(os.path.join(directory, 'types.cats'))
+
+            # Assert:
+            self._assert_same_as_serial(session, directory, 'transfer.cats')
+
+    def test_update_fails_if_changed_file_cannot_be_parsed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, self.TRANSFER_FILES)
+            session = self._create_session(directory, 'transfer.cats')
+            type_descriptors = session.type_descriptors()
+            write_files(directory, {'types.cats': ['alias Amount = uint64']})
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                session.update_file(os.path.join(directory, 'types.cats'))
+
+            self.assertEqual(type_descriptors, session.type_descriptors())
+
+    def test_update_detects_import_cycle(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, self.TRANSFER_FILES)
+            session = self._create_session(directory, 'transfer.cats')
+            write_files(directory, {'types.cats': ['import "transfer.cats"', 'using Amount = uint64']})
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                session.update_file(os.path.join(directory, 'types.cats'))
+
+    # endregion
@@ -0,0 +1,147 @@
+# pylint: disable=invalid-name
+import os
+import tempfile
+import unittest
+from test.FileParserTestUtils import write_files
+from catparser.SchemaSession import CatsParseException, SchemaSession
+from catparser.SchemaWatcher import SchemaWatcher, get_file_states
+
+
+class SchemaWatcherTest(unittest.TestCase):
+    # region utils
+
+    @staticmethod
+    def _create_watcher(directory, files):
+        write_files(directory, files)
+        session = SchemaSession(directory)
+        session.add_schema(os.path.join(directory, 'transfer.cats'))
+        return SchemaWatcher(session)
+
+    @staticmethod
+    def _change_files(directory, files):
+        # modification times can have coarse resolution, so they are moved explicitly
+        write_files(directory, files)
+        for filename in files:
+            file_stat = os.stat(os.path.join(directory, filename))
+            os.utime(os.path.join(directory, filename), ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000000000))
+
+    @staticmethod
+    def _path(directory, *filenames):
+        return [os.path.realpath(os.path.join(directory, filename)) for filename in filenames]
+
+    TRANSFER_FILES = {
+        'types.cats': ['using Amount = uint64', 'using Height = uint64'],
+        'mosaic.cats': ['import "types.cats"', 'struct Mosaic', '\tamount = Amount'],
+        'transfer.cats': [
+            'import "mosaic.cats"', 'struct Transfer', '\tmosaic = Mosaic', 'struct Lock', '\theight = Height'
+        ]
+    }
+
+    # endregion
+
+    # region get_file_states
+
+    def test_file_states_of_missing_files_are_none(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            write_files(directory, {'types.cats': ['using Amount = uint64']})
+            filenames = self._path(directory, 'types.cats', 'missing.cats')
+
+            # Act:
+            file_states = get_file_states(filenames)
+
+            # Assert:
+            self.assertIsNotNone(file_states[filenames[0]])
+            self.assertIsNone(file_states[filenames[1]])
+
+    # endregion
+
+    # region find_changed_files / update_files
+
+    def test_no_files_are_changed_initially(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            watcher = self._create_watcher(directory, self.TRANSFER_FILES)
+
+            # Act:
+            changed_filenames = watcher.find_changed_files()
+
+            # Assert:
+            self.assertEqual([], changed_filenames)
+
+    def test_can_update_changed_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            watcher = self._create_watcher(directory, self.TRANSFER_FILES)
+            self._change_files(directory, {'types.cats': ['using Amount = uint32', 'using Height = uint64']})
+
+            # Act:
+            changed_filenames = watcher.find_changed_files()
+            changed_type_names = watcher.update_files(changed_filenames)
+
+            # Assert:
+            self.assertEqual(self._path(directory, 'types.cats'), changed_filenames)
+            self.assertEqual({'Amount'}, changed_type_names)
+            self.assertEqual([], watcher.find_changed_files())
+
+    def test_update_reports_added_and_removed_types(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            watcher = self._create_watcher(directory, self.TRANSFER_FILES)
+            self._change_files(directory, {
+                'transfer.cats': ['import "mosaic.cats"', 'struct Transfer', '\tmosaic = Mosaic', 'using Fee = uint64']
+            })
+
+            # Act:
+            changed_type_names = watcher.update_files(watcher.find_changed_files())
+
+            # Assert:
+            self.assertEqual({'Lock', 'Fee'}, changed_type_names)
+
+    def test_failed_files_are_not_reported_again_until_they_change(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            watcher = self._create_watcher(directory, self.TRANSFER_FILES)
+            type_descriptors = watcher.session.type_descriptors()
+            self._change_files(directory, {'types.cats': ['using Amount = uint64']})
+
+            # Act:
+            with self.assertRaises(CatsParseException):
+                watcher.update_files(watcher.find_changed_files())
+
+            # Assert:
+            self.assertEqual([], watcher.find_changed_files())
+            self.assertEqual(type_descriptors, watcher.session.type_descriptors())
+
+    def test_newly_imported_files_are_watched(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            watcher = self._create_watcher(directory, {**self.TRANSFER_FILES, 'fee.cats': ['using Fee = uint64']})
+            self._change_files(directory, {
+                'mosaic.cats': ['import "types.cats"', 'import "fee.cats"', 'struct Mosaic', '\tamount = Amount']
+            })
+            watcher.update_files(watcher.find_changed_files())
+
+            # Act:
+            self._change_files(directory, {'fee.cats': ['using Fee = uint32']})
+            changed_filenames = watcher.find_changed_files()
+
+            # Assert:
+            self.assertEqual(self._path(directory, 'fee.cats'), changed_filenames)
+
+    # endregion
+
+    # region find_affected_types
+
+    def test_affected_types_link_directly_or_indirectly_to_changed_types(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            watcher = self._create_watcher(directory, self.TRANSFER_FILES)
+
+            # Act + Assert:
+            self.assertEqual(['Transfer'], watcher.find_affected_types({'Amount'}, ['Transfer', 'Lock']))
+            self.assertEqual(['Lock'], watcher.find_affected_types({'Height'}, ['Transfer', 'Lock']))
+            self.assertEqual(['Lock', 'Transfer'], watcher.find_affected_types({'Amount', 'Height'}, ['Lock', 'Transfer']))
+            self.assertEqual([], watcher.find_affected_types({'Amount'}, ['Lock']))
+
+    # endregion
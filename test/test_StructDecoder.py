@@ -0,0 +1,211 @@
+# pylint: disable=invalid-name
+import struct
+import unittest
+from test.CodecTestUtils import CODEC_SCHEMA_LINES, pack_namespace, pack_transfer, parse_type_descriptors
+from catcodec.CodecException import CodecException
+from catcodec.StructDecoder import RunStep, StructDecoderFactory
+
+
+def create_factory(lines=None):
+    return StructDecoderFactory(parse_type_descriptors(CODEC_SCHEMA_LINES + (lines or [])))
+
+
+class StructDecoderTest(unittest.TestCase):
+    # region fixed layouts
+
+    def test_can_decode_fixed_struct(self):
+        # Arrange:
+        decoder = create_factory().create('Mosaic')
+
+        # Act:
+        mosaic = decoder.decode(struct.pack('<QQ', 0x1234567890ABCDEF, 1000))
+
+        # Assert:
+        self.assertEqual({'mosaicId': 0x1234567890ABCDEF, 'amount': 1000}, mosaic)
+
+    def test_can_decode_signed_and_fixed_binary_fields(self):
+        # Arrange:
+        decoder = create_factory(['struct Foo', '\tdelta = int16', '\tkey = Key', '\thash = array(byte, 3)']).create('Foo')
+
+        # Act:
+        values = decoder.decode(struct.pack('<h6s3s', -2, b'abcdef', b'xyz'))
+
+        # Assert:
+        self.assertEqual({'delta': -2, 'key': b'abcdef', 'hash': b'xyz'}, values)
+
+    def test_can_decode_at_offset(self):
+        # Arrange:
+        decoder = create_factory().create('Mosaic')
+
+        # Act:
+        mosaic, end_offset = decoder.decode_from(b'\xFF' * 3 + struct.pack('<QQ', 7, 9) + b'\xFF', 3)
+
+        # Assert:
+        self.assertEqual({'mosaicId': 7, 'amount': 9}, mosaic)
+        self.assertEqual(19, end_offset)
+
+    def test_can_decode_fixed_arrays(self):
+        # Arrange:
+        decoder = create_factory(['struct Foo', '\tamounts = array(Amount, 2)', '\tmosaics = array(Mosaic, 1)']).create('Foo')
+
+        # Act:
+        values = decoder.decode(struct.pack('<QQQQ', 1, 2, 3, 4))
+
+        # Assert:
+        self.assertEqual({'amounts': [1, 2], 'mosaics': [{'mosaicId': 3, 'amount': 4}]}, values)
+
+    def test_can_decode_nested_struct(self):
+        # Arrange:
+        decoder = create_factory(['struct Foo', '\tmosaic = Mosaic', '\tcount = uint8']).create('Foo')
+
+        # Act:
+        values = decoder.decode(struct.pack('<QQB', 3, 4, 5))
+
+        # Assert:
+        self.assertEqual({'mosaic': {'mosaicId': 3, 'amount': 4}, 'count': 5}, values)
+
+    # endregion
+
+    # region variable layouts
+
+    def test_can_decode_transfer(self):
+        # Arrange:
+        decoder = create_factory().create('TransferTransaction')
+        buffer = pack_transfer(b'hello', [(1, 2), (3, 4)])
+
+        # Act:
+        transaction, end_offset = decoder.decode_from(buffer, 0)
+
+        # Assert:
+        self.assertEqual({
+            'size': len(buffer), 'signer': b'KEY123', 'type': 0x4154, 'fee': 100, 'messageSize': 5, 'mosaicsCount': 2,
+            'message': b'hello', 'mosaics': [{'mosaicId': 1, 'amount': 2}, {'mosaicId': 3, 'amount': 4}]
+        }, transaction)
+        self.assertEqual(len(buffer), end_offset)
+
+    def test_can_decode_transfer_without_message_and_mosaics(self):
+        # Arrange:
+        decoder = create_factory().create('TransferTransaction')
+
+        # Act:
+        transaction = decoder.decode(pack_transfer(b'', []))
+
+        # Assert:
+        self.assertEqual((b'', []), (transaction['message'], transaction['mosaics']))
+
+    def test_can_decode_variable_scalar_array(self):
+        # Arrange:
+        decoder = create_factory(['struct Foo', '\tcount = uint8', '\tdeltas = array(Delta, count)']).create('Foo')
+
+        # Act:
+        values = decoder.decode(memoryview(struct.pack('<Bhhh', 3, -1, 2, -3)))
+
+        # Assert:
+        self.assertEqual({'count': 3, 'deltas': [-1, 2, -3]}, values)
+
+    def test_can_decode_union_alternatives(self):
+        # Arrange:
+        decoder = create_factory().create('NamespaceTransaction')
+
+        # Act:
+        root = decoder.decode(pack_namespace(0, 1000, b'foo'))
+        child = decoder.decode(pack_namespace(1, 1234, b'bar'))
+
+        # Assert:
+        self.assertEqual((1000, b'foo'), (root['duration'], root['name']))
+        self.assertNotIn('parentId', root)
+        self.assertEqual((1234, b'bar'), (child['parentId'], child['name']))
+        self.assertNotIn('duration', child)
+
+    def test_union_bytes_are_skipped_when_no_alternative_is_selected(self):
+        # Arrange:
+        decoder = create_factory().create('NamespaceTransaction')
+
+        # Act:
+        transaction = decoder.decode(pack_namespace(2, 1234, b'foo'))
+
+        # Assert:
+        self.assertNotIn('duration', transaction)
+        self.assertNotIn('parentId', transaction)
+        self.assertEqual(b'foo', transaction['name'])
+
+    def test_can_decode_standalone_conditional_field(self):
+        # Arrange:
+        decoder = create_factory().create('Renewal')
+
+        # Act:
+        present = decoder.decode(struct.pack('<BQB', 0, 1000, 7))
+        absent = decoder.decode(struct.pack('<BB', 1, 7))
+
+        # Assert:
+        self.assertEqual({'namespaceType': 0, 'duration': 1000, 'count': 7}, present)
+        self.assertEqual({'namespaceType': 1, 'count': 7}, absent)
+
+    def test_can_decode_conditional_fields_with_same_condition_value(self):
+        # Arrange:
+        decoder = create_factory([
+            'struct Foo',
+            '\tnamespaceType = NamespaceType',
+            '\tfirst = uint32 if namespaceType equals root',
+            '\tsecond = uint32 if namespaceType equals root',
+            '\tcount = uint8'
+        ]).create('Foo')
+
+        # Act:
+        present = decoder.decode(struct.pack('<BIIB', 0, 11, 22, 7))
+        absent = decoder.decode(struct.pack('<BB', 1, 7))
+
+        # Assert:
+        self.assertEqual({'namespaceType': 0, 'first': 11, 'second': 22, 'count': 7}, present)
+        self.assertEqual({'namespaceType': 1, 'count': 7}, absent)
+
+    # endregion
+
+    # region precompilation
+
+    def test_consecutive_scalar_fields_are_unpacked_together(self):
+        # Arrange:
+        decoder = create_factory().create('TransferTransaction')
+
+        # Act:
+        first_step = decoder.steps[0]
+
+        # Assert:
+        self.assertEqual(3, len(decoder.steps))
+        self.assertIsInstance(first_step, RunStep)
+        self.assertEqual(('size', 'type', 'signer', 'fee', 'messageSize', 'mosaicsCount'), first_step.names)
+        self.assertEqual('<IH6sQHB', first_step.packer.format)
+
+    def test_decoders_are_created_once_per_type(self):
+        # Arrange:
+        factory = create_factory()
+
+        # Act:
+        decoder = factory.create('TransferTransaction')
+
+        # Assert:
+        self.assertIs(decoder, factory.create('TransferTransaction'))
+        self.assertIs(factory.create('Mosaic'), decoder.steps[2].decoder)
+
+    # endregion
+
+    # region errors
+
+    def test_cannot_decode_truncated_fixed_fields(self):
+        # Arrange:
+        decoder = create_factory().create('TransferTransaction')
+
+        # Act + Assert:
+        with self.assertRaises(CodecException):
+            decoder.decode(pack_transfer(b'hello', [])[:10])
+
+    def test_cannot_decode_truncated_variable_fields(self):
+        # Arrange:
+        decoder = create_factory().create('TransferTransaction')
+
+        # Act + Assert:
+        for buffer in [pack_transfer(b'hello', [])[:-1], pack_transfer(b'', [(1, 2)])[:-1]]:
+            with self.assertRaises(CodecException):
+                decoder.decode(buffer)
+
+    # endregion
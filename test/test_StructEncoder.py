@@ -0,0 +1,246 @@
+# pylint: disable=invalid-name
+import struct
+import unittest
+from test.CodecTestUtils import CODEC_SCHEMA_LINES, pack_namespace, pack_transfer, parse_type_descriptors
+from catcodec.CodecException import CodecException
+from catcodec.StructDecoder import StructDecoderFactory
+from catcodec.StructEncoder import StructEncoderFactory
+
+TRANSFER_VALUES = {
+    'type': 0x4154, 'signer': b'KEY123', 'fee': 100,
+    'message': b'hello', 'mosaics': [{'mosaicId': 1, 'amount': 2}, {'mosaicId': 3, 'amount': 4}]
+}
+
+
+def create_factories(lines=None):
+    type_descriptors = parse_type_descriptors(CODEC_SCHEMA_LINES + (lines or []))
+    return (StructEncoderFactory(type_descriptors), StructDecoderFactory(type_descriptors))
+
+
+def create_encoder(type_name, lines=None):
+    return create_factories(lines)[0].create(type_name)
+
+
+class StructEncoderTest(unittest.TestCase):
+    # region fixed layouts
+
+    def test_can_encode_fixed_struct(self):
+        # Arrange:
+        encoder = create_encoder('Mosaic')
+
+        # Act:
+        buffer = encoder.encode({'mosaicId': 0x1234567890ABCDEF, 'amount': 1000})
+
+        # Assert:
+        self.assertEqual(16, encoder.size({}))
+        self.assertEqual(struct.pack('<QQ', 0x1234567890ABCDEF, 1000), buffer)
+
+    def test_can_encode_signed_and_fixed_binary_fields(self):
+        # Arrange:
+        encoder = create_encoder('Foo', ['struct Foo', '\tdelta = int16', '\tkey = Key', '\thash = array(byte, 3)'])
+
+        # Act:
+        buffer = encoder.encode({'delta': -2, 'key': b'abcdef', 'hash': b'xyz'})
+
+        # Assert:
+        self.assertEqual(struct.pack('<h6s3s', -2, b'abcdef', b'xyz'), buffer)
+
+    def test_can_encode_fixed_arrays_and_nested_struct(self):
+        # Arrange:
+        encoder = create_encoder('Foo', ['struct Foo', '\tamounts = array(Amount, 2)', '\tmosaic = Mosaic'])
+
+        # Act:
+        buffer = encoder.encode({'amounts': [1, 2], 'mosaic': {'mosaicId': 3, 'amount': 4}})
+
+        # Assert:
+        self.assertEqual(struct.pack('<QQQQ', 1, 2, 3, 4), buffer)
+
+    def test_can_encode_into_existing_buffer_at_offset(self):
+        # Arrange:
+        encoder = create_encoder('Mosaic')
+        buffer = bytearray(b'\xFF' * 20)
+
+        # Act:
+        end_offset = encoder.encode_into(buffer, 3, {'mosaicId': 7, 'amount': 9})
+
+        # Assert:
+        self.assertEqual(19, end_offset)
+        self.assertEqual(b'\xFF' * 3 + struct.pack('<QQ', 7, 9) + b'\xFF', buffer)
+
+    # endregion
+
+    # region variable layouts
+
+    def test_can_encode_transfer_with_derived_size_and_count_fields(self):
+        # Arrange:
+        encoder = create_encoder('TransferTransaction')
+
+        # Act:
+        buffer = encoder.encode(TRANSFER_VALUES)
+
+        # Assert:
+        expected_buffer = pack_transfer(b'hello', [(1, 2), (3, 4)])
+        self.assertEqual(len(expected_buffer), encoder.size(TRANSFER_VALUES))
+        self.assertIsInstance(buffer, bytearray)
+        self.assertEqual(expected_buffer, buffer)
+        self.assertNotIn('size', TRANSFER_VALUES)
+
+    def test_derived_fields_override_specified_values(self):
+        # Arrange:
+        encoder = create_encoder('TransferTransaction')
+
+        # Act:
+        buffer = encoder.encode({**TRANSFER_VALUES, 'size': 1, 'messageSize': 99, 'mosaicsCount': 0})
+
+        # Assert:
+        self.assertEqual(pack_transfer(b'hello', [(1, 2), (3, 4)]), buffer)
+
+    def test_can_encode_transfer_without_message_and_mosaics(self):
+        # Arrange:
+        encoder = create_encoder('TransferTransaction')
+
+        # Act:
+        buffer = encoder.encode({**TRANSFER_VALUES, 'message': b'', 'mosaics': []})
+
+        # Assert:
+        self.assertEqual(pack_transfer(b'', []), buffer)
+
+    def test_can_encode_union_alternatives(self):
+        # Arrange:
+        encoder = create_encoder('NamespaceTransaction')
+        values = {'type': 0x414E, 'signer': b'KEY123', 'fee': 100, 'name': b'foo'}
+
+        # Act:
+        root_buffer = encoder.encode({**values, 'namespaceType': 0, 'duration': 1000})
+        child_buffer = encoder.encode({**values, 'namespaceType': 1, 'parentId': 1234})
+
+        # Assert:
+        self.assertEqual(pack_namespace(0, 1000, b'foo'), root_buffer)
+        self.assertEqual(pack_namespace(1, 1234, b'foo'), child_buffer)
+
+    def test_can_encode_standalone_conditional_field(self):
+        # Arrange:
+        encoder = create_encoder('Renewal')
+
+        # Act:
+        present_buffer = encoder.encode({'namespaceType': 0, 'duration': 1000, 'count': 7})
+        absent_buffer = encoder.encode({'namespaceType': 1, 'count': 7})
+
+        # Assert:
+        self.assertEqual(struct.pack('<BQB', 0, 1000, 7), present_buffer)
+        self.assertEqual(struct.pack('<BB', 1, 7), absent_buffer)
+
+    def test_can_encode_variable_scalar_array(self):
+        # Arrange:
+        encoder = create_encoder('Foo', ['struct Foo', '\tcount = uint8', '\tdeltas = array(Delta, count)'])
+
+        # Act:
+        buffer = encoder.encode({'deltas': [-1, 2, -3]})
+
+        # Assert:
+        self.assertEqual(struct.pack('<Bhhh', 3, -1, 2, -3), buffer)
+
+    def test_can_encode_array_of_variable_size_structs(self):
+        # Arrange:
+        encoder = create_encoder('Journal')
+        values = {'notes': [{'text': b'ab'}, {'text': b'cde'}], 'amount': 1000}
+
+        # Act:
+        buffer = encoder.encode(values)
+
+        # Assert:
+        self.assertEqual(16, encoder.size(values))
+        self.assertEqual(struct.pack('<BB2sB3sQ', 2, 2, b'ab', 3, b'cde', 1000), buffer)
+
+    # endregion
+
+    # region round trips
+
+    def test_decoded_transactions_can_be_reencoded(self):
+        # Arrange:
+        encoder_factory, decoder_factory = create_factories()
+        buffers = [
+            ('TransferTransaction', pack_transfer(b'hello', [(1, 2), (3, 4)])),
+            ('TransferTransaction', pack_transfer(b'', [])),
+            ('NamespaceTransaction', pack_namespace(0, 1000, b'foo')),
+            ('NamespaceTransaction', pack_namespace(1, 1234, b'bar'))
+        ]
+
+        for type_name, buffer in buffers:
+            # Act:
+            values = decoder_factory.create(type_name).decode(buffer)
+            encoded_buffer = encoder_factory.create(type_name).encode(values)
+
+            # Assert:
+            self.assertEqual(buffer, encoded_buffer)
+
+    def test_encoded_transactions_can_be_decoded(self):
+        # Arrange:
+        encoder_factory, decoder_factory = create_factories()
+
+        # Act:
+        values = decoder_factory.create('TransferTransaction').decode(encoder_factory.create('TransferTransaction').encode(TRANSFER_VALUES))
+
+        # Assert:
+        self.assertEqual({**TRANSFER_VALUES, 'size': 60, 'messageSize': 5, 'mosaicsCount': 2}, values)
+
+    # endregion
+
+    # region precompilation
+
+    def test_encoders_are_created_once_per_type(self):
+        # Arrange:
+        factory = create_factories()[0]
+
+        # Act:
+        encoder = factory.create('TransferTransaction')
+
+        # Assert:
+        self.assertIs(encoder, factory.create('TransferTransaction'))
+        self.assertIs(factory.create('Mosaic'), encoder.steps[2].encoder)
+        self.assertEqual((('messageSize', 'message'), ('mosaicsCount', 'mosaics')), encoder.count_fields)
+        self.assertEqual('size', encoder.size_field_name)
+
+    # endregion
+
+    # region errors
+
+    def test_cannot_encode_with_missing_fields(self):
+        # Arrange:
+        encoder = create_encoder('TransferTransaction')
+
+        # Act + Assert:
+        for name in ['fee', 'message', 'mosaics']:
+            values = dict(TRANSFER_VALUES)
+            del values[name]
+            with self.assertRaises(CodecException):
+                encoder.encode(values)
+
+    def test_cannot_encode_fixed_array_with_wrong_number_of_elements(self):
+        # Arrange:
+        encoder = create_encoder('Foo', ['struct Foo', '\tamounts = array(Amount, 2)'])
+
+        # Act + Assert:
+        for amounts in [[1], [1, 2, 3]]:
+            with self.assertRaises(CodecException):
+                encoder.encode({'amounts': amounts})
+
+    def test_cannot_encode_fixed_binary_field_with_wrong_length(self):
+        # Arrange:
+        encoder = create_encoder('TransferTransaction')
+
+        # Act + Assert:
+        for signer in [b'short', b'KEY1234']:
+            with self.assertRaises(CodecException):
+                encoder.encode({**TRANSFER_VALUES, 'signer': signer})
+
+    def test_cannot_encode_into_too_small_buffer(self):
+        # Arrange:
+        encoder = create_encoder('TransferTransaction')
+
+        # Act + Assert:
+        for size in [10, 25, 59]:
+            with self.assertRaises(CodecException):
+                encoder.encode_into(bytearray(size), 0, TRANSFER_VALUES)
+
+    # endregion
@@ -41,6 +41,16 @@ class StructParserTest(unittest.TestCase):
         # Assert
         self.assertEqual(4, len(parser.factories()))
 
+    def test_parsers_share_factories(self):
+        # Act:
+        parser1 = StructParserFactory().create()
+        parser2 = StructParserFactory().create()
+
+        # Assert: each struct has its own parser
+        self.assertIsNot(parser1, parser2)
+        self.assertIs(parser1.factories(), parser2.factories())
+        self.assertIs(parser1.dispatcher(), parser2.dispatcher())
+
     def test_can_parse_type_declaration(self):
         # Act + Assert:
         self._assert_parse(
@@ -191,6 +201,48 @@ class StructParserTest(unittest.TestCase):
             {'name': 'foo'}
         ]}), result)
 
+    def test_can_lookup_field_by_name(self):
+        # Arrange:
+        parser = StructParserFactory().create()
+
+        # Act:
+        parser.process_line('struct Car')
+        parser.append({'disposition': 'inline', 'type': 'Vehicle'})
+        parser.append({'name': 'foo', 'type': 'Foo'})
+        parser.append({'name': 'bar', 'type': 'Bar'})
+
+        # Assert:
+        self.assertEqual({'name': 'foo', 'type': 'Foo'}, parser.field('foo'))
+        self.assertEqual({'name': 'bar', 'type': 'Bar'}, parser.field('bar'))
+
+    def test_lookup_field_by_name_returns_first_field_with_name(self):
+        # Arrange:
+        parser = StructParserFactory().create()
+
+        # Act:
+        parser.process_line('struct Car')
+        parser.append({'name': 'foo', 'type': 'Foo'})
+        parser.append({'name': 'foo', 'disposition': 'const', 'value': 7})
+
+        # Assert:
+        self.assertEqual({'name': 'foo', 'type': 'Foo'}, parser.field('foo'))
+
+    def test_cannot_lookup_unknown_field_by_name(self):
+        # Arrange:
+        parser = StructParserFactory().create()
+
+        # Act:
+        parser.process_line('struct Car')
+        parser.append({'name': 'foo', 'type': 'Foo'})
+
+        # Assert:
+        with self.assertRaises(CatsParseException):
+            parser.field('bar')
+
+
+class StructParserLexerTest(StructParserTest):
+    use_lexer = True
+
 # endregion
 
 # region StructConstParserTest
@@ -258,6 +310,10 @@ class StructConstParserTest(unittest.TestCase):
             VALID_USER_TYPE_NAMES + VALID_PRIMITIVE_NAMES,
             INVALID_USER_TYPE_NAMES + ['binary_fixed(32)'])
 
+
+class StructConstParserLexerTest(StructConstParserTest):
+    use_lexer = True
+
 # endregion
 
 # region StructInlineParserTest
@@ -284,6 +340,10 @@ class StructInlineParserTest(unittest.TestCase):
             'inline Vehicle_',
             {'type': 'Vehicle_', 'disposition': 'inline'})
 
+
+class StructInlineParserLexerTest(StructInlineParserTest):
+    use_lexer = True
+
 # endregion
 
 # region StructArrayMemberParser
@@ -337,6 +397,10 @@ class StructArrayMemberParserTest(unittest.TestCase):
             VALID_PROPERTY_NAMES,
             INVALID_PROPERTY_NAMES)
 
+
+class StructArrayMemberParserLexerTest(StructArrayMemberParserTest):
+    use_lexer = True
+
 # endregion
 
 # region StructScalarMemberParser
@@ -355,6 +419,13 @@ class StructScalarParserFactoryTest(unittest.TestCase):
             ' foo = bar', 'foo = bar ', 'foo = ', '= bar', 'foo = array(bar, baz)', 'foo = bar if abc equals', 'foo = bar abc equals def'
         ])
 
+    def test_create_returns_shared_parser(self):
+        # Arrange:
+        factory = StructScalarMemberParserFactory()
+
+        # Act + Assert:
+        self.assertIs(factory.create(), factory.create())
+
 
 class StructScalarParserTest(unittest.TestCase):
     def _assert_parse(self, line, expected_result):
@@ -387,4 +458,8 @@ class StructScalarParserTest(unittest.TestCase):
             VALID_PROPERTY_NAMES,
             INVALID_PROPERTY_NAMES)
 
+
+class StructScalarParserLexerTest(StructScalarParserTest):
+    use_lexer = True
+
 # endregion
@@ -0,0 +1,197 @@
+# pylint: disable=invalid-name, protected-access
+import struct
+import unittest
+from test.CodecTestUtils import CODEC_SCHEMA_LINES, pack_namespace, pack_transfer, parse_type_descriptors
+from catcodec.CodecException import CodecException
+from catcodec.StructView import StructView, StructViewFactory
+
+
+def create_factory(lines=None):
+    return StructViewFactory(parse_type_descriptors(CODEC_SCHEMA_LINES + (lines or [])))
+
+
+class StructViewTest(unittest.TestCase):
+    # region fixed layouts
+
+    def test_can_view_fixed_struct(self):
+        # Arrange:
+        view_class = create_factory().create('Mosaic')
+
+        # Act:
+        view = view_class(struct.pack('<QQ', 0x1234567890ABCDEF, 1000))
+
+        # Assert:
+        self.assertIsInstance(view, StructView)
+        self.assertEqual(('mosaicId', 'amount'), view._fields)
+        self.assertEqual((0x1234567890ABCDEF, 1000), (view.mosaicId, view.amount))
+        self.assertEqual(16, view._end_offset())
+
+    def test_can_view_at_offset(self):
+        # Arrange:
+        view_class = create_factory().create('Mosaic')
+
+        # Act:
+        view = view_class(b'\xFF' * 3 + struct.pack('<QQ', 7, 9), 3)
+
+        # Assert:
+        self.assertEqual((7, 9), (view.mosaicId, view.amount))
+        self.assertEqual(19, view._end_offset())
+
+    def test_binary_fields_are_views_of_buffer(self):
+        # Arrange:
+        view_class = create_factory(['struct Foo', '\tdelta = int16', '\tkey = Key']).create('Foo')
+        buffer = bytearray(struct.pack('<h6s', -2, b'abcdef'))
+        view = view_class(buffer)
+
+        # Act:
+        key = view.key
+        buffer[2] = ord('z')
+
+        # Assert:
+        self.assertEqual(-2, view.delta)
+        self.assertIsInstance(key, memoryview)
+        self.assertEqual(b'zbcdef', key.tobytes())
+
+    def test_can_view_nested_struct(self):
+        # Arrange:
+        view_class = create_factory(['struct Foo', '\tcount = uint8', '\tmosaic = Mosaic']).create('Foo')
+
+        # Act:
+        view = view_class(struct.pack('<BQQ', 5, 3, 4))
+
+        # Assert:
+        self.assertEqual(5, view.count)
+        self.assertEqual((3, 4), (view.mosaic.mosaicId, view.mosaic.amount))
+        self.assertEqual(17, view.mosaic._end_offset())
+
+    # endregion
+
+    # region variable layouts
+
+    def test_can_view_transfer(self):
+        # Arrange:
+        view_class = create_factory().create('TransferTransaction')
+        buffer = pack_transfer(b'hello', [(1, 2), (3, 4)])
+
+        # Act:
+        view = view_class(buffer)
+
+        # Assert:
+        self.assertEqual((len(buffer), 0x4154, b'KEY123', 100), (view.size, view.type, view.signer.tobytes(), view.fee))
+        self.assertEqual((5, 2), (view.messageSize, view.mosaicsCount))
+        self.assertEqual(b'hello', view.message.tobytes())
+        self.assertEqual(struct.pack('<QQQQ', 1, 2, 3, 4), view.mosaics.tobytes())
+        self.assertEqual(len(buffer), view._end_offset())
+
+    def test_can_view_fields_following_variable_fields(self):
+        # Arrange:
+        view_class = create_factory(['struct Foo', '\tcount = uint8', '\tdeltas = array(Delta, count)', '\tamount = Amount']).create('Foo')
+
+        # Act:
+        view = view_class(struct.pack('<BhhQ', 2, -1, 2, 1000))
+
+        # Assert:
+        self.assertEqual(struct.pack('<hh', -1, 2), view.deltas.tobytes())
+        self.assertEqual(1000, view.amount)
+        self.assertEqual(13, view._end_offset())
+
+    def test_tail_is_measured_once(self):
+        # Arrange:
+        view_class = create_factory(['struct Foo', '\tcount = uint8', '\tdeltas = array(Delta, count)', '\tamount = Amount']).create('Foo')
+        view = view_class(struct.pack('<BhhQ', 2, -1, 2, 1000))
+
+        # Act:
+        offsets = view._measure()
+
+        # Assert:
+        self.assertIs(offsets, view._measure())
+        self.assertEqual({'deltas': 1, 'amount': 5, None: 13}, offsets)
+
+    def test_can_view_union_alternatives(self):
+        # Arrange:
+        view_class = create_factory().create('NamespaceTransaction')
+
+        # Act:
+        root = view_class(pack_namespace(0, 1000, b'foo'))
+        child = view_class(pack_namespace(1, 1234, b'bar'))
+
+        # Assert:
+        self.assertEqual((1000, None, b'foo'), (root.duration, root.parentId, root.name.tobytes()))
+        self.assertEqual((None, 1234, b'bar'), (child.duration, child.parentId, child.name.tobytes()))
+
+    def test_can_view_standalone_conditional_field(self):
+        # Arrange:
+        view_class = create_factory().create('Renewal')
+
+        # Act:
+        present = view_class(struct.pack('<BQB', 0, 1000, 7))
+        absent = view_class(struct.pack('<BB', 1, 7))
+
+        # Assert:
+        self.assertEqual((1000, 7, 10), (present.duration, present.count, present._end_offset()))
+        self.assertEqual((None, 7, 2), (absent.duration, absent.count, absent._end_offset()))
+
+    def test_can_view_array_of_variable_size_structs(self):
+        # Arrange:
+        view_class = create_factory().create('Journal')
+
+        # Act:
+        view = view_class(struct.pack('<BB2sB3sQ', 2, 2, b'ab', 3, b'cde', 1000))
+
+        # Assert:
+        self.assertEqual(b'\x02ab\x03cde', view.notes.tobytes())
+        self.assertEqual(1000, view.amount)
+
+    # endregion
+
+    # region view classes
+
+    def test_views_have_no_instance_dict(self):
+        # Arrange:
+        view_class = create_factory().create('TransferTransaction')
+
+        # Act:
+        view = view_class(pack_transfer(b'', []))
+
+        # Assert:
+        self.assertEqual('TransferTransactionView', view_class.__name__)
+        self.assertFalse(hasattr(view, '__dict__'))
+
+    def test_view_classes_are_created_once_per_type(self):
+        # Arrange:
+        factory = create_factory()
+
+        # Act:
+        view_class = factory.create('TransferTransaction')
+
+        # Assert:
+        self.assertIs(view_class, factory.create('TransferTransaction'))
+
+    # endregion
+
+    # region errors
+
+    def test_cannot_view_fields_past_end_of_buffer(self):
+        # Arrange:
+        view_class = create_factory().create('TransferTransaction')
+        view = view_class(pack_transfer(b'hello', [(1, 2)])[:-1])
+
+        # Act + Assert:
+        self.assertEqual(b'hello', view.message.tobytes())
+        with self.assertRaises(CodecException):
+            _ = view.mosaics
+
+        with self.assertRaises(CodecException):
+            _ = view_class(b'\x00' * 4).fee
+
+    def test_cannot_view_tail_fields_of_truncated_buffer_repeatedly(self):
+        # Arrange:
+        buffer = struct.pack('<BB2sB3sQ', 2, 2, b'ab', 3, b'cde', 1000)[:4]
+        view = create_factory().create('Journal')(buffer)
+
+        # Act + Assert: failed measurements are not cached
+        for _ in range(2):
+            with self.assertRaises(CodecException):
+                _ = view.amount
+
+    # endregion
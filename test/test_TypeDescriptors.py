@@ -0,0 +1,139 @@
+# pylint: disable=invalid-name
+import pickle
+import unittest
+from catparser.CatsParser import CatsParser
+from catparser.TypeDescriptors import \
+    AliasDescriptor, EnumDescriptor, EnumValueDescriptor, FieldDescriptor, StructDescriptor, create_type_descriptor, descriptor_to_dict
+
+
+class SlottedDescriptorTest(unittest.TestCase):
+    def test_can_create_descriptor_from_multiple_mappings(self):
+        # Act:
+        descriptor = FieldDescriptor({'name': 'foo', 'type': 'byte', 'size': 4}, {'size': 2, 'comments': 'bar'})
+
+        # Assert: later mappings take precedence
+        self.assertEqual({'name': 'foo', 'type': 'byte', 'size': 2, 'comments': 'bar'}, descriptor)
+        self.assertEqual(4, len(descriptor))
+
+    def test_cannot_create_descriptor_with_unsupported_key(self):
+        # Act + Assert:
+        with self.assertRaises(KeyError):
+            EnumValueDescriptor({'name': 'foo', 'type': 'byte'})
+
+    def test_can_read_set_keys(self):
+        # Arrange:
+        descriptor = FieldDescriptor({'name': 'foo', 'type': 'byte', 'value': None})
+
+        # Act + Assert:
+        self.assertEqual('foo', descriptor['name'])
+        self.assertEqual(None, descriptor['value'])
+        self.assertEqual('foo', descriptor.get('name'))
+        self.assertEqual(None, descriptor.get('value', 7))
+        self.assertTrue('name' in descriptor)
+        self.assertTrue('value' in descriptor)
+
+    def test_cannot_read_unset_or_unsupported_keys(self):
+        # Arrange:
+        descriptor = FieldDescriptor({'name': 'foo', 'type': 'byte'})
+
+        # Act + Assert:
+        for key in ['size', 'values', 'bar']:
+            with self.assertRaises(KeyError):
+                descriptor[key]  # pylint: disable=pointless-statement
+
+            self.assertEqual(None, descriptor.get(key))
+            self.assertEqual(7, descriptor.get(key, 7))
+            self.assertFalse(key in descriptor)
+
+    def test_iteration_yields_only_set_keys(self):
+        # Arrange:
+        descriptor = EnumDescriptor({'type': 'enum', 'size': 1, 'values': []})
+
+        # Act + Assert: mapping methods are not hidden by keys with the same name
+        self.assertEqual(['type', 'size', 'values'], list(descriptor))
+        self.assertEqual(['enum', 1, []], list(descriptor.values()))
+        self.assertEqual({'type': 'enum', 'size': 1, 'values': []}, dict(descriptor))
+
+    def test_descriptors_are_compact(self):
+        # Arrange:
+        descriptor = AliasDescriptor({'type': 'byte', 'size': 4, 'signedness': 'unsigned', 'comments': ''})
+
+        # Act + Assert:
+        self.assertFalse(hasattr(descriptor, '__dict__'))
+        with self.assertRaises(AttributeError):
+            setattr(descriptor, 'foo', 1)
+
+    def test_can_pickle_descriptor(self):
+        # Arrange:
+        descriptor = StructDescriptor({'type': 'struct', 'layout': [FieldDescriptor({'name': 'foo', 'type': 'byte', 'size': 4})]})
+
+        # Act:
+        unpickled_descriptor = pickle.loads(pickle.dumps(descriptor))
+
+        # Assert:
+        self.assertEqual(StructDescriptor, type(unpickled_descriptor))
+        self.assertEqual(FieldDescriptor, type(unpickled_descriptor['layout'][0]))
+        self.assertEqual(descriptor, unpickled_descriptor)
+
+    def test_descriptors_unpickled_separately_share_names(self):
+        # Arrange:
+        pickled_descriptor = pickle.dumps(FieldDescriptor({'name': ''.join(['fo', 'o']), 'type': 'Bar', 'comments': ''.join(['a', 'b'])}))
+
+        # Act:
+        descriptor1 = pickle.loads(pickled_descriptor)
+        descriptor2 = pickle.loads(pickled_descriptor)
+
+        # Assert: comments are not names, so they are not shared
+        self.assertIs(descriptor1['name'], descriptor2['name'])
+        self.assertIs(descriptor1['type'], descriptor2['type'])
+        self.assertIsNot(descriptor1['comments'], descriptor2['comments'])
+        self.assertEqual(descriptor1, descriptor2)
+
+
+class CreateTypeDescriptorTest(unittest.TestCase):
+    def test_can_create_type_descriptors(self):
+        # Act:
+        struct_descriptor = create_type_descriptor({'type': 'struct', 'layout': []}, {'comments': ''})
+        enum_descriptor = create_type_descriptor({'type': 'enum', 'size': 1, 'signedness': 'unsigned', 'values': []}, {'comments': ''})
+        alias_descriptor = create_type_descriptor({'type': 'byte', 'size': 1, 'signedness': 'unsigned'}, {'comments': ''})
+
+        # Assert:
+        self.assertEqual(StructDescriptor, type(struct_descriptor))
+        self.assertEqual(EnumDescriptor, type(enum_descriptor))
+        self.assertEqual(AliasDescriptor, type(alias_descriptor))
+
+
+class DescriptorToDictTest(unittest.TestCase):
+    def test_can_convert_nested_descriptors(self):
+        # Arrange:
+        parser = CatsParser(None)
+        for line in ['struct Foo', '\tbar = uint16']:
+            parser.process_line(line)
+
+        # Act:
+        type_descriptor = descriptor_to_dict(parser.type_descriptors()['Foo'])
+
+        # Assert:
+        self.assertEqual(dict, type(type_descriptor))
+        self.assertEqual(dict, type(type_descriptor['layout'][0]))
+        self.assertEqual({
+            'type': 'struct',
+            'layout': [{'name': 'bar', 'type': 'byte', 'size': 2, 'signedness': 'unsigned', 'comments': ''}],
+            'comments': ''
+        }, type_descriptor)
+
+    def test_parsed_descriptors_are_slotted(self):
+        # Arrange:
+        parser = CatsParser(None)
+        for line in ['using Alias = uint8', 'enum Enum : uint8', '\tbar = 1', 'struct Foo', '\tbar = uint16']:
+            parser.process_line(line)
+
+        # Act:
+        type_descriptors = parser.type_descriptors()
+
+        # Assert:
+        self.assertEqual(AliasDescriptor, type(type_descriptors['Alias']))
+        self.assertEqual(EnumDescriptor, type(type_descriptors['Enum']))
+        self.assertEqual(EnumValueDescriptor, type(type_descriptors['Enum']['values'][0]))
+        self.assertEqual(StructDescriptor, type(type_descriptors['Foo']))
+        self.assertEqual(FieldDescriptor, type(type_descriptors['Foo']['layout'][0]))
@@ -6,7 +6,7 @@ from test.constants import \
     VALID_PROPERTY_NAMES, INVALID_PROPERTY_NAMES, \
     INT_TYPE_TUPLES, UINT_TYPE_TUPLES, BUILTIN_TYPE_TUPLES
 from catparser.parserutils import \
-    require_user_type_name, require_property_name, \
+    intern_identifier, require_user_type_name, require_property_name, \
     is_primitive, require_primitive, \
     is_dec_or_hex, parse_dec_or_hex, \
     is_builtin, parse_builtin
@@ -15,6 +15,31 @@ from catparser.CatsParseException import CatsParseException
 # region naming conventions
 
 
+class InternIdentifierTest(unittest.TestCase):
+    def test_equal_names_share_single_object(self):
+        # Arrange: build names at runtime, so that they are distinct objects
+        name1 = ''.join(['Fo', 'o'])
+        name2 = ''.join(['F', 'oo'])
+
+        # Act:
+        result1 = intern_identifier(name1)
+        result2 = intern_identifier(name2)
+
+        # Assert:
+        self.assertIsNot(name1, name2)
+        self.assertEqual('Foo', result1)
+        self.assertIs(result1, result2)
+
+    def test_require_returns_shared_name(self):
+        # Arrange:
+        type_name = ''.join(['Fo', 'o'])
+        property_name = ''.join(['fo', 'o'])
+
+        # Act + Assert:
+        self.assertIs(intern_identifier('Foo'), require_user_type_name(type_name))
+        self.assertIs(intern_identifier('foo'), require_property_name(property_name))
+
+
 class RequireUserTypeNameTest(unittest.TestCase):
     def test_nothrow_for_positives(self):
         for string in VALID_USER_TYPE_NAMES:
@@ -89,12 +114,12 @@ class RequirePrimitiveTest(unittest.TestCase):
 # region dec or hex
 
 
-INVALID_NUMERIC_STRINGS = ['AFE', '0x8Y8', 'p', '&']
+INVALID_NUMERIC_STRINGS = ['AFE', '0x8Y8', 'p', '&', '-1', '+1', '1_0', '0X1']
 
 
 class IsDecOrHexTest(unittest.TestCase):
     def test_true_for_positives(self):
-        for string in ['10', '123', '0x10', '0x123', '0xAFE']:
+        for string in ['10', '123', '0x10', '0x123', '0xAFE', '0xafe']:
             # Act:
             result = is_dec_or_hex(string)
 